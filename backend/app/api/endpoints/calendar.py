@@ -44,7 +44,7 @@ def calendar_callback(
 
 
 @router.post("/sync")
-def sync_calendar(
+async def sync_calendar(
     date_from: Optional[datetime] = Query(default=None, description="Start date for sync"),
     date_to: Optional[datetime] = Query(default=None, description="End date for sync"),
     db: Session = Depends(get_db),
@@ -64,7 +64,7 @@ def sync_calendar(
     if not date_to:
         date_to = date_from + timedelta(days=7)
 
-    result = service.sync_google_calendar_events(date_from, date_to)
+    result = await service.sync_google_calendar_events(date_from, date_to)
     return result
 
 
@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse, JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 import io
-import json
+import itertools
+
+import orjson
 
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
 from app.models.user import User
-from app.services.export_import_service import ExportImportService
+from app.services.export_import_service import (
+    ExportImportService,
+    JSON_DECODE_ERRORS,
+    STREAMING_JSON_IMPORT,
+)
 from app.schemas.preferences import (
     DataExportRequest,
     DataExportResponse,
@@ -53,10 +60,9 @@ def export_data_json(
     try:
         data = service.export_all_data_json(date_from, date_to)
 
-        # Return as downloadable file
-        json_str = json.dumps(data, indent=2)
-        return StreamingResponse(
-            io.BytesIO(json_str.encode()),
+        # Return as downloadable file; orjson encodes datetimes and enums natively
+        return Response(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2),
             media_type="application/json",
             headers={
                 "Content-Disposition": f"attachment; filename=wellbeing_data_{datetime.utcnow().strftime('%Y%m%d')}.json"
@@ -79,22 +85,23 @@ def export_data_csv(
     service = ExportImportService(db, current_user.id)
 
     try:
-        csv_data = service.export_to_csv(pillar, entity_type)
-
-        if not csv_data:
-            raise HTTPException(status_code=404, detail="No data found for export")
-
-        return StreamingResponse(
-            io.BytesIO(csv_data.encode()),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename={pillar}_{entity_type}_{datetime.utcnow().strftime('%Y%m%d')}.csv"
-            }
-        )
-
+        lines = service.iter_csv_rows(pillar, entity_type)
+        first_line = next(lines, None)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
+    if first_line is None:
+        raise HTTPException(status_code=404, detail="No data found for export")
+
+    # Remaining rows are fetched and written while the response streams
+    return StreamingResponse(
+        itertools.chain((first_line,), lines),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={pillar}_{entity_type}_{datetime.utcnow().strftime('%Y%m%d')}.csv"
+        }
+    )
+
 
 @router.get("/export/csv/template/{pillar}/{entity_type}")
 def get_csv_template(
@@ -170,15 +177,20 @@ async def import_data_json(
     service = ExportImportService(db, current_user.id)
 
     try:
-        content = await file.read()
-        data = json.loads(content.decode('utf-8'))
+        # Parsing and the database writes are blocking, so they run off the event loop
+        if STREAMING_JSON_IMPORT:
+            # Parse the spooled upload incrementally instead of loading it whole
+            result = await run_in_threadpool(service.import_from_json_stream, file.file, overwrite)
+        else:
+            content = await file.read()
+            data = await run_in_threadpool(orjson.loads, content)
 
-        # Import data using service
-        result = service.import_from_json(data, overwrite)
+            # Import data using service
+            result = await run_in_threadpool(service.import_from_json, data, overwrite)
 
         return DataImportResponse(**result)
 
-    except json.JSONDecodeError:
+    except JSON_DECODE_ERRORS:
         raise HTTPException(status_code=400, detail="Invalid JSON file")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
@@ -3,7 +3,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, extract, and_, or_
 from typing import List, Optional
 from datetime import datetime, timedelta
-from app.core.database import get_db
+from app.core.database import get_db, array_contains
+from app.core.responses import ORMJSONResponse
 from app.models.user import User
 from app.models.financial import (
     Transaction,
@@ -18,6 +19,7 @@ from app.schemas.financial import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
+    TransactionCategorizeBatch,
     BudgetCreate,
     BudgetUpdate,
     BudgetResponse,
@@ -32,6 +34,7 @@ from app.schemas.financial import (
     FinancialGoalResponse,
 )
 from app.api.deps import get_current_active_user
+from app.services.intelligence_cache import invalidate_intelligence
 
 router = APIRouter()
 
@@ -51,6 +54,7 @@ def create_transaction(
     )
     db.add(transaction)
     db.commit()
+    invalidate_intelligence(current_user.id)
     db.refresh(transaction)
     return transaction
 
@@ -65,6 +69,7 @@ def get_transactions(
     end_date: Optional[datetime] = None,
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
+    tag: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -83,6 +88,8 @@ def get_transactions(
         query = query.filter(Transaction.amount >= min_amount)
     if max_amount is not None:
         query = query.filter(Transaction.amount <= max_amount)
+    if tag:
+        query = query.filter(array_contains(Transaction.tags, tag))
 
     transactions = (
         query.order_by(Transaction.transaction_date.desc())
@@ -90,7 +97,8 @@ def get_transactions(
         .limit(limit)
         .all()
     )
-    return transactions
+    # TransactionResponse mirrors the table, so rows are serialized directly
+    return ORMJSONResponse(transactions)
 
 
 @router.get("/transactions/{transaction_id}", response_model=TransactionResponse)
@@ -143,6 +151,7 @@ def update_transaction(
         setattr(transaction, field, value)
 
     db.commit()
+    invalidate_intelligence(current_user.id)
     db.refresh(transaction)
     return transaction
 
@@ -170,6 +179,7 @@ def delete_transaction(
 
     db.delete(transaction)
     db.commit()
+    invalidate_intelligence(current_user.id)
     return None
 
 
@@ -616,17 +626,37 @@ def categorize_transaction(
     from app.services.ai_categorization import get_categorizer
 
     categorizer = get_categorizer()
-    predicted_category = categorizer.categorize(description, merchant, amount)
-    confidence = categorizer.get_confidence_score(description, merchant, predicted_category)
+    predicted_category, confidence = categorizer.categorize_with_confidence(description, merchant, amount)
     suggestions = categorizer.suggest_categories(description, merchant, top_k=3)
 
     return {
         "predicted_category": predicted_category,
         "confidence": confidence,
-        "alternative_suggestions": suggestions
+        "alternative_suggestions": [suggestion._asdict() for suggestion in suggestions]
     }
 
 
+@router.post("/transactions/categorize/batch")
+def categorize_transactions_batch(
+    batch: TransactionCategorizeBatch,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Categorize many transactions in one request (e.g. a bank statement import).
+    Returns one predicted category per input, in input order.
+    """
+    from app.services.ai_categorization import get_categorizer
+
+    items = batch.transactions
+    categories = get_categorizer().categorize_batch(
+        [item.description for item in items],
+        [item.merchant for item in items],
+        [item.amount for item in items],
+    )
+
+    return {"predicted_categories": categories}
+
+
 # ==================== DASHBOARD ====================
 
 @router.get("/dashboard")
@@ -34,6 +34,11 @@ from app.schemas.health import (
 )
 from app.api.deps import get_current_active_user
 from app.services.health_calculations import get_health_calculator
+from app.services.health_dashboard_cache import (
+    cache_dashboard,
+    get_cached_dashboard,
+    invalidate_dashboard,
+)
 
 router = APIRouter()
 
@@ -67,6 +72,7 @@ def create_meal(
             meal.calories = total_calories
 
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(meal)
     return meal
 
@@ -144,6 +150,7 @@ def update_meal(
         setattr(meal, field, value)
 
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(meal)
     return meal
 
@@ -168,6 +175,7 @@ def delete_meal(
 
     db.delete(meal)
     db.commit()
+    invalidate_dashboard(current_user.id)
     return None
 
 
@@ -238,6 +246,7 @@ def create_biometric(
     biometric = Biometric(**biometric_dict, user_id=current_user.id)
     db.add(biometric)
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(biometric)
     return biometric
 
@@ -375,6 +384,7 @@ def create_exercise(
     exercise = Exercise(**exercise_dict, user_id=current_user.id)
     db.add(exercise)
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(exercise)
     return exercise
 
@@ -476,6 +486,7 @@ def create_sleep(
     sleep = Sleep(**sleep_data.model_dump(), user_id=current_user.id)
     db.add(sleep)
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(sleep)
     return sleep
 
@@ -604,6 +615,7 @@ def create_symptom(
     symptom = Symptom(**symptom_data.model_dump(), user_id=current_user.id)
     db.add(symptom)
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(symptom)
     return symptom
 
@@ -661,6 +673,7 @@ def update_symptom(
         setattr(symptom, field, value)
 
     db.commit()
+    invalidate_dashboard(current_user.id)
     db.refresh(symptom)
     return symptom
 
@@ -676,6 +689,10 @@ def get_health_dashboard(
     Comprehensive health dashboard with all key metrics.
     Includes BMI, TDEE, nutritional summary, health score, and trends.
     """
+    cached = get_cached_dashboard(current_user.id)
+    if cached is not None:
+        return cached
+
     from datetime import datetime, timedelta
     from collections import defaultdict
 
@@ -801,10 +818,10 @@ def get_health_dashboard(
             carbs=total_carbs / 7,
             fat=total_fat / 7,
             fiber=total_fiber / 7 if total_fiber > 0 else None,
-            target_calories=int(macro_targets['calories']),
-            target_protein=macro_targets['protein_g'],
-            target_carbs=macro_targets['carbs_g'],
-            target_fat=macro_targets['fat_g']
+            target_calories=int(macro_targets.calories),
+            target_protein=macro_targets.protein_g,
+            target_carbs=macro_targets.carbs_g,
+            target_fat=macro_targets.fat_g
         )
 
     # Calculate overall health score
@@ -827,7 +844,7 @@ def get_health_dashboard(
         .count()
     )
 
-    return {
+    return cache_dashboard(current_user.id, {
         "biometrics": {
             "bmi": round(bmi, 2) if bmi else None,
             "bmi_category": bmi_category,
@@ -851,7 +868,7 @@ def get_health_dashboard(
                 "fat_g": round(total_fat / 7, 1),
             },
             "tdee": round(tdee, 0) if tdee else None,
-            "macro_targets": macro_targets,
+            "macro_targets": macro_targets._asdict() if macro_targets else None,
             "nutrition_score": round(nutrition_score, 2) if nutrition_score else None,
         },
         "exercise": {
@@ -868,9 +885,9 @@ def get_health_dashboard(
         "symptoms": {
             "active_symptoms": active_symptoms,
         },
-        "health_score": health_score,
+        "health_score": health_score.as_dict(),
         "period": "last 7 days",
-    }
+    })
 
 
 @router.get("/calculations/tdee")
@@ -896,7 +913,7 @@ def calculate_tdee(
         "bmi_category": calculator.get_bmi_category(bmi),
         "bmr": bmr,
         "tdee": tdee,
-        "macro_targets": macros,
+        "macro_targets": macros._asdict(),
         "ideal_weight_range_kg": {
             "min": ideal_weight_range[0],
             "max": ideal_weight_range[1]
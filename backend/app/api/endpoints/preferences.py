@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
-from app.core.database import get_db
+from app.core.cache import briefing_key, get_or_build, seconds_until_midnight
+from app.core.database import get_async_db, get_db
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.models.preferences import UserPreferences, NotificationLog
@@ -10,9 +14,15 @@ from app.schemas.preferences import (
     UserPreferencesCreate,
     UserPreferencesUpdate,
     UserPreferencesResponse,
-    NotificationResponse
+    NotificationResponse,
+    NotificationReadRequest
 )
 from app.services.notification_service import NotificationService
+from app.services.preferences_cache import (
+    cache_preferences,
+    get_cached_preferences,
+    invalidate_preferences,
+)
 
 router = APIRouter(prefix="/preferences", tags=["preferences"])
 
@@ -24,6 +34,10 @@ def get_user_preferences(
 ):
     """Get user preferences and settings"""
 
+    cached = get_cached_preferences(current_user.id)
+    if cached is not None:
+        return cached
+
     preferences = db.query(UserPreferences).filter(
         UserPreferences.user_id == current_user.id
     ).first()
@@ -35,7 +49,7 @@ def get_user_preferences(
         db.commit()
         db.refresh(preferences)
 
-    return preferences
+    return cache_preferences(preferences)
 
 
 @router.post("", response_model=UserPreferencesResponse)
@@ -56,12 +70,13 @@ def create_user_preferences(
 
     new_preferences = UserPreferences(
         user_id=current_user.id,
-        **preferences.dict()
+        **preferences.model_dump()
     )
 
     db.add(new_preferences)
     db.commit()
     db.refresh(new_preferences)
+    invalidate_preferences(current_user.id)
 
     return new_preferences
 
@@ -88,6 +103,7 @@ def update_user_preferences(
 
     db.commit()
     db.refresh(existing)
+    invalidate_preferences(current_user.id)
 
     return existing
 
@@ -108,6 +124,7 @@ def delete_user_preferences(
 
     db.delete(preferences)
     db.commit()
+    invalidate_preferences(current_user.id)
 
     return {"message": "Preferences deleted successfully"}
 
@@ -115,17 +132,17 @@ def delete_user_preferences(
 # ==================== NOTIFICATIONS ====================
 
 @router.get("/notifications", response_model=List[NotificationResponse])
-def get_notifications(
+async def get_notifications(
     notification_type: Optional[str] = Query(default=None),
     category: Optional[str] = Query(default=None),
     limit: int = Query(default=50, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get user notifications"""
 
     service = NotificationService(db)
-    notifications = service.get_notifications(
+    notifications = await service.get_notifications(
         user_id=current_user.id,
         notification_type=notification_type,
         category=category,
@@ -135,16 +152,30 @@ def get_notifications(
     return notifications
 
 
+@router.post("/notifications/read")
+async def mark_notifications_read(
+    request: NotificationReadRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Mark several notifications as read"""
+
+    service = NotificationService(db)
+    updated = await service.mark_notifications_read(request.notification_ids, current_user.id)
+
+    return {"updated": updated}
+
+
 @router.post("/notifications/{notification_id}/read", response_model=NotificationResponse)
-def mark_notification_read(
+async def mark_notification_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Mark a notification as read"""
 
     service = NotificationService(db)
-    notification = service.mark_notification_read(notification_id, current_user.id)
+    notification = await service.mark_notification_read(notification_id, current_user.id)
 
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
@@ -154,21 +185,31 @@ def mark_notification_read(
 
 @router.post("/notifications/test")
 async def send_test_notification(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Send a test notification to verify settings"""
 
     service = NotificationService(db)
 
-    notification = await service.send_notification(
-        user_id=current_user.id,
-        notification_type="email",
-        category="test",
-        title="Test Notification",
-        message="This is a test notification from Wellbeing Copilot.",
-        extra_data={"test": True}
-    )
+    try:
+        notification = await service.send_notification(
+            user_id=current_user.id,
+            notification_type="email",
+            category="test",
+            title="Test Notification",
+            message="This is a test notification from Wellbeing Copilot.",
+            extra_data={"test": True}
+        )
+    finally:
+        await service.aclose()
+
+    if notification is None:
+        return {
+            "message": "Test notification skipped: email notifications are turned off",
+            "notification_id": None,
+            "status": "skipped"
+        }
 
     return {
         "message": "Test notification sent",
@@ -179,38 +220,48 @@ async def send_test_notification(
 
 @router.post("/briefing/generate")
 async def generate_daily_briefing(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """Generate and preview daily briefing"""
+    """Generate and preview daily briefing (cached until the next UTC day)"""
 
     service = NotificationService(db)
-    briefing = await service.generate_daily_briefing(current_user.id)
+    payload = await get_or_build(
+        briefing_key(current_user.id, datetime.utcnow().date()),
+        seconds_until_midnight(),
+        lambda: service.generate_daily_briefing(current_user.id),
+    )
 
-    return briefing
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/briefing/send")
 async def send_daily_briefing(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Send daily briefing via email"""
 
     service = NotificationService(db)
-    await service.send_daily_briefing(current_user.id)
+    try:
+        await service.send_daily_briefing(current_user.id)
+    finally:
+        await service.aclose()
 
     return {"message": "Daily briefing sent successfully"}
 
 
 @router.post("/alerts/check")
 async def check_alerts(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Check and send any pending alerts"""
 
     service = NotificationService(db)
-    await service.check_and_send_alerts(current_user.id)
+    try:
+        await service.check_and_send_alerts(current_user.id)
+    finally:
+        await service.aclose()
 
     return {"message": "Alerts checked and sent"}
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract, and_, or_, desc
 from typing import List, Optional
@@ -15,6 +16,7 @@ from app.models.productivity import (
     TaskStatus,
     TaskPriority,
 )
+from app.schemas._fastpath import fast_rows
 from app.schemas.productivity import (
     TaskCreate,
     TaskUpdate,
@@ -76,7 +78,7 @@ def get_tasks(
         query = query.filter(Task.project == project)
 
     tasks = query.order_by(desc(Task.created_at)).offset(skip).limit(limit).all()
-    return tasks
+    return ORJSONResponse(fast_rows(TaskResponse, tasks))
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
@@ -175,7 +177,7 @@ def get_deep_work_sessions(
     sessions = db.query(DeepWorkSession).filter(
         DeepWorkSession.user_id == current_user.id
     ).order_by(desc(DeepWorkSession.start_time)).offset(skip).limit(limit).all()
-    return sessions
+    return ORJSONResponse(fast_rows(DeepWorkSessionResponse, sessions))
 
 
 # ==================== DISTRACTIONS ====================
@@ -208,7 +210,7 @@ def get_distractions(
     distractions = db.query(Distraction).filter(
         Distraction.user_id == current_user.id
     ).order_by(desc(Distraction.timestamp)).offset(skip).limit(limit).all()
-    return distractions
+    return ORJSONResponse(fast_rows(DistractionResponse, distractions))
 
 
 @router.delete("/distractions/{distraction_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -264,7 +266,7 @@ def get_goals(
         query = query.filter(ProductivityGoal.is_active == True)
 
     goals = query.order_by(desc(ProductivityGoal.created_at)).offset(skip).limit(limit).all()
-    return goals
+    return ORJSONResponse(fast_rows(ProductivityGoalResponse, goals))
 
 
 @router.put("/goals/{goal_id}", response_model=ProductivityGoalResponse)
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.models.user import User
 from app.models.wellbeing import MoodEntry, Activity, SleepEntry, Goal
+from app.schemas._fastpath import fast_rows
 from app.schemas.wellbeing import (
     MoodEntryCreate,
     MoodEntryResponse,
@@ -16,6 +18,7 @@ from app.schemas.wellbeing import (
     GoalResponse,
 )
 from app.api.deps import get_current_active_user
+from app.services.intelligence_cache import invalidate_intelligence
 
 router = APIRouter()
 
@@ -29,6 +32,7 @@ def create_mood_entry(
     mood_entry = MoodEntry(**mood_data.model_dump(), user_id=current_user.id)
     db.add(mood_entry)
     db.commit()
+    invalidate_intelligence(current_user.id)
     db.refresh(mood_entry)
     return mood_entry
 
@@ -48,7 +52,7 @@ def get_mood_entries(
         .limit(limit)
         .all()
     )
-    return mood_entries
+    return ORJSONResponse(fast_rows(MoodEntryResponse, mood_entries))
 
 
 @router.post("/activity", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
@@ -79,7 +83,7 @@ def get_activities(
         .limit(limit)
         .all()
     )
-    return activities
+    return ORJSONResponse(fast_rows(ActivityResponse, activities))
 
 
 @router.post("/sleep", response_model=SleepEntryResponse, status_code=status.HTTP_201_CREATED)
@@ -91,6 +95,7 @@ def create_sleep_entry(
     sleep_entry = SleepEntry(**sleep_data.model_dump(), user_id=current_user.id)
     db.add(sleep_entry)
     db.commit()
+    invalidate_intelligence(current_user.id)
     db.refresh(sleep_entry)
     return sleep_entry
 
@@ -110,7 +115,7 @@ def get_sleep_entries(
         .limit(limit)
         .all()
     )
-    return sleep_entries
+    return ORJSONResponse(fast_rows(SleepEntryResponse, sleep_entries))
 
 
 @router.post("/goals", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
@@ -137,7 +142,7 @@ def get_goals(
         .order_by(Goal.created_at.desc())
         .all()
     )
-    return goals
+    return ORJSONResponse(fast_rows(GoalResponse, goals))
 
 
 @router.put("/goals/{goal_id}", response_model=GoalResponse)
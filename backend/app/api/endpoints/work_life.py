@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import List, Optional
@@ -13,6 +14,7 @@ from app.models.work_life import (
     Boundary,
     BoundaryViolation,
 )
+from app.schemas._fastpath import fast_rows
 from app.schemas.work_life import (
     WorkSessionCreate,
     WorkSessionResponse,
@@ -48,7 +50,7 @@ def create_work_session(
         db, current_user.id, session_data.start_time, session_data.end_time
     )
 
-    work_session = WorkSession(**session_data.dict(), user_id=current_user.id)
+    work_session = WorkSession(**session_data.model_dump(), user_id=current_user.id)
     db.add(work_session)
     db.commit()
     db.refresh(work_session)
@@ -79,7 +81,7 @@ def get_work_sessions(
         query = query.filter(WorkSession.end_time <= end_date)
 
     sessions = query.order_by(WorkSession.start_time.desc()).offset(skip).limit(limit).all()
-    return sessions
+    return ORJSONResponse(fast_rows(WorkSessionResponse, sessions))
 
 
 # ============== Meeting Logger ==============
@@ -92,7 +94,7 @@ def create_meeting(
     current_user: User = Depends(get_current_user),
 ):
     """Log a meeting with duration and energy drain rating"""
-    meeting = Meeting(**meeting_data.dict(), user_id=current_user.id)
+    meeting = Meeting(**meeting_data.model_dump(), user_id=current_user.id)
     db.add(meeting)
     db.commit()
     db.refresh(meeting)
@@ -117,7 +119,7 @@ def get_meetings(
         query = query.filter(Meeting.end_time <= end_date)
 
     meetings = query.order_by(Meeting.start_time.desc()).offset(skip).limit(limit).all()
-    return meetings
+    return ORJSONResponse(fast_rows(MeetingResponse, meetings))
 
 
 # ============== Energy Levels ==============
@@ -130,7 +132,7 @@ def create_energy_level(
     current_user: User = Depends(get_current_user),
 ):
     """Log an energy level check-in"""
-    energy_level = EnergyLevel(**energy_data.dict(), user_id=current_user.id)
+    energy_level = EnergyLevel(**energy_data.model_dump(), user_id=current_user.id)
     db.add(energy_level)
     db.commit()
     db.refresh(energy_level)
@@ -155,7 +157,7 @@ def get_energy_levels(
         query = query.filter(EnergyLevel.timestamp <= end_date)
 
     levels = query.order_by(EnergyLevel.timestamp.desc()).offset(skip).limit(limit).all()
-    return levels
+    return ORJSONResponse(fast_rows(EnergyLevelResponse, levels))
 
 
 @router.get("/energy/patterns")
@@ -201,7 +203,7 @@ def create_social_activity(
     current_user: User = Depends(get_current_user),
 ):
     """Log social time (family, friends, solo)"""
-    activity = SocialActivity(**activity_data.dict(), user_id=current_user.id)
+    activity = SocialActivity(**activity_data.model_dump(), user_id=current_user.id)
     db.add(activity)
     db.commit()
     db.refresh(activity)
@@ -228,7 +230,7 @@ def get_social_activities(
     activities = (
         query.order_by(SocialActivity.start_time.desc()).offset(skip).limit(limit).all()
     )
-    return activities
+    return ORJSONResponse(fast_rows(SocialActivityResponse, activities))
 
 
 # ============== Boundaries ==============
@@ -241,7 +243,7 @@ def create_boundary(
     current_user: User = Depends(get_current_user),
 ):
     """Create a work-life boundary"""
-    boundary = Boundary(**boundary_data.dict(), user_id=current_user.id)
+    boundary = Boundary(**boundary_data.model_dump(), user_id=current_user.id)
     db.add(boundary)
     db.commit()
     db.refresh(boundary)
@@ -261,7 +263,7 @@ def get_boundaries(
         query = query.filter(Boundary.is_active == True)
 
     boundaries = query.order_by(Boundary.importance.desc()).all()
-    return boundaries
+    return ORJSONResponse(fast_rows(BoundaryResponse, boundaries))
 
 
 @router.patch("/boundaries/{boundary_id}", response_model=BoundaryResponse)
@@ -0,0 +1,104 @@
+"""
+Response cache for aggregated per-user payloads (daily briefings, weekly reviews).
+Backed by Redis when REDIS_URL is configured; otherwise every lookup is a miss.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # redis is an optional dependency
+    aioredis = None
+    RedisError = Exception
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """Get the shared Redis client, or None when caching is disabled"""
+    global _client
+    if _client is None and settings.REDIS_URL and aioredis is not None:
+        _client = aioredis.from_url(settings.REDIS_URL)
+    return _client
+
+
+# ==================== KEYS & EXPIRY ====================
+
+def briefing_key(user_id: int, briefing_date: date) -> str:
+    return f"briefing:{user_id}:{briefing_date.isoformat()}"
+
+
+def weekly_review_key(user_id: int, week_start: date) -> str:
+    return f"weekly_review:{user_id}:{week_start.isoformat()}"
+
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> int:
+    """Seconds until the next UTC day boundary, when a new briefing is due"""
+    now = now or datetime.utcnow()
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(int((tomorrow - now).total_seconds()), 1)
+
+
+def seconds_until_next_week(now: Optional[datetime] = None) -> int:
+    """Seconds until next Monday 00:00 UTC, when a new weekly review is due"""
+    now = now or datetime.utcnow()
+    next_monday = now.date() + timedelta(days=7 - now.weekday())
+    boundary = datetime.combine(next_monday, datetime.min.time())
+    return max(int((boundary - now).total_seconds()), 1)
+
+
+# ==================== CACHE OPERATIONS ====================
+
+async def get_or_build(
+    key: str,
+    ttl_seconds: int,
+    build: Callable[[], Awaitable[Dict[str, Any]]]
+) -> bytes:
+    """
+    Return the serialized payload stored under key, building and caching it on a miss.
+    Payloads are stored already encoded so a warm hit skips serialization entirely.
+    """
+    client = get_redis()
+
+    if client is not None:
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                return cached
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+
+    payload = orjson.dumps(await build(), default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    if client is not None:
+        try:
+            await client.set(key, payload, ex=ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    return payload
+
+
+async def invalidate_user_cache(user_id: int):
+    """Drop cached briefings and weekly reviews after a user's summaries change"""
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        keys = []
+        for pattern in (f"briefing:{user_id}:*", f"weekly_review:{user_id}:*"):
+            keys.extend([key async for key in client.scan_iter(match=pattern)])
+        if keys:
+            await client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for user {user_id}: {e}")
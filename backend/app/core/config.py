@@ -13,6 +13,25 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = "sqlite:///./wellbeing.db"
 
+    # Optional Redis cache for briefings and weekly reviews
+    REDIS_URL: Optional[str] = None
+
+    # Optional email delivery over SMTP (needs aiosmtplib); notifications are only logged without it
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_FROM: str = "Wellbeing Copilot <noreply@localhost>"
+
+    # Optional push delivery through FCM (needs aiohttp)
+    FCM_SERVER_KEY: Optional[str] = None
+
+    # Keep a "skipped" log row for notifications a user has turned off
+    LOG_SKIPPED_NOTIFICATIONS: bool = False
+
+    # Scheduled briefing, alert and partition jobs (need apscheduler); leave them enabled on a single worker only
+    NOTIFICATION_SCHEDULER_ENABLED: bool = True
+
     CORS_ORIGINS: list = [
         "http://localhost:3000",
         "http://localhost:3001",
@@ -1,20 +1,108 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, JSON, Text, create_engine, event, exists, func, literal, select, type_coerce
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+# Async driver for each dialect, whichever sync driver the configured URL names
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_url(url: str) -> URL:
+    """Map the configured sync URL onto its dialect's async driver"""
+    parsed = make_url(url)
+    async_driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    return parsed.set(drivername=async_driver) if async_driver else parsed
+
+
+if settings.DATABASE_URL.startswith("sqlite"):
+    # SQLite is file-local; a connection pool buys nothing
+    _engine_args = {"connect_args": {"check_same_thread": False}}
+else:
+    # Size the pool for concurrent FastAPI workers and recycle connections
+    # before server-side idle timeouts can silently drop them
+    _engine_args = {
+        "pool_size": 20,
+        "max_overflow": 20,
+        "pool_timeout": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+# Sized for the many cached lambda statements; shared by the sync and async engines
+_engine_args["query_cache_size"] = 1200
+
+engine = create_engine(settings.DATABASE_URL, **_engine_args)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(_async_url(settings.DATABASE_URL), **_engine_args)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
+# List of strings: native text[] on PostgreSQL (GIN-indexable), JSON elsewhere
+StringArray = JSON().with_variant(ARRAY(Text), "postgresql")
+
+
+def array_contains(column, value: str):
+    """Filter for rows whose StringArray column contains value"""
+    if engine.dialect.name == "postgresql":
+        # Compiles to `column @> ARRAY[value]`, served by the GIN index
+        return type_coerce(column, ARRAY(Text)).contains([value])
+    # Exact, case-sensitive element match, like @> on PostgreSQL
+    elements = func.json_each(column).table_valued("value")
+    return exists(select(literal(1)).select_from(elements).where(elements.c.value == value))
+
+
+def elapsed_seconds_sql(start_column: str, end_column: str) -> str:
+    """Dialect-specific SQL for end - start in seconds, for Computed columns"""
+    if engine.dialect.name == "postgresql":
+        return f"EXTRACT(EPOCH FROM ({end_column} - {start_column}))"
+    # julianday() is a float day count; round off its sub-millisecond error
+    return f"ROUND((julianday({end_column}) - julianday({start_column})) * 86400.0, 3)"
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def attach_updated_at_trigger(table):
+    """
+    Maintain table.updated_at in the database instead of from the ORM.
+    Pair with server_onupdate=FetchedValue() so UPDATE statements never carry the column.
+    """
+    name = table.name
+
+    event.listen(table, "after_create", DDL(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END; $$ LANGUAGE plpgsql"
+    ).execute_if(dialect="postgresql"))
+    event.listen(table, "after_create", DDL(
+        f"CREATE TRIGGER trg_{name}_updated_at BEFORE UPDATE ON {name} "
+        f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    ).execute_if(dialect="postgresql"))
+
+    # SQLite has no BEFORE UPDATE assignment, so touch the row after the update
+    event.listen(table, "after_create", DDL(
+        f"CREATE TRIGGER trg_{name}_updated_at AFTER UPDATE ON {name} "
+        f"FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at BEGIN "
+        f"UPDATE {name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END"
+    ).execute_if(dialect="sqlite"))
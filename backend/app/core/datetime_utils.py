@@ -0,0 +1,22 @@
+"""
+Datetime Utilities
+ISO-8601 parsing for calendar payloads and backup imports, using ciso8601 when installed
+"""
+
+from datetime import datetime
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 is an optional speedup
+    ciso8601 = None
+
+
+def _parse_datetime_stdlib(value: str) -> datetime:
+    """Parse an ISO-8601 string with the stdlib, accepting a trailing 'Z' for UTC"""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+# Raises ValueError on malformed input either way
+parse_datetime = ciso8601.parse_datetime if ciso8601 is not None else _parse_datetime_stdlib
@@ -3,7 +3,7 @@ Custom Error Handlers and Exception Classes
 """
 
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from typing import Union
@@ -49,11 +49,11 @@ class ValidationError(Exception):
 
 
 # Error Handlers
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTPException"""
     logger.error(f"HTTP error: {exc.status_code} - {exc.detail} - Path: {request.url.path}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -66,7 +66,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle validation errors"""
     errors = []
     for error in exc.errors():
@@ -78,7 +78,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
     logger.warning(f"Validation error on {request.url.path}: {errors}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -92,13 +92,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> ORJSONResponse:
     """Handle SQLAlchemy errors"""
     logger.error(f"Database error on {request.url.path}: {str(exc)}", exc_info=True)
 
     # Check for specific error types
     if isinstance(exc, IntegrityError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_409_CONFLICT,
             content={
                 "error": {
@@ -111,7 +111,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
             }
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -124,11 +124,11 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle any unhandled exceptions"""
     logger.error(f"Unhandled exception on {request.url.path}: {str(exc)}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -141,11 +141,11 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
 
-async def not_found_exception_handler(request: Request, exc: NotFoundError) -> JSONResponse:
+async def not_found_exception_handler(request: Request, exc: NotFoundError) -> ORJSONResponse:
     """Handle NotFoundError"""
     logger.warning(f"Resource not found on {request.url.path}: {exc.message}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "error": {
@@ -158,11 +158,11 @@ async def not_found_exception_handler(request: Request, exc: NotFoundError) -> J
     )
 
 
-async def authentication_exception_handler(request: Request, exc: AuthenticationError) -> JSONResponse:
+async def authentication_exception_handler(request: Request, exc: AuthenticationError) -> ORJSONResponse:
     """Handle AuthenticationError"""
     logger.warning(f"Authentication error on {request.url.path}: {exc.message}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_401_UNAUTHORIZED,
         content={
             "error": {
@@ -175,11 +175,11 @@ async def authentication_exception_handler(request: Request, exc: Authentication
     )
 
 
-async def authorization_exception_handler(request: Request, exc: AuthorizationError) -> JSONResponse:
+async def authorization_exception_handler(request: Request, exc: AuthorizationError) -> ORJSONResponse:
     """Handle AuthorizationError"""
     logger.warning(f"Authorization error on {request.url.path}: {exc.message}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_403_FORBIDDEN,
         content={
             "error": {
@@ -0,0 +1,68 @@
+"""
+Time Partitioning
+Monthly range partitions for high-volume time-series tables on PostgreSQL
+"""
+
+import logging
+from datetime import date
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Partitioning is PostgreSQL-only; on SQLite the tables stay plain
+PARTITIONED = engine.dialect.name == "postgresql"
+
+_partitioned_tables: List[str] = []
+
+
+def monthly_partitions(table_name: str, column: str) -> dict:
+    """
+    Table kwargs that range-partition table_name by column, registering it
+    for monthly partition maintenance. The partition key must be part of the
+    primary key, so partitioned models declare it with primary_key=PARTITIONED.
+    """
+    _partitioned_tables.append(table_name)
+    return {"postgresql_partition_by": f"RANGE ({column})"}
+
+
+def _add_month(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    return date(day.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def ensure_monthly_partitions(months_ahead: int = 3):
+    """
+    Create the DEFAULT partition and one partition per month from the current
+    month through months_ahead. Safe to run repeatedly: it runs on startup and
+    monthly from the app scheduler (app.services.notification_scheduler);
+    deployments without apscheduler must call it from an external monthly cron.
+    """
+    if not PARTITIONED:
+        return
+
+    this_month = date.today().replace(day=1)
+
+    for table_name in _partitioned_tables:
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT"
+        ]
+        for offset in range(months_ahead + 1):
+            start = _add_month(this_month, offset)
+            end = _add_month(start, 1)
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {table_name}_{start:%Y_%m} PARTITION OF {table_name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+
+        for statement in statements:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(statement))
+            except SQLAlchemyError as e:
+                # Typically rows for that month already sit in the DEFAULT partition
+                logger.warning(f"Could not create partition for {table_name}: {e}")
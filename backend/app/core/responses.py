@@ -0,0 +1,28 @@
+"""
+JSON Responses
+orjson-backed response classes, including direct serialization of ORM rows
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from app.core.database import Base
+
+
+def orm_default(obj: Any) -> Any:
+    """orjson default hook: serialize ORM rows from their table columns"""
+    if isinstance(obj, Base):
+        return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORMJSONResponse(ORJSONResponse):
+    """
+    Serialize ORM rows straight to JSON, skipping response-model validation.
+    Only use on trusted read paths whose response schema exposes every column.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orm_default, option=orjson.OPT_SERIALIZE_NUMPY)
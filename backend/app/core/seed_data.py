@@ -254,7 +254,6 @@ def seed_work_life_data(db: Session, user_id: int):
                 user_id=user_id,
                 start_time=start_time,
                 end_time=start_time + timedelta(hours=duration),
-                duration_hours=duration,
                 work_type="focused_work",
                 productivity_rating=random.randint(6, 10),
                 stress_level=random.randint(1, 10)
@@ -1,11 +1,18 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.core.partitioning import ensure_monthly_partitions
+from app.schemas import productivity as productivity_schemas
+from app.schemas import wellbeing as wellbeing_schemas
+from app.schemas import work_life as work_life_schemas
+from app.schemas._common import rebuild_deferred_schemas
+from app.services.notification_scheduler import start_notification_scheduler, stop_notification_scheduler
 from app.api.endpoints import (
     auth,
     wellbeing,
@@ -48,11 +55,13 @@ logger = logging.getLogger(__name__)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+ensure_monthly_partitions()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     description="Wellbeing Copilot API - Comprehensive health, financial, and productivity tracking"
 )
 
@@ -106,6 +115,24 @@ app.include_router(
 )
 
 
+@app.on_event("startup")
+def build_deferred_schemas():
+    """Finish building deferred schemas before the first request arrives"""
+    built = rebuild_deferred_schemas(productivity_schemas, wellbeing_schemas, work_life_schemas)
+    logger.info(f"Built {built} deferred schemas")
+
+
+@app.on_event("startup")
+async def start_scheduler():
+    """Schedule the daily-briefing and alert sweeps"""
+    start_notification_scheduler()
+
+
+@app.on_event("shutdown")
+def stop_scheduler():
+    stop_notification_scheduler()
+
+
 @app.get("/")
 def root():
     return {
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, StringArray
 
 
 class CorrelationStrength(str, enum.Enum):
@@ -117,7 +117,7 @@ class Correlation(Base):
     # Metadata
     is_actionable = Column(Boolean, default=False)
     is_causal = Column(Boolean, default=False)  # True if likely causal, not just correlational
-    tags = Column(Text, nullable=True)  # JSON array of tags
+    tags = Column(StringArray, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -170,7 +170,7 @@ class Recommendation(Base):
 
     # Effectiveness tracking
     was_helpful = Column(Boolean, nullable=True)
-    effectiveness_rating = Column(Integer, nullable=True)  # 1-5 scale
+    effectiveness_rating = Column(SmallInteger, nullable=True)  # 1-5 scale
     user_feedback = Column(Text, nullable=True)
 
     # Expiry
@@ -184,6 +184,7 @@ class Recommendation(Base):
     correlation = relationship("Correlation")
 
     __table_args__ = (
+        CheckConstraint('effectiveness_rating BETWEEN 1 AND 5', name='ck_recommendations_effectiveness_rating_range'),
         Index('ix_recommendations_user_status', 'user_id', 'status'),
         Index('ix_recommendations_user_category', 'user_id', 'category'),
         Index('ix_recommendations_user_priority', 'user_id', 'priority'),
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Enum, Index
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Enum, Index, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, StringArray
 
 
 class TransactionType(str, enum.Enum):
@@ -63,7 +63,7 @@ class Transaction(Base):
     description = Column(Text, nullable=True)
     transaction_date = Column(DateTime(timezone=True), nullable=False, index=True)
     merchant = Column(String, nullable=True)
-    tags = Column(String, nullable=True)  # JSON string of tags
+    tags = Column(StringArray, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -71,8 +71,10 @@ class Transaction(Base):
     user = relationship("User", back_populates="transactions")
 
     __table_args__ = (
-        Index('ix_transactions_user_date', 'user_id', 'transaction_date'),
+        Index('ix_transactions_user_date', 'user_id', 'transaction_date',
+              postgresql_include=['amount', 'transaction_type']),
         Index('ix_transactions_user_category', 'user_id', 'category'),
+        Index('ix_transactions_tags_gin', 'tags', postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
 
 
@@ -161,7 +163,7 @@ class FinancialGoal(Base):
     current_amount = Column(Float, default=0.0)
     target_date = Column(DateTime(timezone=True), nullable=True)
     category = Column(String, nullable=True)  # emergency_fund, retirement, vacation, etc.
-    priority = Column(Integer, default=1)  # 1-5 scale
+    priority = Column(SmallInteger, default=1)  # 1-5 scale
     is_completed = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -170,5 +172,6 @@ class FinancialGoal(Base):
     user = relationship("User", back_populates="financial_goals")
 
     __table_args__ = (
+        CheckConstraint('priority BETWEEN 1 AND 5', name='ck_financial_goals_priority_range'),
         Index('ix_financial_goals_user_active', 'user_id', 'is_completed'),
     )
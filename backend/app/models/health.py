@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Enum, Index
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Enum, Index, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, StringArray
 
 
 class MealType(str, enum.Enum):
@@ -42,7 +42,7 @@ class Meal(Base):
     description = Column(Text, nullable=True)
     meal_time = Column(DateTime(timezone=True), nullable=False, index=True)
     calories = Column(Integer, nullable=True)
-    rating = Column(Integer, nullable=True)  # 1-5 how good it was
+    rating = Column(SmallInteger, nullable=True)  # 1-5 how good it was
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -52,6 +52,7 @@ class Meal(Base):
     nutrition_items = relationship("NutritionItem", back_populates="meal", cascade="all, delete-orphan")
 
     __table_args__ = (
+        CheckConstraint('rating BETWEEN 1 AND 5', name='ck_meals_rating_range'),
         Index('ix_meals_user_time', 'user_id', 'meal_time'),
     )
 
@@ -114,7 +115,7 @@ class Exercise(Base):
     name = Column(String, nullable=False)
     duration_minutes = Column(Integer, nullable=False)
     calories_burned = Column(Integer, nullable=True)
-    intensity = Column(Integer, nullable=True)  # 1-10 scale
+    intensity = Column(SmallInteger, nullable=True)  # 1-10 scale
     distance = Column(Float, nullable=True)  # km or miles
     heart_rate_avg = Column(Integer, nullable=True)
     heart_rate_max = Column(Integer, nullable=True)
@@ -127,7 +128,8 @@ class Exercise(Base):
     user = relationship("User", back_populates="exercises")
 
     __table_args__ = (
-        Index('ix_exercises_user_date', 'user_id', 'exercise_date'),
+        CheckConstraint('intensity BETWEEN 1 AND 10', name='ck_exercises_intensity_range'),
+        Index('ix_exercises_user_date', 'user_id', 'exercise_date', postgresql_include=['duration_minutes']),
         Index('ix_exercises_user_type', 'user_id', 'exercise_type'),
     )
 
@@ -145,7 +147,7 @@ class Sleep(Base):
     rem_sleep_hours = Column(Float, nullable=True)
     light_sleep_hours = Column(Float, nullable=True)
     awake_time_hours = Column(Float, nullable=True)
-    sleep_quality = Column(Integer, nullable=False)  # 1-10 scale
+    sleep_quality = Column(SmallInteger, nullable=False)  # 1-10 scale
     dreams = Column(Text, nullable=True)
     interruptions = Column(Integer, default=0)
     notes = Column(Text, nullable=True)
@@ -156,6 +158,7 @@ class Sleep(Base):
     user = relationship("User", back_populates="sleep_records")
 
     __table_args__ = (
+        CheckConstraint('sleep_quality BETWEEN 1 AND 10', name='ck_sleep_records_sleep_quality_range'),
         Index('ix_sleep_user_date', 'user_id', 'sleep_date'),
     )
 
@@ -171,8 +174,8 @@ class Symptom(Base):
     description = Column(Text, nullable=True)
     started_at = Column(DateTime(timezone=True), nullable=False)
     ended_at = Column(DateTime(timezone=True), nullable=True)
-    triggers = Column(Text, nullable=True)  # JSON string
-    treatments = Column(Text, nullable=True)  # JSON string
+    triggers = Column(StringArray, nullable=True)
+    treatments = Column(StringArray, nullable=True)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -183,4 +186,5 @@ class Symptom(Base):
     __table_args__ = (
         Index('ix_symptoms_user_name', 'user_id', 'symptom_name'),
         Index('ix_symptoms_user_started', 'user_id', 'started_at'),
+        Index('ix_symptoms_triggers_gin', 'triggers', postgresql_using='gin').ddl_if(dialect='postgresql'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Boolean, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -63,7 +63,7 @@ class NotificationLog(Base):
     __tablename__ = "notification_logs"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     notification_type = Column(String, nullable=False)  # email, push, in_app
     category = Column(String, nullable=False)  # briefing, alert, reminder, achievement
@@ -82,6 +82,12 @@ class NotificationLog(Base):
     # Relationships
     user = relationship("User")
 
+    # Newest-first notification listings, with and without a type filter
+    __table_args__ = (
+        Index('ix_notification_logs_user_sent', 'user_id', sent_at.desc()),
+        Index('ix_notification_logs_user_type_sent', 'user_id', 'notification_type', sent_at.desc()),
+    )
+
 
 class DataExport(Base):
     """Track data export requests"""
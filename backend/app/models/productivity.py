@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -48,7 +48,7 @@ class Task(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     parent_task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
     tags = Column(Text, nullable=True)  # JSON string
-    energy_required = Column(Integer, nullable=True)  # 1-10 scale
+    energy_required = Column(SmallInteger, nullable=True)  # 1-10 scale
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -59,6 +59,7 @@ class Task(Base):
     parent_task = relationship("Task", back_populates="subtasks", remote_side=[parent_task_id])
 
     __table_args__ = (
+        CheckConstraint('energy_required BETWEEN 1 AND 10', name='ck_tasks_energy_required_range'),
         Index('ix_tasks_user_status', 'user_id', 'status'),
         Index('ix_tasks_user_priority', 'user_id', 'priority'),
         Index('ix_tasks_user_due', 'user_id', 'due_date'),
@@ -76,12 +77,12 @@ class DeepWorkSession(Base):
     duration_minutes = Column(Integer, nullable=False)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
     project = Column(String, nullable=True)
-    focus_score = Column(Integer, nullable=False)  # 1-10 scale
+    focus_score = Column(SmallInteger, nullable=False)  # 1-10 scale
     interruptions = Column(Integer, default=0)
     context = Column(String, nullable=True)  # Location, tools used, etc.
-    energy_before = Column(Integer, nullable=True)  # 1-10 scale
-    energy_after = Column(Integer, nullable=True)  # 1-10 scale
-    output_quality = Column(Integer, nullable=True)  # 1-10 self-rated
+    energy_before = Column(SmallInteger, nullable=True)  # 1-10 scale
+    energy_after = Column(SmallInteger, nullable=True)  # 1-10 scale
+    output_quality = Column(SmallInteger, nullable=True)  # 1-10 self-rated
     was_planned = Column(Boolean, default=False)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -92,7 +93,12 @@ class DeepWorkSession(Base):
     task = relationship("Task")
 
     __table_args__ = (
-        Index('ix_deep_work_user_date', 'user_id', 'start_time'),
+        CheckConstraint('focus_score BETWEEN 1 AND 10', name='ck_deep_work_sessions_focus_score_range'),
+        CheckConstraint('energy_before BETWEEN 1 AND 10', name='ck_deep_work_sessions_energy_before_range'),
+        CheckConstraint('energy_after BETWEEN 1 AND 10', name='ck_deep_work_sessions_energy_after_range'),
+        CheckConstraint('output_quality BETWEEN 1 AND 10', name='ck_deep_work_sessions_output_quality_range'),
+        Index('ix_deep_work_user_date', 'user_id', 'start_time',
+              postgresql_include=['focus_score', 'duration_minutes']),
     )
 
 
@@ -112,7 +118,7 @@ class ProductivityGoal(Base):
     end_date = Column(DateTime(timezone=True), nullable=True)
     is_active = Column(Boolean, default=True)
     is_completed = Column(Boolean, default=False)
-    priority = Column(Integer, default=3)  # 1-5 scale
+    priority = Column(SmallInteger, default=3)  # 1-5 scale
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -121,6 +127,7 @@ class ProductivityGoal(Base):
     user = relationship("User", back_populates="productivity_goals")
 
     __table_args__ = (
+        CheckConstraint('priority BETWEEN 1 AND 5', name='ck_productivity_goals_priority_range'),
         Index('ix_productivity_goals_user_active', 'user_id', 'is_active'),
         Index('ix_productivity_goals_user_type', 'user_id', 'goal_type'),
     )
@@ -135,7 +142,7 @@ class Distraction(Base):
     description = Column(Text, nullable=False)
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=True)
-    impact = Column(Integer, nullable=False)  # 1-10 scale
+    impact = Column(SmallInteger, nullable=False)  # 1-10 scale
     deep_work_session_id = Column(Integer, ForeignKey("deep_work_sessions.id"), nullable=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
     was_avoidable = Column(Boolean, nullable=True)
@@ -148,6 +155,7 @@ class Distraction(Base):
     task = relationship("Task")
 
     __table_args__ = (
+        CheckConstraint('impact BETWEEN 1 AND 10', name='ck_distractions_impact_range'),
         Index('ix_distractions_user_timestamp', 'user_id', 'timestamp'),
         Index('ix_distractions_user_type', 'user_id', 'distraction_type'),
     )
@@ -164,13 +172,13 @@ class FlowState(Base):
     deep_work_session_id = Column(Integer, ForeignKey("deep_work_sessions.id"), nullable=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
     activity = Column(String, nullable=False)
-    intensity = Column(Integer, nullable=False)  # 1-10 scale
-    challenge_level = Column(Integer, nullable=False)  # 1-10 scale
-    skill_level = Column(Integer, nullable=False)  # 1-10 scale
+    intensity = Column(SmallInteger, nullable=False)  # 1-10 scale
+    challenge_level = Column(SmallInteger, nullable=False)  # 1-10 scale
+    skill_level = Column(SmallInteger, nullable=False)  # 1-10 scale
     conditions = Column(Text, nullable=True)  # JSON string of conditions that led to flow
     triggers = Column(Text, nullable=True)  # What initiated the flow state
     output_description = Column(Text, nullable=True)
-    satisfaction = Column(Integer, nullable=True)  # 1-10 scale
+    satisfaction = Column(SmallInteger, nullable=True)  # 1-10 scale
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -180,6 +188,10 @@ class FlowState(Base):
     task = relationship("Task")
 
     __table_args__ = (
+        CheckConstraint('intensity BETWEEN 1 AND 10', name='ck_flow_states_intensity_range'),
+        CheckConstraint('challenge_level BETWEEN 1 AND 10', name='ck_flow_states_challenge_level_range'),
+        CheckConstraint('skill_level BETWEEN 1 AND 10', name='ck_flow_states_skill_level_range'),
+        CheckConstraint('satisfaction BETWEEN 1 AND 10', name='ck_flow_states_satisfaction_range'),
         Index('ix_flow_states_user_time', 'user_id', 'start_time'),
     )
 
@@ -195,7 +207,7 @@ class Pomodoro(Base):
     duration_minutes = Column(Integer, default=25)
     was_completed = Column(Boolean, default=True)
     was_interrupted = Column(Boolean, default=False)
-    focus_rating = Column(Integer, nullable=True)  # 1-10 scale
+    focus_rating = Column(SmallInteger, nullable=True)  # 1-10 scale
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -204,5 +216,6 @@ class Pomodoro(Base):
     task = relationship("Task")
 
     __table_args__ = (
+        CheckConstraint('focus_rating BETWEEN 1 AND 10', name='ck_pomodoros_focus_rating_range'),
         Index('ix_pomodoros_user_time', 'user_id', 'start_time'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -15,6 +15,11 @@ class MoodEntry(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index('ix_mood_entries_user_created', 'user_id', 'created_at',
+              postgresql_include=['mood_score', 'stress_level', 'energy_level']),
+    )
+
 
 class Activity(Base):
     __tablename__ = "activities"
@@ -40,6 +45,11 @@ class SleepEntry(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index('ix_sleep_entries_user_created', 'user_id', 'created_at',
+              postgresql_include=['sleep_hours', 'sleep_quality']),
+    )
+
 
 class Goal(Base):
     __tablename__ = "goals"
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, ForeignKey, Text, Enum, Index, Boolean, FetchedValue, Computed, CheckConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, attach_updated_at_trigger, elapsed_seconds_sql
+from app.core.partitioning import PARTITIONED, monthly_partitions
+
+
+# Durations are derived from start_time/end_time by the database, never written by clients
+_ELAPSED_SECONDS = elapsed_seconds_sql("start_time", "end_time")
 
 
 class MeetingType(str, enum.Enum):
@@ -39,68 +44,77 @@ class BoundaryType(str, enum.Enum):
 class WorkSession(Base):
     __tablename__ = "work_sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_time = Column(DateTime(timezone=True), nullable=False, index=True, primary_key=PARTITIONED)
     end_time = Column(DateTime(timezone=True), nullable=False)
-    duration_hours = Column(Float, nullable=False)
+    duration_hours = Column(Float, Computed(f"{_ELAPSED_SECONDS} / 3600.0", persisted=True))
     work_type = Column(String, nullable=True)  # coding, meetings, emails, planning, etc.
     project = Column(String, nullable=True)
     is_overtime = Column(Boolean, default=False)
     location = Column(String, nullable=True)  # office, home, hybrid
     breaks_taken = Column(Integer, default=0)
-    productivity_rating = Column(Integer, nullable=True)  # 1-10 scale
-    stress_level = Column(Integer, nullable=True)  # 1-10 scale
+    productivity_rating = Column(SmallInteger, nullable=True)  # 1-10 scale
+    stress_level = Column(SmallInteger, nullable=True)  # 1-10 scale
     notes = Column(Text, nullable=True)
+    source = Column(String, nullable=True)  # None for manual entries, calendar_sync
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     user = relationship("User", back_populates="work_sessions")
 
     __table_args__ = (
-        Index('ix_work_sessions_user_date', 'user_id', 'start_time'),
+        CheckConstraint('productivity_rating BETWEEN 1 AND 10', name='ck_work_sessions_productivity_rating_range'),
+        CheckConstraint('stress_level BETWEEN 1 AND 10', name='ck_work_sessions_stress_level_range'),
+        Index('ix_work_sessions_user_date', 'user_id', 'start_time', postgresql_include=['duration_hours']),
+        Index('ix_work_sessions_user_duration', 'user_id', 'duration_hours'),
+        monthly_partitions("work_sessions", "start_time"),
     )
 
 
 class Meeting(Base):
     __tablename__ = "meetings"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     meeting_type = Column(Enum(MeetingType), nullable=False, index=True)
-    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_time = Column(DateTime(timezone=True), nullable=False, index=True, primary_key=PARTITIONED)
     end_time = Column(DateTime(timezone=True), nullable=False)
-    duration_minutes = Column(Integer, nullable=False)
+    duration_minutes = Column(Integer, Computed(f"CAST(ROUND({_ELAPSED_SECONDS} / 60.0) AS INTEGER)", persisted=True))
     attendees_count = Column(Integer, nullable=True)
     was_productive = Column(Boolean, nullable=True)
     could_have_been_email = Column(Boolean, nullable=True)
-    energy_before = Column(Integer, nullable=True)  # 1-10 scale
-    energy_after = Column(Integer, nullable=True)  # 1-10 scale
+    energy_before = Column(SmallInteger, nullable=True)  # 1-10 scale
+    energy_after = Column(SmallInteger, nullable=True)  # 1-10 scale
     notes = Column(Text, nullable=True)
+    source = Column(String, nullable=True)  # None for manual entries, calendar_sync
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     user = relationship("User", back_populates="meetings")
 
     __table_args__ = (
-        Index('ix_meetings_user_date', 'user_id', 'start_time'),
+        CheckConstraint('energy_before BETWEEN 1 AND 10', name='ck_meetings_energy_before_range'),
+        CheckConstraint('energy_after BETWEEN 1 AND 10', name='ck_meetings_energy_after_range'),
+        Index('ix_meetings_user_date', 'user_id', 'start_time', postgresql_include=['duration_minutes']),
         Index('ix_meetings_user_type', 'user_id', 'meeting_type'),
+        monthly_partitions("meetings", "start_time"),
     )
 
 
 class EnergyLevel(Base):
     __tablename__ = "energy_levels"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
-    energy_score = Column(Integer, nullable=False)  # 1-10 scale
-    mental_clarity = Column(Integer, nullable=True)  # 1-10 scale
-    physical_energy = Column(Integer, nullable=True)  # 1-10 scale
-    emotional_state = Column(Integer, nullable=True)  # 1-10 scale
+    timestamp = Column(DateTime(timezone=True), nullable=False, index=True, primary_key=PARTITIONED)
+    energy_score = Column(SmallInteger, nullable=False)  # 1-10 scale
+    mental_clarity = Column(SmallInteger, nullable=True)  # 1-10 scale
+    physical_energy = Column(SmallInteger, nullable=True)  # 1-10 scale
+    emotional_state = Column(SmallInteger, nullable=True)  # 1-10 scale
     context = Column(String, nullable=True)  # work, personal, social, etc.
     factors = Column(Text, nullable=True)  # JSON string of contributing factors
     notes = Column(Text, nullable=True)
@@ -110,7 +124,12 @@ class EnergyLevel(Base):
     user = relationship("User", back_populates="energy_levels")
 
     __table_args__ = (
+        CheckConstraint('energy_score BETWEEN 1 AND 10', name='ck_energy_levels_energy_score_range'),
+        CheckConstraint('mental_clarity BETWEEN 1 AND 10', name='ck_energy_levels_mental_clarity_range'),
+        CheckConstraint('physical_energy BETWEEN 1 AND 10', name='ck_energy_levels_physical_energy_range'),
+        CheckConstraint('emotional_state BETWEEN 1 AND 10', name='ck_energy_levels_emotional_state_range'),
         Index('ix_energy_levels_user_timestamp', 'user_id', 'timestamp'),
+        monthly_partitions("energy_levels", "timestamp"),
     )
 
 
@@ -124,20 +143,23 @@ class SocialActivity(Base):
     description = Column(Text, nullable=True)
     start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     end_time = Column(DateTime(timezone=True), nullable=False)
-    duration_hours = Column(Float, nullable=False)
+    duration_hours = Column(Float, Computed(f"{_ELAPSED_SECONDS} / 3600.0", persisted=True))
     people_count = Column(Integer, nullable=True)
-    enjoyment_rating = Column(Integer, nullable=True)  # 1-10 scale
-    energy_before = Column(Integer, nullable=True)  # 1-10 scale
-    energy_after = Column(Integer, nullable=True)  # 1-10 scale
+    enjoyment_rating = Column(SmallInteger, nullable=True)  # 1-10 scale
+    energy_before = Column(SmallInteger, nullable=True)  # 1-10 scale
+    energy_after = Column(SmallInteger, nullable=True)  # 1-10 scale
     location = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     user = relationship("User", back_populates="social_activities")
 
     __table_args__ = (
+        CheckConstraint('enjoyment_rating BETWEEN 1 AND 10', name='ck_social_activities_enjoyment_rating_range'),
+        CheckConstraint('energy_before BETWEEN 1 AND 10', name='ck_social_activities_energy_before_range'),
+        CheckConstraint('energy_after BETWEEN 1 AND 10', name='ck_social_activities_energy_after_range'),
         Index('ix_social_activities_user_date', 'user_id', 'start_time'),
         Index('ix_social_activities_user_type', 'user_id', 'activity_type'),
     )
@@ -157,16 +179,17 @@ class Boundary(Base):
     end_date = Column(DateTime(timezone=True), nullable=True)
     success_count = Column(Integer, default=0)  # Times successfully maintained
     violation_count = Column(Integer, default=0)  # Times violated
-    importance = Column(Integer, nullable=False)  # 1-5 scale
+    importance = Column(SmallInteger, nullable=False)  # 1-5 scale
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     user = relationship("User", back_populates="boundaries")
     violations = relationship("BoundaryViolation", back_populates="boundary", cascade="all, delete-orphan")
 
     __table_args__ = (
+        CheckConstraint('importance BETWEEN 1 AND 5', name='ck_boundaries_importance_range'),
         Index('ix_boundaries_user_active', 'user_id', 'is_active'),
         Index('ix_boundaries_user_type', 'user_id', 'boundary_type'),
     )
@@ -179,10 +202,18 @@ class BoundaryViolation(Base):
     boundary_id = Column(Integer, ForeignKey("boundaries.id"), nullable=False, index=True)
     violation_date = Column(DateTime(timezone=True), nullable=False, index=True)
     circumstances = Column(Text, nullable=False)
-    impact = Column(Integer, nullable=False)  # 1-10 scale
+    impact = Column(SmallInteger, nullable=False)  # 1-10 scale
     was_necessary = Column(Boolean, nullable=True)
     lesson_learned = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     boundary = relationship("Boundary", back_populates="violations")
+
+    __table_args__ = (
+        CheckConstraint('impact BETWEEN 1 AND 10', name='ck_boundary_violations_impact_range'),
+    )
+
+
+for _table in (WorkSession.__table__, Meeting.__table__, SocialActivity.__table__, Boundary.__table__):
+    attach_updated_at_trigger(_table)
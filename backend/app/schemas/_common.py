@@ -0,0 +1,58 @@
+"""
+Shared Schema Configuration
+Config and field types reused across the pillar schema modules
+"""
+
+import inspect
+from types import ModuleType
+from typing import Annotated, Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Request schemas build their validators on first use instead of at import
+BASE_CONFIG = ConfigDict(defer_build=True)
+
+# Response schemas are read-only views of ORM rows: immutable and tolerant of extra attributes.
+# Enum fields keep their plain values; every enum here is a str Enum, so comparisons still work
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="ignore", use_enum_values=True)
+
+# Constrained field types shared by every schema that uses them
+Rating1To10 = Annotated[int, Field(ge=1, le=10)]
+OptionalRating1To10 = Annotated[Optional[int], Field(default=None, ge=1, le=10)]
+PositiveInt = Annotated[int, Field(gt=0)]
+OptionalPositiveInt = Annotated[Optional[int], Field(default=None, gt=0)]
+NonNegativeInt = Annotated[int, Field(ge=0)]
+PositiveMinutes = PositiveInt
+
+
+class TrustedORMMixin:
+    """Build response schemas from ORM rows without re-validating them"""
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """
+        Construct the schema from a row the database already constrained.
+        Skips validation entirely; use model_validate for anything user-supplied.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)}
+        )
+
+
+def rebuild_deferred_schemas(*modules: ModuleType) -> int:
+    """
+    Build every deferred schema defined in the given modules.
+    Called once at startup so no request pays the first-use build; returns the count built.
+    """
+    built = 0
+    for module in modules:
+        for _, model in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(model, BaseModel)
+                and model.__module__ == module.__name__
+                and not model.__pydantic_complete__
+            ):
+                model.model_rebuild()
+                built += 1
+    return built
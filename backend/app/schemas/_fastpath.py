@@ -0,0 +1,43 @@
+"""
+Response Fast Path
+Slotted dataclass mirrors of response schemas for serializing trusted ORM rows without pydantic
+"""
+
+from dataclasses import make_dataclass
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from pydantic import BaseModel
+
+
+# schema -> (mirror dataclass, [(field name, default when the row lacks it)])
+_MIRRORS: Dict[Type[BaseModel], Tuple[type, List[Tuple[str, Any]]]] = {}
+
+
+def _mirror(schema: Type[BaseModel]) -> Tuple[type, List[Tuple[str, Any]]]:
+    """Generate (once per schema) a dataclass with exactly the schema's fields"""
+    mirror = _MIRRORS.get(schema)
+    if mirror is None:
+        fields = [
+            (name, None if field.is_required() else field.get_default(call_default_factory=True))
+            for name, field in schema.model_fields.items()
+        ]
+        dataclass = make_dataclass(
+            f"Fast{schema.__name__}",
+            [(name, Any) for name, _ in fields],
+            frozen=True,
+            slots=True,
+        )
+        mirror = _MIRRORS[schema] = (dataclass, fields)
+    return mirror
+
+
+def fast_rows(schema: Type[BaseModel], rows: Iterable[Any]) -> List[Any]:
+    """
+    Copy ORM rows into the schema's dataclass mirror, which orjson serializes natively.
+    Output has the schema's field set but no validation or coercion; read paths only.
+    """
+    dataclass, fields = _mirror(schema)
+    return [
+        dataclass(*[getattr(row, name, default) for name, default in fields])
+        for row in rows
+    ]
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from app.models.analytics import CorrelationStrength, RecommendationPriority, RecommendationStatus
+from app.schemas._common import RESPONSE_CONFIG
 
 
 # Daily Summary Schemas
@@ -35,8 +36,7 @@ class DailySummaryResponse(DailySummaryBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Correlation Schemas
@@ -54,7 +54,7 @@ class CorrelationBase(BaseModel):
     confidence: float = Field(..., ge=0, le=100)
     is_actionable: bool = False
     is_causal: bool = False
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
 
 
 class CorrelationCreate(CorrelationBase):
@@ -67,8 +67,7 @@ class CorrelationResponse(CorrelationBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Recommendation Schemas
@@ -115,8 +114,7 @@ class RecommendationResponse(RecommendationBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Weekly Summary Schemas
@@ -135,8 +133,7 @@ class WeeklySummaryResponse(WeeklySummaryBase):
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Monthly Summary Schemas
@@ -154,5 +151,4 @@ class MonthlySummaryResponse(MonthlySummaryBase):
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
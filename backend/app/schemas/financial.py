@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.financial import TransactionType, TransactionCategory, InvestmentType, DebtType
+from app.schemas._common import RESPONSE_CONFIG
 
 
 # Transaction Schemas
@@ -12,7 +13,7 @@ class TransactionBase(BaseModel):
     description: Optional[str] = None
     transaction_date: datetime
     merchant: Optional[str] = None
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
 
 
 class TransactionCreate(TransactionBase):
@@ -26,7 +27,7 @@ class TransactionUpdate(BaseModel):
     description: Optional[str] = None
     transaction_date: Optional[datetime] = None
     merchant: Optional[str] = None
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
 
 
 class TransactionResponse(TransactionBase):
@@ -35,8 +36,17 @@ class TransactionResponse(TransactionBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+
+class TransactionCategorizeItem(BaseModel):
+    description: str
+    merchant: Optional[str] = None
+    amount: Optional[float] = None
+
+
+class TransactionCategorizeBatch(BaseModel):
+    transactions: List[TransactionCategorizeItem] = Field(..., max_length=10000)
 
 
 # Budget Schemas
@@ -68,8 +78,7 @@ class BudgetResponse(BudgetBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Investment Schemas
@@ -100,8 +109,7 @@ class InvestmentResponse(InvestmentBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Debt Schemas
@@ -137,8 +145,7 @@ class DebtResponse(DebtBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Financial Goal Schemas
@@ -173,5 +180,4 @@ class FinancialGoalResponse(FinancialGoalBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
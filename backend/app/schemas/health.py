@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 from app.models.health import MealType, ExerciseType, SymptomSeverity
+from app.schemas._common import RESPONSE_CONFIG
 
 
 # Nutrition Item Schemas
@@ -27,8 +28,7 @@ class NutritionItemResponse(NutritionItemBase):
     meal_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Meal Schemas
@@ -61,8 +61,7 @@ class MealResponse(MealBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Biometric Schemas
@@ -91,8 +90,7 @@ class BiometricResponse(BiometricBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Exercise Schemas
@@ -119,8 +117,7 @@ class ExerciseResponse(ExerciseBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Sleep Schemas
@@ -155,8 +152,7 @@ class SleepResponse(SleepBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Symptom Schemas
@@ -167,8 +163,8 @@ class SymptomBase(BaseModel):
     description: Optional[str] = None
     started_at: datetime
     ended_at: Optional[datetime] = None
-    triggers: Optional[str] = None
-    treatments: Optional[str] = None
+    triggers: Optional[List[str]] = None
+    treatments: Optional[List[str]] = None
     notes: Optional[str] = None
 
 
@@ -180,7 +176,7 @@ class SymptomUpdate(BaseModel):
     severity: Optional[SymptomSeverity] = None
     ended_at: Optional[datetime] = None
     description: Optional[str] = None
-    treatments: Optional[str] = None
+    treatments: Optional[List[str]] = None
     notes: Optional[str] = None
 
 
@@ -190,5 +186,4 @@ class SymptomResponse(SymptomBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
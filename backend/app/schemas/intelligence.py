@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from app.schemas._common import RESPONSE_CONFIG
 
 
 # Correlation Schemas
@@ -19,8 +20,7 @@ class CorrelationResponse(BaseModel):
     is_significant: bool
     discovered_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Insight Schemas
@@ -38,8 +38,7 @@ class InsightResponse(BaseModel):
     is_read: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Recommendation Schemas
@@ -58,8 +57,7 @@ class RecommendationResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class RecommendationUpdate(BaseModel):
@@ -84,8 +82,7 @@ class PredictionResponse(BaseModel):
     recommendations: Optional[List[str]] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Daily Briefing Schemas
@@ -102,8 +99,7 @@ class DailyBriefingResponse(BaseModel):
     is_viewed: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Weekly Review Schemas
@@ -129,5 +125,4 @@ class WeeklyReviewResponse(BaseModel):
     is_viewed: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
+from app.schemas._common import RESPONSE_CONFIG, TrustedORMMixin
 
 
 # User Preferences Schemas
@@ -78,14 +79,13 @@ class UserPreferencesUpdate(BaseModel):
     custom_goals: Optional[Dict[str, Any]] = None
 
 
-class UserPreferencesResponse(UserPreferencesBase):
+class UserPreferencesResponse(TrustedORMMixin, UserPreferencesBase):
     id: int
     user_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Notification Schemas
@@ -112,8 +112,11 @@ class NotificationResponse(BaseModel):
     read_at: Optional[datetime] = None
     extra_data: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+
+class NotificationReadRequest(BaseModel):
+    notification_ids: list[int] = Field(..., min_length=1, max_length=500)
 
 
 # Export Schemas
@@ -138,8 +141,7 @@ class DataExportResponse(BaseModel):
     expires_at: Optional[datetime] = None
     error_message: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Import Schemas
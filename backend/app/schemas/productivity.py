@@ -2,6 +2,15 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 from app.models.productivity import TaskPriority, TaskStatus, DistractionType
+from app.schemas._common import (
+    BASE_CONFIG,
+    RESPONSE_CONFIG,
+    NonNegativeInt,
+    OptionalRating1To10,
+    PositiveMinutes,
+    Rating1To10,
+    TrustedORMMixin,
+)
 
 
 # Task Schemas
@@ -12,13 +21,15 @@ class TaskBase(BaseModel):
     priority: TaskPriority = TaskPriority.MEDIUM
     project: Optional[str] = None
     category: Optional[str] = None
-    estimated_minutes: Optional[int] = Field(None, gt=0)
+    estimated_minutes: Optional[PositiveMinutes] = None
     due_date: Optional[datetime] = None
     parent_task_id: Optional[int] = None
     tags: Optional[str] = None
-    energy_required: Optional[int] = Field(None, ge=1, le=10)
+    energy_required: OptionalRating1To10
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class TaskCreate(TaskBase):
     pass
@@ -30,12 +41,14 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     project: Optional[str] = None
-    actual_minutes: Optional[int] = Field(None, gt=0)
+    actual_minutes: Optional[PositiveMinutes] = None
     due_date: Optional[datetime] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
-class TaskResponse(TaskBase):
+class TaskResponse(TrustedORMMixin, TaskBase):
     id: int
     user_id: int
     actual_minutes: Optional[int] = None
@@ -43,39 +56,39 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Deep Work Session Schemas
 class DeepWorkSessionBase(BaseModel):
     start_time: datetime
     end_time: datetime
-    duration_minutes: int = Field(..., gt=0)
+    duration_minutes: PositiveMinutes
     task_id: Optional[int] = None
     project: Optional[str] = None
-    focus_score: int = Field(..., ge=1, le=10)
-    interruptions: int = Field(default=0, ge=0)
+    focus_score: Rating1To10
+    interruptions: NonNegativeInt = 0
     context: Optional[str] = None
-    energy_before: Optional[int] = Field(None, ge=1, le=10)
-    energy_after: Optional[int] = Field(None, ge=1, le=10)
-    output_quality: Optional[int] = Field(None, ge=1, le=10)
+    energy_before: OptionalRating1To10
+    energy_after: OptionalRating1To10
+    output_quality: OptionalRating1To10
     was_planned: bool = False
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class DeepWorkSessionCreate(DeepWorkSessionBase):
     pass
 
 
-class DeepWorkSessionResponse(DeepWorkSessionBase):
+class DeepWorkSessionResponse(TrustedORMMixin, DeepWorkSessionBase):
     id: int
     user_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Productivity Goal Schemas
@@ -91,6 +104,8 @@ class ProductivityGoalBase(BaseModel):
     priority: int = Field(default=3, ge=1, le=5)
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class ProductivityGoalCreate(ProductivityGoalBase):
     pass
@@ -105,8 +120,10 @@ class ProductivityGoalUpdate(BaseModel):
     is_completed: Optional[bool] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
 
-class ProductivityGoalResponse(ProductivityGoalBase):
+
+class ProductivityGoalResponse(TrustedORMMixin, ProductivityGoalBase):
     id: int
     user_id: int
     current_value: float
@@ -115,8 +132,7 @@ class ProductivityGoalResponse(ProductivityGoalBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Distraction Schemas
@@ -124,56 +140,58 @@ class DistractionBase(BaseModel):
     distraction_type: DistractionType
     description: str
     timestamp: datetime
-    duration_minutes: Optional[int] = Field(None, gt=0)
-    impact: int = Field(..., ge=1, le=10)
+    duration_minutes: Optional[PositiveMinutes] = None
+    impact: Rating1To10
     deep_work_session_id: Optional[int] = None
     task_id: Optional[int] = None
     was_avoidable: Optional[bool] = None
     prevention_strategy: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class DistractionCreate(DistractionBase):
     pass
 
 
-class DistractionResponse(DistractionBase):
+class DistractionResponse(TrustedORMMixin, DistractionBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Flow State Schemas
 class FlowStateBase(BaseModel):
     start_time: datetime
     end_time: datetime
-    duration_minutes: int = Field(..., gt=0)
+    duration_minutes: PositiveMinutes
     deep_work_session_id: Optional[int] = None
     task_id: Optional[int] = None
     activity: str
-    intensity: int = Field(..., ge=1, le=10)
-    challenge_level: int = Field(..., ge=1, le=10)
-    skill_level: int = Field(..., ge=1, le=10)
+    intensity: Rating1To10
+    challenge_level: Rating1To10
+    skill_level: Rating1To10
     conditions: Optional[str] = None
     triggers: Optional[str] = None
     output_description: Optional[str] = None
-    satisfaction: Optional[int] = Field(None, ge=1, le=10)
+    satisfaction: OptionalRating1To10
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class FlowStateCreate(FlowStateBase):
     pass
 
 
-class FlowStateResponse(FlowStateBase):
+class FlowStateResponse(TrustedORMMixin, FlowStateBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Pomodoro Schemas
@@ -181,21 +199,22 @@ class PomodoroBase(BaseModel):
     task_id: Optional[int] = None
     start_time: datetime
     end_time: datetime
-    duration_minutes: int = Field(default=25, gt=0)
+    duration_minutes: PositiveMinutes = 25
     was_completed: bool = True
     was_interrupted: bool = False
-    focus_rating: Optional[int] = Field(None, ge=1, le=10)
+    focus_rating: OptionalRating1To10
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class PomodoroCreate(PomodoroBase):
     pass
 
 
-class PomodoroResponse(PomodoroBase):
+class PomodoroResponse(TrustedORMMixin, PomodoroBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
+from app.schemas._common import BASE_CONFIG, RESPONSE_CONFIG, TrustedORMMixin
 
 
 class MoodEntryBase(BaseModel):
@@ -9,18 +10,19 @@ class MoodEntryBase(BaseModel):
     stress_level: int
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class MoodEntryCreate(MoodEntryBase):
     pass
 
 
-class MoodEntryResponse(MoodEntryBase):
+class MoodEntryResponse(TrustedORMMixin, MoodEntryBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ActivityBase(BaseModel):
@@ -29,18 +31,19 @@ class ActivityBase(BaseModel):
     intensity: Optional[str] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class ActivityCreate(ActivityBase):
     pass
 
 
-class ActivityResponse(ActivityBase):
+class ActivityResponse(TrustedORMMixin, ActivityBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class SleepEntryBase(BaseModel):
@@ -50,18 +53,19 @@ class SleepEntryBase(BaseModel):
     wake_time: Optional[datetime] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class SleepEntryCreate(SleepEntryBase):
     pass
 
 
-class SleepEntryResponse(SleepEntryBase):
+class SleepEntryResponse(TrustedORMMixin, SleepEntryBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class GoalBase(BaseModel):
@@ -69,6 +73,8 @@ class GoalBase(BaseModel):
     description: Optional[str] = None
     target_date: Optional[datetime] = None
 
+    model_config = BASE_CONFIG
+
 
 class GoalCreate(GoalBase):
     pass
@@ -80,12 +86,13 @@ class GoalUpdate(BaseModel):
     target_date: Optional[datetime] = None
     is_completed: Optional[int] = None
 
+    model_config = BASE_CONFIG
+
 
-class GoalResponse(GoalBase):
+class GoalResponse(TrustedORMMixin, GoalBase):
     id: int
     user_id: int
     is_completed: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
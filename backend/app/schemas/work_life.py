@@ -1,36 +1,52 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 from datetime import datetime
 from app.models.work_life import MeetingType, SocialActivityType, BoundaryType
+from app.schemas._common import (
+    BASE_CONFIG,
+    RESPONSE_CONFIG,
+    NonNegativeInt,
+    OptionalPositiveInt,
+    OptionalRating1To10,
+    Rating1To10,
+    TrustedORMMixin,
+)
 
 
 # Work Session Schemas
 class WorkSessionBase(BaseModel):
     start_time: datetime
     end_time: datetime
-    duration_hours: float = Field(..., gt=0)
     work_type: Optional[str] = None
     project: Optional[str] = None
     is_overtime: bool = False
     location: Optional[str] = None
-    breaks_taken: int = Field(default=0, ge=0)
-    productivity_rating: Optional[int] = Field(None, ge=1, le=10)
-    stress_level: Optional[int] = Field(None, ge=1, le=10)
+    breaks_taken: NonNegativeInt = 0
+    productivity_rating: OptionalRating1To10
+    stress_level: OptionalRating1To10
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
+    @model_validator(mode="after")
+    def check_time_range(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
 
 class WorkSessionCreate(WorkSessionBase):
     pass
 
 
-class WorkSessionResponse(WorkSessionBase):
+class WorkSessionResponse(TrustedORMMixin, WorkSessionBase):
     id: int
     user_id: int
+    duration_hours: float
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Meeting Schemas
@@ -39,52 +55,60 @@ class MeetingBase(BaseModel):
     meeting_type: MeetingType
     start_time: datetime
     end_time: datetime
-    duration_minutes: int = Field(..., gt=0)
-    attendees_count: Optional[int] = Field(None, gt=0)
+    attendees_count: OptionalPositiveInt
     was_productive: Optional[bool] = None
     could_have_been_email: Optional[bool] = None
-    energy_before: Optional[int] = Field(None, ge=1, le=10)
-    energy_after: Optional[int] = Field(None, ge=1, le=10)
+    energy_before: OptionalRating1To10
+    energy_after: OptionalRating1To10
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
+    @model_validator(mode="after")
+    def check_time_range(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
 
 class MeetingCreate(MeetingBase):
     pass
 
 
-class MeetingResponse(MeetingBase):
+class MeetingResponse(TrustedORMMixin, MeetingBase):
     id: int
     user_id: int
+    duration_minutes: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Energy Level Schemas
 class EnergyLevelBase(BaseModel):
     timestamp: datetime
-    energy_score: int = Field(..., ge=1, le=10)
-    mental_clarity: Optional[int] = Field(None, ge=1, le=10)
-    physical_energy: Optional[int] = Field(None, ge=1, le=10)
-    emotional_state: Optional[int] = Field(None, ge=1, le=10)
+    energy_score: Rating1To10
+    mental_clarity: OptionalRating1To10
+    physical_energy: OptionalRating1To10
+    emotional_state: OptionalRating1To10
     context: Optional[str] = None
     factors: Optional[str] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class EnergyLevelCreate(EnergyLevelBase):
     pass
 
 
-class EnergyLevelResponse(EnergyLevelBase):
+class EnergyLevelResponse(TrustedORMMixin, EnergyLevelBase):
     id: int
     user_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Social Activity Schemas
@@ -94,27 +118,34 @@ class SocialActivityBase(BaseModel):
     description: Optional[str] = None
     start_time: datetime
     end_time: datetime
-    duration_hours: float = Field(..., gt=0)
-    people_count: Optional[int] = Field(None, gt=0)
-    enjoyment_rating: Optional[int] = Field(None, ge=1, le=10)
-    energy_before: Optional[int] = Field(None, ge=1, le=10)
-    energy_after: Optional[int] = Field(None, ge=1, le=10)
+    people_count: OptionalPositiveInt
+    enjoyment_rating: OptionalRating1To10
+    energy_before: OptionalRating1To10
+    energy_after: OptionalRating1To10
     location: Optional[str] = None
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
+    @model_validator(mode="after")
+    def check_time_range(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
 
 class SocialActivityCreate(SocialActivityBase):
     pass
 
 
-class SocialActivityResponse(SocialActivityBase):
+class SocialActivityResponse(TrustedORMMixin, SocialActivityBase):
     id: int
     user_id: int
+    duration_hours: float
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Boundary Schemas
@@ -128,6 +159,8 @@ class BoundaryBase(BaseModel):
     importance: int = Field(..., ge=1, le=5)
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class BoundaryCreate(BoundaryBase):
     pass
@@ -141,8 +174,10 @@ class BoundaryUpdate(BaseModel):
     importance: Optional[int] = Field(None, ge=1, le=5)
     notes: Optional[str] = None
 
+    model_config = BASE_CONFIG
 
-class BoundaryResponse(BoundaryBase):
+
+class BoundaryResponse(TrustedORMMixin, BoundaryBase):
     id: int
     user_id: int
     is_active: bool
@@ -151,27 +186,27 @@ class BoundaryResponse(BoundaryBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Boundary Violation Schemas
 class BoundaryViolationBase(BaseModel):
     violation_date: datetime
     circumstances: str
-    impact: int = Field(..., ge=1, le=10)
+    impact: Rating1To10
     was_necessary: Optional[bool] = None
     lesson_learned: Optional[str] = None
 
+    model_config = BASE_CONFIG
+
 
 class BoundaryViolationCreate(BoundaryViolationBase):
     boundary_id: int
 
 
-class BoundaryViolationResponse(BoundaryViolationBase):
+class BoundaryViolationResponse(TrustedORMMixin, BoundaryViolationBase):
     id: int
     boundary_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
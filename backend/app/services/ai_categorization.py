@@ -3,74 +3,120 @@ AI-powered transaction categorization service.
 Uses pattern matching and machine learning to automatically categorize transactions.
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, NamedTuple, Sequence, Tuple
 from app.models.financial import TransactionCategory
+import array
+import functools
+import heapq
+import numpy as np
+import operator
 import re
+import threading
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _trie_alternation(words) -> str:
+    """
+    Regex alternation of literal words factored by shared prefix ("gas(?: utility)?").
+    Branches at each node start with distinct characters, so the engine follows one
+    path instead of retrying every word, and greedy optionals still prefer the longest word.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+def _prepare_text(description: str, merchant: Optional[str]) -> str:
+    """Lowercased description + merchant, the text every keyword scan runs over"""
+    return f"{description} {merchant or ''}".lower()
+
+
+class CategorySuggestion(NamedTuple):
+    """A suggested category and its share of the top suggestions' keyword matches"""
+    category: TransactionCategory
+    confidence: float
 
 
 class TransactionCategorizer:
     """AI-powered transaction categorization using pattern matching and ML"""
 
-    # Keyword patterns for each category
-    CATEGORY_PATTERNS = {
+    # Whole-word keywords for each category; a keyword may appear under several
+    CATEGORY_KEYWORDS = {
         TransactionCategory.SALARY: [
-            r'\bsalary\b', r'\bpayroll\b', r'\bwage\b', r'\bincome\b',
-            r'\bemployer\b', r'\bpaycheck\b'
+            'salary', 'payroll', 'wage', 'income',
+            'employer', 'paycheck'
         ],
         TransactionCategory.FREELANCE: [
-            r'\bfreelance\b', r'\bconsulting\b', r'\bcontract\b',
-            r'\bgig\b', r'\bupwork\b', r'\bfiverr\b'
+            'freelance', 'consulting', 'contract',
+            'gig', 'upwork', 'fiverr'
         ],
         TransactionCategory.INVESTMENT_INCOME: [
-            r'\bdividend\b', r'\binterest\b', r'\bcapital gains\b',
-            r'\breturn\b', r'\binvestment\b', r'\bstock\b', r'\bbond\b'
+            'dividend', 'interest', 'capital gains',
+            'return', 'investment', 'stock', 'bond'
         ],
         TransactionCategory.HOUSING: [
-            r'\brent\b', r'\bmortgage\b', r'\bhousing\b', r'\bapartment\b',
-            r'\blease\b', r'\bhoa\b', r'\bproperty\b', r'\blandlord\b'
+            'rent', 'mortgage', 'housing', 'apartment',
+            'lease', 'hoa', 'property', 'landlord'
         ],
         TransactionCategory.TRANSPORTATION: [
-            r'\buber\b', r'\blyft\b', r'\btaxi\b', r'\bgas\b', r'\bfuel\b',
-            r'\bparking\b', r'\btransit\b', r'\bsubway\b', r'\bbus\b',
-            r'\btrain\b', r'\bcar payment\b', r'\bauto\b'
+            'uber', 'lyft', 'taxi', 'gas', 'fuel',
+            'parking', 'transit', 'subway', 'bus',
+            'train', 'car payment', 'auto'
         ],
         TransactionCategory.FOOD: [
-            r'\brestaurant\b', r'\bgrocery\b', r'\bfood\b', r'\bcafe\b',
-            r'\bcoffee\b', r'\bstarbucks\b', r'\bmcdonald\b', r'\bpizza\b',
-            r'\bwhole foods\b', r'\bsafeway\b', r'\bkroger\b', r'\bwholesome\b'
+            'restaurant', 'grocery', 'food', 'cafe',
+            'coffee', 'starbucks', 'mcdonald', 'pizza',
+            'whole foods', 'safeway', 'kroger', 'wholesome'
         ],
         TransactionCategory.UTILITIES: [
-            r'\belectric\b', r'\bwater\b', r'\bgas utility\b', r'\binternet\b',
-            r'\bphone\b', r'\bcable\b', r'\butility\b', r'\bcomcast\b',
-            r'\bat&t\b', r'\bverizon\b', r'\bt-mobile\b'
+            'electric', 'water', 'gas utility', 'internet',
+            'phone', 'cable', 'utility', 'comcast',
+            'at&t', 'verizon', 't-mobile'
         ],
         TransactionCategory.HEALTHCARE: [
-            r'\bdoctor\b', r'\bhospital\b', r'\bmedical\b', r'\bpharmacy\b',
-            r'\bhealth\b', r'\binsurance\b', r'\bdental\b', r'\bcvs\b',
-            r'\bwalgreens\b', r'\bclinic\b'
+            'doctor', 'hospital', 'medical', 'pharmacy',
+            'health', 'insurance', 'dental', 'cvs',
+            'walgreens', 'clinic'
         ],
         TransactionCategory.ENTERTAINMENT: [
-            r'\bmovie\b', r'\bnetflix\b', r'\bspotify\b', r'\bgaming\b',
-            r'\bconcert\b', r'\btheater\b', r'\bbar\b', r'\bclub\b',
-            r'\bentertainment\b', r'\bhulu\b', r'\bdisney\b'
+            'movie', 'netflix', 'spotify', 'gaming',
+            'concert', 'theater', 'bar', 'club',
+            'entertainment', 'hulu', 'disney'
         ],
         TransactionCategory.SHOPPING: [
-            r'\bamazon\b', r'\btarget\b', r'\bwalmart\b', r'\bclothing\b',
-            r'\bshop\b', r'\bretail\b', r'\bmall\b', r'\bstore\b',
-            r'\bebay\b', r'\bbestbuy\b'
+            'amazon', 'target', 'walmart', 'clothing',
+            'shop', 'retail', 'mall', 'store',
+            'ebay', 'bestbuy'
         ],
         TransactionCategory.EDUCATION: [
-            r'\btuition\b', r'\bschool\b', r'\bcollege\b', r'\buniversity\b',
-            r'\bcourse\b', r'\bbook\b', r'\beducation\b', r'\btraining\b',
-            r'\budemy\b', r'\bcoursera\b'
+            'tuition', 'school', 'college', 'university',
+            'course', 'book', 'education', 'training',
+            'udemy', 'coursera'
         ],
         TransactionCategory.DEBT_PAYMENT: [
-            r'\bloan payment\b', r'\bdebt\b', r'\bcredit card payment\b',
-            r'\bpayment\b', r'\bmortgage payment\b', r'\bstudent loan\b'
+            'loan payment', 'debt', 'credit card payment',
+            'payment', 'mortgage payment', 'student loan'
         ],
         TransactionCategory.SAVINGS: [
-            r'\bsavings\b', r'\btransfer to savings\b', r'\binvestment\b',
-            r'\bretirement\b', r'\b401k\b', r'\bira\b', r'\broth\b'
+            'savings', 'transfer to savings', 'investment',
+            'retirement', '401k', 'ira', 'roth'
         ],
     }
 
@@ -104,12 +150,88 @@ class TransactionCategorizer:
     }
 
     def __init__(self):
-        """Initialize the categorizer with compiled regex patterns"""
-        self.compiled_patterns = {}
-        for category, patterns in self.CATEGORY_PATTERNS.items():
-            self.compiled_patterns[category] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in patterns
+        """Initialize the categorizer with a single keyword scanner"""
+        self.categories = list(self.CATEGORY_KEYWORDS)
+        self.category_index = {category: index for index, category in enumerate(self.categories)}
+        self.category_count = len(self.categories)
+
+        # Inverted index: one keyword hit counts once for every category listing it
+        self.keyword_categories: Dict[str, List[TransactionCategory]] = {}
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
+            for keyword in keywords:
+                self.keyword_categories.setdefault(keyword, []).append(category)
+        self.keyword_columns = {
+            keyword: [self.category_index[category] for category in categories]
+            for keyword, categories in self.keyword_categories.items()
+        }
+
+        # A keyword that begins another at a word boundary ("gas" in "gas utility")
+        # matches wherever the longer one does
+        self.keyword_prefixes = {
+            keyword: [
+                other for other in self.keyword_categories
+                if other != keyword
+                and keyword.startswith(other)
+                and _is_word_char(other[-1]) != _is_word_char(keyword[len(other)])
             ]
+            for keyword in self.keyword_categories
+        }
+
+        # Zero-width lookahead finds keywords at every word start in one pass, including
+        # overlapping ones; the prefix-factored alternation picks the longest keyword per
+        # position. The leading \b rejects mid-word positions before any alternative is
+        # tried, and callers pass lowercased text so the scan runs case-sensitively.
+        alternation = _trie_alternation(self.keyword_categories)
+        self.keyword_scanner = re.compile(rf"\b(?=({alternation})\b)")
+
+        # Merchant names match as plain substrings; each maps to the first category
+        # listing it, and the earliest such category wins, as in MERCHANT_PATTERNS order
+        self.merchant_categories: Dict[str, TransactionCategory] = {}
+        for category, merchants in self.MERCHANT_PATTERNS.items():
+            for name in merchants:
+                self.merchant_categories.setdefault(name, category)
+        merchant_order = {category: rank for rank, category in enumerate(self.MERCHANT_PATTERNS)}
+        self.merchant_rank = {name: merchant_order[category] for name, category in self.merchant_categories.items()}
+        self.merchant_prefixes = {
+            name: [other for other in self.merchant_categories if other != name and name.startswith(other)]
+            for name in self.merchant_categories
+        }
+        merchant_alternation = _trie_alternation(self.merchant_categories)
+        self.merchant_scanner = re.compile(f"(?=({merchant_alternation}))")
+
+        # Recurring transactions (subscriptions, paychecks) repeat the same inputs;
+        # cached per instance so cache_clear() only affects this categorizer
+        self._categorize_cached = functools.lru_cache(maxsize=10_000)(self._categorize_text)
+
+    def cache_clear(self):
+        """Forget cached categorizations, e.g. after the categorization rules change"""
+        self._categorize_cached.cache_clear()
+
+    def _score_array(self, text: str) -> Optional[array.array]:
+        """
+        Number of distinct keywords matched per category, indexed like self.categories
+        (text must be lowercase); None when nothing matches.
+        """
+        matched = set(self.keyword_scanner.findall(text))
+        if not matched:
+            return None
+        for keyword in list(matched):
+            matched.update(self.keyword_prefixes[keyword])
+
+        counts = array.array('i', [0]) * self.category_count
+        for keyword in matched:
+            for index in self.keyword_columns[keyword]:
+                counts[index] += 1
+        return counts
+
+    def _score_categories(self, text: str) -> Dict[TransactionCategory, int]:
+        """Non-zero keyword counts per category, in category order (text must be lowercase)"""
+        counts = self._score_array(text)
+        if counts is None:
+            return {}
+
+        # Category order keeps max()/sorted() tie-breaking stable
+        return {self.categories[index]: count for index, count in enumerate(counts) if count}
 
     def categorize(
         self,
@@ -128,29 +250,133 @@ class TransactionCategorizer:
         Returns:
             Predicted transaction category
         """
+        return self.categorize_with_confidence(description, merchant, amount)[0]
+
+    def categorize_with_confidence(
+        self,
+        description: str,
+        merchant: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> Tuple[TransactionCategory, float]:
+        """
+        Categorize a transaction and score the prediction in one pass.
+        Equivalent to categorize() followed by get_confidence_score(), without rescanning.
+        """
         # Combine description and merchant for better matching
-        text = f"{description} {merchant or ''}".lower()
+        text = _prepare_text(description, merchant)
+
+        # Only the > 1000 threshold of the amount affects the result
+        return self._categorize_cached(text, (merchant or "").lower(), bool(amount and amount > 1000))
 
+    def _categorize_text(
+        self,
+        text: str,
+        merchant_lower: str,
+        large_amount: bool
+    ) -> Tuple[TransactionCategory, float]:
+        """Category and confidence for lowercased description+merchant text"""
         # First, try merchant-based categorization (fastest and most accurate)
-        if merchant:
-            merchant_lower = merchant.lower()
-            for category, merchants in self.MERCHANT_PATTERNS.items():
-                if any(m in merchant_lower for m in merchants):
-                    return category
+        merchant_category = self._merchant_category(merchant_lower)
+        if merchant_category is not None:
+            return merchant_category, 0.95
 
         # Score each category based on pattern matches
-        scores = {}
-        for category, patterns in self.compiled_patterns.items():
-            score = sum(1 for pattern in patterns if pattern.search(text))
-            if score > 0:
-                scores[category] = score
-
-        # Return the category with the highest score
-        if scores:
-            return max(scores, key=scores.get)
-
-        # Default categorization based on transaction type heuristics
-        if amount and amount > 1000:
+        counts = self._score_array(text)
+
+        # Return category with highest score; max() keeps the first on ties
+        if counts is not None:
+            best = max(range(self.category_count), key=counts.__getitem__)
+            return self.categories[best], self._match_confidence(counts[best])
+
+        return self._fallback_category(text, large_amount), self._match_confidence(0)
+
+    def _score_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        (rows x categories) keyword counts for many lowercased texts; row i equals
+        _score_categories(texts[i]) laid out in category order.
+
+        All texts are joined with a separator and scanned once; each keyword hit is
+        mapped back to its row by offset.
+        """
+        rows = len(texts)
+
+        # \x1f is a non-word character, so keywords can never span two rows
+        joined = "\x1f".join(texts)
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=rows)
+        row_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        score_rows, score_columns = [], []
+        hits = [(match.start(), match.group(1)) for match in self.keyword_scanner.finditer(joined)]
+        if hits:
+            positions = np.fromiter((position for position, _ in hits), dtype=np.int64, count=len(hits))
+            hit_rows = np.searchsorted(row_starts, positions, side="right") - 1
+
+            matched = set(zip(hit_rows.tolist(), (keyword for _, keyword in hits)))
+            for row, keyword in list(matched):
+                matched.update((row, prefix) for prefix in self.keyword_prefixes[keyword])
+
+            for row, keyword in matched:
+                for index in self.keyword_columns[keyword]:
+                    score_rows.append(row)
+                    score_columns.append(index)
+
+        scores = np.zeros((rows, len(self.categories)), dtype=np.int16)
+        np.add.at(scores, (score_rows, score_columns), 1)
+        return scores
+
+    def categorize_batch(
+        self,
+        descriptions: Sequence[str],
+        merchants: Sequence[Optional[str]],
+        amounts: Sequence[Optional[float]],
+    ) -> List[TransactionCategory]:
+        """
+        Categorize many transactions at once; equivalent to calling categorize() per row.
+        The per-row winner is an argmax over one batch score matrix.
+        """
+        rows = len(descriptions)
+        if rows == 0:
+            return []
+
+        texts = [_prepare_text(description, merchant) for description, merchant in zip(descriptions, merchants)]
+        scores = self._score_matrix(texts)
+
+        # argmax returns the first maximum, matching max() over category order
+        best = scores.argmax(axis=1)
+        has_match = scores.max(axis=1) > 0
+
+        # Statements repeat a handful of merchants; scan each distinct name once
+        merchant_categories = {merchant: self._merchant_category(merchant) for merchant in set(merchants)}
+
+        results = []
+        for row in range(rows):
+            merchant_category = merchant_categories[merchants[row]]
+            if merchant_category is not None:
+                results.append(merchant_category)
+            elif has_match[row]:
+                results.append(self.categories[best[row]])
+            else:
+                amount = amounts[row]
+                results.append(self._fallback_category(texts[row], bool(amount and amount > 1000)))
+        return results
+
+    def _merchant_category(self, merchant: Optional[str]) -> Optional[TransactionCategory]:
+        """Category of the first known merchant name found in merchant, if any"""
+        if not merchant:
+            return None
+
+        # The lookahead reports the longest name starting at each position; shorter
+        # names starting there are its prefixes
+        found = set(self.merchant_scanner.findall(merchant.lower()))
+        if not found:
+            return None
+        for name in list(found):
+            found.update(self.merchant_prefixes[name])
+        return self.merchant_categories[min(found, key=self.merchant_rank.__getitem__)]
+
+    def _fallback_category(self, text: str, large_amount: bool) -> TransactionCategory:
+        """Heuristic category when no keyword matches"""
+        if large_amount:
             # Large amounts are more likely to be housing, salary, or debt
             if any(word in text for word in ['transfer', 'deposit']):
                 return TransactionCategory.SALARY
@@ -163,15 +389,17 @@ class TransactionCategorizer:
         self,
         description: str,
         merchant: Optional[str] = None,
-        predicted_category: TransactionCategory = None
+        predicted_category: TransactionCategory = None,
+        _prepared_text: Optional[str] = None
     ) -> float:
         """
         Calculate confidence score for the categorization (0-1).
+        Pass _prepared_text when the caller already has _prepare_text(description, merchant).
 
         Returns:
             Confidence score between 0 and 1
         """
-        text = f"{description} {merchant or ''}".lower()
+        text = _prepared_text if _prepared_text is not None else _prepare_text(description, merchant)
 
         # Check merchant match (highest confidence)
         if merchant:
@@ -182,54 +410,88 @@ class TransactionCategorizer:
                         return 0.95
 
         # Check pattern matches
-        if predicted_category in self.compiled_patterns:
-            patterns = self.compiled_patterns[predicted_category]
-            matches = sum(1 for pattern in patterns if pattern.search(text))
-            if matches >= 3:
-                return 0.90
-            elif matches == 2:
-                return 0.75
-            elif matches == 1:
-                return 0.60
+        if predicted_category in self.CATEGORY_KEYWORDS:
+            return self._match_confidence(self._score_categories(text).get(predicted_category, 0))
+
+        return self._match_confidence(0)
 
+    @staticmethod
+    def _match_confidence(matches: int) -> float:
+        """Confidence for a category predicted from this many keyword matches"""
+        if matches >= 3:
+            return 0.90
+        elif matches == 2:
+            return 0.75
+        elif matches == 1:
+            return 0.60
         return 0.40
 
     def suggest_categories(
         self,
         description: str,
         merchant: Optional[str] = None,
-        top_k: int = 3
-    ) -> List[Dict[str, any]]:
+        top_k: int = 3,
+        _prepared_text: Optional[str] = None
+    ) -> List[CategorySuggestion]:
         """
         Get top K category suggestions with confidence scores.
+        Pass _prepared_text when the caller already has _prepare_text(description, merchant).
 
         Returns:
-            List of dicts with 'category' and 'confidence' keys
+            List of CategorySuggestion (category, confidence) tuples
         """
-        text = f"{description} {merchant or ''}".lower()
-        scores = {}
+        text = _prepared_text if _prepared_text is not None else _prepare_text(description, merchant)
 
         # Score all categories
-        for category, patterns in self.compiled_patterns.items():
-            score = sum(1 for pattern in patterns if pattern.search(text))
-            if score > 0:
-                scores[category] = score
+        scores = self._score_categories(text)
 
-        # Sort by score and get top K
-        sorted_categories = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # Top K by score; nlargest keeps category order among ties, like a stable sort
+        sorted_categories = heapq.nlargest(top_k, scores.items(), key=operator.itemgetter(1))
 
         # Convert to confidence scores
         total_score = sum(score for _, score in sorted_categories)
         results = []
         for category, score in sorted_categories:
             confidence = score / total_score if total_score > 0 else 0
-            results.append({
-                'category': category,
-                'confidence': round(confidence, 2)
-            })
+            results.append(CategorySuggestion(category, round(confidence, 2)))
 
         return results
 
+    def suggest_categories_batch(
+        self,
+        descriptions: Sequence[str],
+        merchants: Sequence[Optional[str]],
+        top_k: int = 3
+    ) -> List[List[CategorySuggestion]]:
+        """
+        Top K suggestions for many transactions at once; equivalent to calling
+        suggest_categories() per row, with ranking and confidences computed over
+        the whole batch score matrix.
+        """
+        if len(descriptions) == 0 or top_k <= 0:
+            return [[] for _ in descriptions]
+
+        texts = [_prepare_text(description, merchant) for description, merchant in zip(descriptions, merchants)]
+        scores = self._score_matrix(texts)
+        top_k = min(top_k, scores.shape[1])
+
+        # A stable sort keeps category order among ties, as sorted() does per row
+        top_indices = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+        top_scores = np.take_along_axis(scores, top_indices, axis=1)
+        totals = top_scores.sum(axis=1, keepdims=True)
+        confidences = top_scores / np.where(totals == 0, 1, totals)
+
+        results = []
+        for indices, row_scores, row_confidences in zip(
+            top_indices.tolist(), top_scores.tolist(), confidences.tolist()
+        ):
+            results.append([
+                CategorySuggestion(self.categories[index], round(confidence, 2))
+                for index, score, confidence in zip(indices, row_scores, row_confidences)
+                if score > 0
+            ])
+        return results
+
     def learn_from_correction(
         self,
         description: str,
@@ -247,16 +509,22 @@ class TransactionCategorizer:
         """
         # TODO: Implement ML model training
         # For now, this is a placeholder that could log corrections
-        pass
+
+        # Once corrections update the rules, cached predictions are stale
+        self.cache_clear()
 
 
-# Singleton instance
+# Singleton instance, built on first use (scanner compilation is not free)
 _categorizer = None
+_categorizer_lock = threading.Lock()
 
 
 def get_categorizer() -> TransactionCategorizer:
     """Get or create the singleton categorizer instance"""
     global _categorizer
     if _categorizer is None:
-        _categorizer = TransactionCategorizer()
+        # Sync endpoints run in a threadpool; only one thread may build the instance
+        with _categorizer_lock:
+            if _categorizer is None:
+                _categorizer = TransactionCategorizer()
     return _categorizer
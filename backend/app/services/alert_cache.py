@@ -0,0 +1,35 @@
+"""
+Alert Fingerprint Cache
+Per-process record of the alert digests each user was sent within the repeat window
+"""
+
+import hashlib
+import threading
+
+from cachetools import TTLCache
+
+
+# Matches the notification service's repeat window; the notification log stays the
+# source of truth for sends from other worker processes
+ALERT_REPEAT_HOURS = 24
+
+_RECENT_ALERTS: TTLCache = TTLCache(maxsize=50_000, ttl=ALERT_REPEAT_HOURS * 3600)
+_lock = threading.Lock()
+
+
+def alert_fingerprint(title: str, message: str) -> str:
+    """Short digest of an alert's text, ignoring whitespace differences"""
+    normalized = " ".join(message.split())
+    return hashlib.blake2b(f"{title}|{normalized}".encode(), digest_size=8).hexdigest()
+
+
+def was_alert_sent(user_id: int, fingerprint: str) -> bool:
+    """Whether this process sent the user this alert within the repeat window"""
+    with _lock:
+        return (user_id, fingerprint) in _RECENT_ALERTS
+
+
+def remember_alert(user_id: int, fingerprint: str):
+    """Record an alert as sent (or found in the log) for the repeat window"""
+    with _lock:
+        _RECENT_ALERTS[(user_id, fingerprint)] = True
@@ -3,13 +3,53 @@ Calendar Integration Service
 Handles integration with calendar providers (Google Calendar, Outlook, Apple Calendar)
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import asyncio
+import json
+import logging
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+from sqlalchemy import func, insert, lambda_stmt, literal, select, union_all
 from sqlalchemy.orm import Session
 
+from app.core.datetime_utils import parse_datetime
 from app.models.user import User
 from app.models.preferences import UserPreferences
-from app.models.work_life import WorkSession, Meeting
+from app.models.work_life import WorkSession, Meeting, MeetingType
+from app.services.preferences_cache import invalidate_preferences
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for calendar sync
+    aiohttp = None
+
+try:
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build as build_google_service
+except ImportError:  # blocking fallback for calendar sync when aiohttp is missing
+    Credentials = None
+    build_google_service = None
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+GOOGLE_EVENTS_PATH = "/calendar/v3/calendars/primary/events"
+GOOGLE_BATCH_LIMIT = 50  # sub-requests per batch call
+GOOGLE_PAGE_SIZE = 250  # events per events.list page
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+
+# Refresh access tokens this close to expiry rather than risk a mid-sync 401
+_TOKEN_REFRESH_MARGIN = timedelta(minutes=1)
+
+# End of an HTTP head; batch parts use CRLF but LF-only responses must parse too
+_HTTP_HEAD_END = re.compile(rb"\r?\n\r?\n")
+
+# (window start, window end, page token) for one events.list call
+PageRequest = Tuple[datetime, datetime, Optional[str]]
 
 
 class CalendarIntegrationService:
@@ -19,6 +59,14 @@ class CalendarIntegrationService:
         self.db = db
         self.user_id = user_id
 
+    @cached_property
+    def preferences(self) -> Optional[UserPreferences]:
+        """The user's preferences row, loaded once per service instance"""
+        user_id = self.user_id
+        return self.db.scalars(lambda_stmt(
+            lambda: select(UserPreferences).where(UserPreferences.user_id == user_id)
+        )).first()
+
     # ==================== GOOGLE CALENDAR ====================
 
     def get_google_calendar_auth_url(self) -> str:
@@ -71,9 +119,7 @@ class CalendarIntegrationService:
         credentials = flow.credentials
 
         # Store credentials
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == self.user_id
-        ).first()
+        preferences = self.preferences
 
         if preferences:
             preferences.calendar_provider = "google"
@@ -88,7 +134,7 @@ class CalendarIntegrationService:
         # Placeholder
         return {"status": "connected", "provider": "google"}
 
-    def sync_google_calendar_events(
+    async def sync_google_calendar_events(
         self,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None
@@ -96,63 +142,253 @@ class CalendarIntegrationService:
         """
         Sync events from Google Calendar
 
-        Example implementation:
-        ```python
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+        The range is split into one-day windows that are fetched together through
+        Google's batch endpoint, so a week-long sync costs one HTTP round trip.
+        Windows with more than one page of events are followed up in further
+        rounds, and each round is stored before the next is fetched.
+        Uses aiohttp when installed, otherwise the Google API client's batch requests.
+        """
+        if aiohttp is None and build_google_service is None:
+            return {"error": "Calendar sync requires the aiohttp or google-api-python-client package"}
 
-        # Get stored credentials
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == self.user_id
-        ).first()
+        preferences = self.preferences
 
         if not preferences or not preferences.calendar_sync_token:
             return {"error": "Not connected to Google Calendar"}
 
-        creds = Credentials.from_authorized_user_info(
-            json.loads(preferences.calendar_sync_token)
-        )
-
-        service = build('calendar', 'v3', credentials=creds)
-
         # Set date range
         if not date_from:
             date_from = datetime.utcnow()
         if not date_to:
             date_to = date_from + timedelta(days=7)
 
-        # Fetch events
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=date_from.isoformat() + 'Z',
-            timeMax=date_to.isoformat() + 'Z',
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-
-        events = events_result.get('items', [])
-
-        # Process and store events
-        for event in events:
-            self._process_calendar_event(event)
+        # (window start, window end, page token) still to fetch
+        pending: List[PageRequest] = [
+            (window_start, window_end, None)
+            for window_start, window_end in self._day_windows(date_from, date_to)
+        ]
+        seen_ids: Set[str] = set()
+        events_synced = 0
+
+        while pending:
+            if aiohttp is not None:
+                access_token = await self._google_access_token(preferences)
+                pages = await self._fetch_pages_async(access_token, pending)
+            else:
+                # The API client blocks; keep it off the event loop
+                pages = await asyncio.to_thread(
+                    self._fetch_pages_with_client, preferences.calendar_sync_token, pending
+                )
+
+            # An event spanning midnight is returned by every window it overlaps
+            events = []
+            next_pending = []
+            for index, page in pages.items():
+                for event in page.get("items", []):
+                    event_id = event.get("id")
+                    if event_id is None or event_id not in seen_ids:
+                        if event_id is not None:
+                            seen_ids.add(event_id)
+                        events.append(event)
+                if page.get("nextPageToken"):
+                    window_start, window_end, _ = pending[index]
+                    next_pending.append((window_start, window_end, page["nextPageToken"]))
+
+            # Session work is blocking; keep it off the event loop
+            await asyncio.to_thread(self._store_calendar_events, events)
+            events_synced += len(events)
+            pending = next_pending
 
         return {
-            "events_synced": len(events),
+            "events_synced": events_synced,
             "date_from": date_from.isoformat(),
             "date_to": date_to.isoformat()
         }
-        ```
-        """
 
-        # Placeholder - return mock data
-        return {
-            "events_synced": 0,
-            "date_from": date_from.isoformat() if date_from else None,
-            "date_to": date_to.isoformat() if date_to else None
+    @staticmethod
+    def _day_windows(date_from: datetime, date_to: datetime) -> List[Tuple[datetime, datetime]]:
+        """Split [date_from, date_to) into consecutive windows of at most one day"""
+        windows = []
+        start = date_from
+        while start < date_to:
+            end = min(start + timedelta(days=1), date_to)
+            windows.append((start, end))
+            start = end
+        return windows
+
+    @staticmethod
+    def _rfc3339(value: datetime) -> str:
+        """Google expects an explicit offset; naive datetimes are UTC"""
+        return value.isoformat() + "Z" if value.tzinfo is None else value.isoformat()
+
+    @classmethod
+    def _page_params(cls, request: PageRequest) -> Dict[str, str]:
+        """events.list query parameters for one page of a time window"""
+        window_start, window_end, page_token = request
+        params = {
+            "timeMin": cls._rfc3339(window_start),
+            "timeMax": cls._rfc3339(window_end),
+            "singleEvents": "true",
+            "orderBy": "startTime",
+            "maxResults": str(GOOGLE_PAGE_SIZE),
         }
+        if page_token:
+            params["pageToken"] = page_token
+        return params
 
-    def _process_calendar_event(self, event: Dict[str, Any]):
-        """Process a calendar event and create work session/meeting records"""
+    async def _google_access_token(self, preferences: UserPreferences) -> Optional[str]:
+        """
+        The stored access token, refreshed first when it has expired or is about to.
+        A refreshed token is saved back so later syncs and the API client path reuse it.
+        """
+        info = json.loads(preferences.calendar_sync_token)
+        expiry = info.get("expiry")
+        expired = not info.get("token") or (
+            expiry is not None
+            and parse_datetime(expiry).replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc) + _TOKEN_REFRESH_MARGIN
+        )
+        if not expired or not info.get("refresh_token"):
+            return info.get("token")
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                info.get("token_uri", GOOGLE_TOKEN_URL),
+                data={
+                    "grant_type": "refresh_token",
+                    "refresh_token": info["refresh_token"],
+                    "client_id": info.get("client_id", ""),
+                    "client_secret": info.get("client_secret", ""),
+                }
+            ) as response:
+                response.raise_for_status()
+                token = await response.json()
+
+        # Same layout google-auth's Credentials.to_json() writes
+        expires_at = datetime.utcnow() + timedelta(seconds=token.get("expires_in", 3600))
+        info["token"] = token["access_token"]
+        info["expiry"] = expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+        preferences.calendar_sync_token = json.dumps(info)
+
+        # Session work is blocking; keep it off the event loop
+        await asyncio.to_thread(self.db.commit)
+        invalidate_preferences(self.user_id)
+
+        return info["token"]
+
+    async def _fetch_pages_async(
+        self,
+        access_token: Optional[str],
+        requests: List[PageRequest]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Fetch one page per request with concurrent aiohttp batch calls, keyed by request index"""
+        async with aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {access_token}"}
+        ) as session:
+            batches = await asyncio.gather(*(
+                self._fetch_events_batch(session, requests, range(i, min(i + GOOGLE_BATCH_LIMIT, len(requests))))
+                for i in range(0, len(requests), GOOGLE_BATCH_LIMIT)
+            ))
+
+        return {index: page for batch in batches for index, page in batch.items()}
+
+    def _fetch_pages_with_client(
+        self,
+        sync_token: str,
+        requests: List[PageRequest]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Fetch one page per request through the Google API client's BatchHttpRequest"""
+        credentials = Credentials.from_authorized_user_info(json.loads(sync_token))
+        service = build_google_service("calendar", "v3", credentials=credentials, cache_discovery=False)
+
+        pages: Dict[int, Dict[str, Any]] = {}
+
+        def collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Calendar batch part {request_id} failed: {exception}")
+                return
+            pages[int(request_id)] = response
+
+        for i in range(0, len(requests), GOOGLE_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=collect)
+            for index in range(i, min(i + GOOGLE_BATCH_LIMIT, len(requests))):
+                params = self._page_params(requests[index])
+                batch.add(service.events().list(calendarId="primary", **params), request_id=str(index))
+            batch.execute()
+
+        return pages
+
+    async def _fetch_events_batch(
+        self,
+        session: "aiohttp.ClientSession",
+        requests: List[PageRequest],
+        indexes: range
+    ) -> Dict[int, Dict[str, Any]]:
+        """Fetch the given requests' pages in one multipart/mixed batch request"""
+        boundary = f"batch_{uuid.uuid4().hex}"
+
+        parts = []
+        for index in indexes:
+            query = urlencode(self._page_params(requests[index]))
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <page{index}>\r\n"
+                "\r\n"
+                f"GET {GOOGLE_EVENTS_PATH}?{query}\r\n"
+                "\r\n"
+            )
+        body = "".join(parts) + f"--{boundary}--\r\n"
+
+        async with session.post(
+            GOOGLE_BATCH_URL,
+            data=body.encode(),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"}
+        ) as response:
+            response.raise_for_status()
+            content_type = response.headers["Content-Type"]
+            payload = await response.read()
+
+        return self._parse_batch_response(content_type, payload)
+
+    @staticmethod
+    def _parse_batch_response(content_type: str, payload: bytes) -> Dict[int, Dict[str, Any]]:
+        """Decode each part of a Google batch response, keyed by the index in its Content-ID"""
+        message = BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + payload
+        )
+
+        pages = {}
+        for part in message.get_payload():
+            # Parts may arrive in any order; Google echoes Content-ID as <response-pageN>
+            content_id = part.get("Content-ID", "")
+            index = int(content_id.strip("<>").rsplit("page", 1)[-1])
+
+            # Each part wraps a complete HTTP response: status line, headers, JSON body
+            http_response = part.get_payload(decode=True) or b""
+            head, *rest = _HTTP_HEAD_END.split(http_response, 1)
+            part_body = rest[0] if rest else b""
+            status_line = head.splitlines()[0].decode(errors="replace") if head else ""
+            if " 200 " not in f"{status_line} ":
+                logger.warning(f"Calendar batch part {content_id} failed: {status_line}")
+                continue
+            pages[index] = json.loads(part_body)
+        return pages
+
+    def _store_calendar_events(self, events: List[Dict[str, Any]]):
+        """Store fetched events as work sessions and meetings in one transaction"""
+        rows: Dict[type, List[Dict[str, Any]]] = {Meeting: [], WorkSession: []}
+        for event in events:
+            model, row = self._build_event_row(event)
+            rows[model].append(row)
+
+        # One executemany INSERT per table instead of a commit per event
+        for model, model_rows in rows.items():
+            if model_rows:
+                self.db.execute(insert(model), model_rows)
+        self.db.commit()
+
+    def _build_event_row(self, event: Dict[str, Any]) -> Tuple[type, Dict[str, Any]]:
+        """Map a calendar event to a meeting or work session row"""
 
         # Extract event details
         summary = event.get('summary', 'Untitled Event')
@@ -160,40 +396,33 @@ class CalendarIntegrationService:
         end = event['end'].get('dateTime', event['end'].get('date'))
 
         # Parse datetime
-        start_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(end.replace('Z', '+00:00'))
-
-        duration_hours = (end_time - start_time).total_seconds() / 3600
+        start_time = parse_datetime(start)
+        end_time = parse_datetime(end)
 
         # Determine if it's a meeting or work session
         attendees = event.get('attendees', [])
 
         if len(attendees) > 1:
             # It's a meeting
-            meeting = Meeting(
-                user_id=self.user_id,
-                title=summary,
-                meeting_date=start_time,
-                duration_hours=duration_hours,
-                attendee_count=len(attendees),
-                is_mandatory=True,
-                source="calendar_sync"
-            )
-            self.db.add(meeting)
-        else:
-            # It's a work session
-            work_session = WorkSession(
-                user_id=self.user_id,
-                start_time=start_time,
-                end_time=end_time,
-                duration_hours=duration_hours,
-                activity_type="scheduled_work",
-                description=summary,
-                source="calendar_sync"
-            )
-            self.db.add(work_session)
+            return Meeting, {
+                "user_id": self.user_id,
+                "title": summary,
+                "meeting_type": MeetingType.OTHER,
+                "start_time": start_time,
+                "end_time": end_time,
+                "attendees_count": len(attendees),
+                "source": "calendar_sync",
+            }
 
-        self.db.commit()
+        # It's a work session
+        return WorkSession, {
+            "user_id": self.user_id,
+            "start_time": start_time,
+            "end_time": end_time,
+            "work_type": "scheduled_work",
+            "notes": summary,
+            "source": "calendar_sync",
+        }
 
     # ==================== WORK HOURS ANALYSIS ====================
 
@@ -206,23 +435,38 @@ class CalendarIntegrationService:
         Calculate total work hours from calendar events
         """
 
-        # Get all work sessions and meetings from calendar
-        work_sessions = self.db.query(WorkSession).filter(
-            WorkSession.user_id == self.user_id,
-            WorkSession.start_time >= date_from,
-            WorkSession.start_time <= date_to,
-            WorkSession.source == "calendar_sync"
-        ).all()
-
-        meetings = self.db.query(Meeting).filter(
-            Meeting.user_id == self.user_id,
-            Meeting.meeting_date >= date_from,
-            Meeting.meeting_date <= date_to,
-            Meeting.source == "calendar_sync"
-        ).all()
-
-        total_work_hours = sum(ws.duration_hours for ws in work_sessions)
-        total_meeting_hours = sum(m.duration_hours for m in meetings)
+        # Sum and count both tables in one round trip; meetings store whole minutes.
+        # As a lambda statement the union is built once, then reused with new bounds
+        user_id = self.user_id
+        totals = lambda_stmt(lambda: union_all(
+            select(
+                literal("work"),
+                func.coalesce(func.sum(WorkSession.duration_hours), 0.0),
+                func.count(WorkSession.id),
+            ).where(
+                WorkSession.user_id == user_id,
+                WorkSession.start_time >= date_from,
+                WorkSession.start_time <= date_to,
+                WorkSession.source == "calendar_sync"
+            ),
+            select(
+                literal("meetings"),
+                func.coalesce(func.sum(Meeting.duration_minutes), 0) / 60.0,
+                func.count(Meeting.id),
+            ).where(
+                Meeting.user_id == user_id,
+                Meeting.start_time >= date_from,
+                Meeting.start_time <= date_to,
+                Meeting.source == "calendar_sync"
+            ),
+        ))
+        hours, counts = {}, {}
+        for kind, kind_hours, kind_count in self.db.execute(totals):
+            hours[kind] = float(kind_hours)
+            counts[kind] = kind_count
+
+        total_work_hours = hours["work"]
+        total_meeting_hours = hours["meetings"]
 
         return {
             "date_from": date_from.isoformat(),
@@ -230,8 +474,8 @@ class CalendarIntegrationService:
             "total_work_hours": total_work_hours,
             "total_meeting_hours": total_meeting_hours,
             "total_hours": total_work_hours + total_meeting_hours,
-            "work_sessions_count": len(work_sessions),
-            "meetings_count": len(meetings)
+            "work_sessions_count": counts["work"],
+            "meetings_count": counts["meetings"]
         }
 
     def suggest_calendar_insights(self) -> List[Dict[str, Any]]:
@@ -286,24 +530,22 @@ class CalendarIntegrationService:
     def disconnect_calendar(self) -> Dict[str, Any]:
         """Disconnect calendar integration"""
 
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == self.user_id
-        ).first()
+        preferences = self.preferences
 
         if preferences:
             preferences.calendar_integration_enabled = False
             preferences.calendar_provider = None
             preferences.calendar_sync_token = None
             self.db.commit()
+            invalidate_preferences(self.user_id)
+            self.__dict__.pop("preferences", None)
 
         return {"status": "disconnected"}
 
     def get_calendar_status(self) -> Dict[str, Any]:
         """Get calendar integration status"""
 
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == self.user_id
-        ).first()
+        preferences = self.preferences
 
         if not preferences:
             return {
@@ -3,21 +3,139 @@ Data Export and Import Service
 Handles exporting user data to JSON/CSV and importing from CSV templates
 """
 
-import json
 import csv
 import io
+import itertools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import BinaryIO, Callable, Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
+import orjson
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Date, DateTime, insert, lambda_stmt, select
 
+from app.core.database import SessionLocal
+from app.core.datetime_utils import parse_datetime
 from app.models.financial import Transaction, Budget, FinancialGoal
 from app.models.health import Meal, Biometric, Exercise
-from app.models.work_life import WorkSession, Meeting, BoundaryViolation
+from app.models.work_life import WorkSession, Meeting, Boundary, BoundaryViolation
 from app.models.productivity import Task, DeepWorkSession, Distraction, ProductivityGoal
 from app.models.wellbeing import MoodEntry, SleepEntry
 from app.models.analytics import Correlation, Recommendation
 from app.models.preferences import DataExport
+from app.schemas.financial import TransactionCreate
+from app.schemas.health import MealCreate
+from app.schemas.productivity import TaskCreate
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it backups are parsed whole
+    ijson = None
+
+# Backups are streamed through ijson when it is installed
+STREAMING_JSON_IMPORT = ijson is not None
+
+# Parse errors the import endpoint reports as an invalid upload
+JSON_DECODE_ERRORS = (
+    (orjson.JSONDecodeError, ijson.JSONError) if ijson is not None else (orjson.JSONDecodeError,)
+)
+
+
+# CSV-exportable entities
+_CSV_EXPORT_MODELS = {
+    ("financial", "transactions"): Transaction,
+    ("financial", "budgets"): Budget,
+    ("health", "meals"): Meal,
+    ("health", "exercises"): Exercise,
+    ("productivity", "tasks"): Task,
+}
+
+# CSV-importable entities: model plus a list validator for the whole file
+_CSV_IMPORT_ADAPTERS = {
+    ("financial", "transactions"): (Transaction, TypeAdapter(List[TransactionCreate])),
+    ("health", "meals"): (Meal, TypeAdapter(List[MealCreate])),
+    ("productivity", "tasks"): (Task, TypeAdapter(List[TaskCreate])),
+}
+
+# JSON-importable entities, keyed like the export's pillar/entity sections
+_JSON_IMPORT_MODELS = {
+    ("financial", "transactions"): Transaction,
+    ("financial", "budgets"): Budget,
+    ("financial", "goals"): FinancialGoal,
+    ("health", "meals"): Meal,
+    ("health", "biometrics"): Biometric,
+    ("health", "exercises"): Exercise,
+    ("worklife", "work_sessions"): WorkSession,
+    ("worklife", "meetings"): Meeting,
+    ("worklife", "boundaries"): Boundary,
+    ("worklife", "boundary_violations"): BoundaryViolation,
+    ("productivity", "tasks"): Task,
+    ("productivity", "deep_work_sessions"): DeepWorkSession,
+    ("productivity", "distractions"): Distraction,
+    ("productivity", "goals"): ProductivityGoal,
+    ("wellbeing", "mood_entries"): MoodEntry,
+    ("wellbeing", "sleep_entries"): SleepEntry,
+}
+
+_JSON_IMPORT_PILLARS = frozenset(pillar for pillar, _ in _JSON_IMPORT_MODELS)
+
+# Top-level sections of a JSON backup, in import order
+_BACKUP_PILLARS = ("financial", "health", "worklife", "productivity", "wellbeing", "intelligence")
+
+# Rows per executemany when streaming a backup
+_IMPORT_BATCH_SIZE = 1000
+
+
+def _iter_backup_records(stream: BinaryIO) -> Iterator[Tuple[str, Optional[str], Optional[Dict[str, Any]]]]:
+    """
+    Walk a JSON backup with ijson without loading it whole. Yields (key, None, None) for
+    each top-level key, (pillar, entity_type, None) when an entity section starts, then
+    (pillar, entity_type, record) for each record in it.
+    """
+    pillar = entity_type = record_prefix = None
+    builder = None
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == record_prefix and event == "end_map":
+                yield pillar, entity_type, builder.value
+                builder = None
+        elif event == "map_key" and prefix == "":
+            pillar, entity_type = value, None
+            yield pillar, None, None
+        elif event == "map_key" and prefix == pillar:
+            entity_type = value
+            yield pillar, entity_type, None
+        elif event == "start_map" and entity_type is not None and prefix == f"{pillar}.{entity_type}.item":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            record_prefix = prefix
+
+
+@lru_cache(maxsize=None)
+def _datetime_columns(model_class) -> FrozenSet[str]:
+    """Names of the model's DateTime/Date columns, computed once per model"""
+    return frozenset(
+        column.name for column in model_class.__table__.columns
+        if isinstance(column.type, (DateTime, Date))
+    )
+
+
+@lru_cache(maxsize=None)
+def _row_spec(model_class) -> Tuple[Tuple[str, ...], FrozenSet[str], operator.attrgetter]:
+    """Column names, datetime column names and a C-level getter for all columns, per model"""
+    names = tuple(model_class.__table__.columns.keys())
+    return names, _datetime_columns(model_class), operator.attrgetter(*names)
+
+
+class _LineBuffer:
+    """Write target that hands each formatted CSV line straight back to the caller"""
+
+    def write(self, line: str) -> str:
+        return line
 
 
 class ExportImportService:
@@ -26,6 +144,8 @@ class ExportImportService:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
+        # Exported boundary id -> id of the boundary the import created, for remapping violations
+        self._boundary_ids: Dict[int, int] = {}
 
     # ==================== EXPORT METHODS ====================
 
@@ -43,37 +163,47 @@ class ExportImportService:
                 "date_from": date_from.isoformat() if date_from else None,
                 "date_to": date_to.isoformat() if date_to else None,
             },
-            "financial": self._export_financial_data(date_from, date_to),
-            "health": self._export_health_data(date_from, date_to),
-            "worklife": self._export_worklife_data(date_from, date_to),
-            "productivity": self._export_productivity_data(date_from, date_to),
-            "wellbeing": self._export_wellbeing_data(date_from, date_to),
-            "intelligence": self._export_intelligence_data(date_from, date_to),
         }
 
+        # Pillars are independent, so overlap their queries on separate sessions
+        with ThreadPoolExecutor(max_workers=len(_PILLAR_EXPORTS)) as executor:
+            futures = {
+                pillar: executor.submit(self._export_in_own_session, export, date_from, date_to)
+                for pillar, export in _PILLAR_EXPORTS.items()
+            }
+            for pillar, future in futures.items():
+                export_data[pillar] = future.result()
+
         return export_data
 
-    def _export_financial_data(
+    def _export_in_own_session(
         self,
+        export: Callable[..., Dict[str, Any]],
         date_from: Optional[datetime],
         date_to: Optional[datetime]
     ) -> Dict[str, Any]:
-        """Export financial pillar data"""
+        """Run one pillar export on a fresh session; sessions are not thread-safe"""
 
-        query_filter = [Transaction.user_id == self.user_id]
-        if date_from:
-            query_filter.append(Transaction.date >= date_from)
-        if date_to:
-            query_filter.append(Transaction.date <= date_to)
+        with SessionLocal() as db:
+            return export(ExportImportService(db, self.user_id), date_from, date_to)
 
-        transactions = self.db.query(Transaction).filter(and_(*query_filter)).all()
-        budgets = self.db.query(Budget).filter(Budget.user_id == self.user_id).all()
-        goals = self.db.query(FinancialGoal).filter(FinancialGoal.user_id == self.user_id).all()
+    def _export_financial_data(
+        self,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Export financial pillar data"""
 
+        # Budgets and goals are standing settings rather than dated events, so export them whole
         return {
-            "transactions": [self._model_to_dict(t) for t in transactions],
-            "budgets": [self._model_to_dict(b) for b in budgets],
-            "goals": [self._model_to_dict(g) for g in goals],
+            "transactions": self._core_rows(
+                Transaction,
+                date_column=Transaction.transaction_date,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "budgets": self._core_rows(Budget),
+            "goals": self._core_rows(FinancialGoal),
         }
 
     def _export_health_data(
@@ -83,14 +213,25 @@ class ExportImportService:
     ) -> Dict[str, Any]:
         """Export health pillar data"""
 
-        meals = self.db.query(Meal).filter(Meal.user_id == self.user_id).all()
-        biometrics = self.db.query(Biometric).filter(Biometric.user_id == self.user_id).all()
-        exercises = self.db.query(Exercise).filter(Exercise.user_id == self.user_id).all()
-
         return {
-            "meals": [self._model_to_dict(m) for m in meals],
-            "biometrics": [self._model_to_dict(b) for b in biometrics],
-            "exercises": [self._model_to_dict(e) for e in exercises],
+            "meals": self._core_rows(
+                Meal,
+                date_column=Meal.meal_time,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "biometrics": self._core_rows(
+                Biometric,
+                date_column=Biometric.measurement_date,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "exercises": self._core_rows(
+                Exercise,
+                date_column=Exercise.exercise_date,
+                date_from=date_from,
+                date_to=date_to,
+            ),
         }
 
     def _export_worklife_data(
@@ -100,16 +241,32 @@ class ExportImportService:
     ) -> Dict[str, Any]:
         """Export work-life pillar data"""
 
-        sessions = self.db.query(WorkSession).filter(WorkSession.user_id == self.user_id).all()
-        meetings = self.db.query(Meeting).filter(Meeting.user_id == self.user_id).all()
-        violations = self.db.query(BoundaryViolation).filter(
-            BoundaryViolation.user_id == self.user_id
-        ).all()
+        # Violations are owned through their boundary
+        user_boundaries = select(Boundary.id).where(Boundary.user_id == self.user_id)
 
         return {
-            "work_sessions": [self._model_to_dict(s) for s in sessions],
-            "meetings": [self._model_to_dict(m) for m in meetings],
-            "boundary_violations": [self._model_to_dict(v) for v in violations],
+            "work_sessions": self._core_rows(
+                WorkSession,
+                date_column=WorkSession.start_time,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "meetings": self._core_rows(
+                Meeting,
+                date_column=Meeting.start_time,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            # All boundaries, not just those in range: violations in range may reference older ones.
+            # Listed before the violations so an import can map their ids first
+            "boundaries": self._core_rows(Boundary),
+            "boundary_violations": self._core_rows(
+                BoundaryViolation,
+                owner=BoundaryViolation.boundary_id.in_(user_boundaries),
+                date_column=BoundaryViolation.violation_date,
+                date_from=date_from,
+                date_to=date_to,
+            ),
         }
 
     def _export_productivity_data(
@@ -119,22 +276,26 @@ class ExportImportService:
     ) -> Dict[str, Any]:
         """Export productivity pillar data"""
 
-        tasks = self.db.query(Task).filter(Task.user_id == self.user_id).all()
-        deep_work = self.db.query(DeepWorkSession).filter(
-            DeepWorkSession.user_id == self.user_id
-        ).all()
-        distractions = self.db.query(Distraction).filter(
-            Distraction.user_id == self.user_id
-        ).all()
-        goals = self.db.query(ProductivityGoal).filter(
-            ProductivityGoal.user_id == self.user_id
-        ).all()
-
         return {
-            "tasks": [self._model_to_dict(t) for t in tasks],
-            "deep_work_sessions": [self._model_to_dict(d) for d in deep_work],
-            "distractions": [self._model_to_dict(d) for d in distractions],
-            "goals": [self._model_to_dict(g) for g in goals],
+            "tasks": self._core_rows(
+                Task,
+                date_column=Task.created_at,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "deep_work_sessions": self._core_rows(
+                DeepWorkSession,
+                date_column=DeepWorkSession.start_time,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "distractions": self._core_rows(
+                Distraction,
+                date_column=Distraction.timestamp,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "goals": self._core_rows(ProductivityGoal),
         }
 
     def _export_wellbeing_data(
@@ -144,16 +305,19 @@ class ExportImportService:
     ) -> Dict[str, Any]:
         """Export wellbeing data"""
 
-        mood_entries = self.db.query(MoodEntry).filter(
-            MoodEntry.user_id == self.user_id
-        ).all()
-        sleep_entries = self.db.query(SleepEntry).filter(
-            SleepEntry.user_id == self.user_id
-        ).all()
-
         return {
-            "mood_entries": [self._model_to_dict(m) for m in mood_entries],
-            "sleep_entries": [self._model_to_dict(s) for s in sleep_entries],
+            "mood_entries": self._core_rows(
+                MoodEntry,
+                date_column=MoodEntry.created_at,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "sleep_entries": self._core_rows(
+                SleepEntry,
+                date_column=SleepEntry.created_at,
+                date_from=date_from,
+                date_to=date_to,
+            ),
         }
 
     def _export_intelligence_data(
@@ -163,65 +327,75 @@ class ExportImportService:
     ) -> Dict[str, Any]:
         """Export intelligence/analytics data"""
 
-        correlations = self.db.query(Correlation).filter(
-            Correlation.user_id == self.user_id
-        ).all()
-        recommendations = self.db.query(Recommendation).filter(
-            Recommendation.user_id == self.user_id
-        ).all()
-
         return {
-            "correlations": [self._model_to_dict(c) for c in correlations],
-            "recommendations": [self._model_to_dict(r) for r in recommendations],
+            "correlations": self._core_rows(
+                Correlation,
+                date_column=Correlation.created_at,
+                date_from=date_from,
+                date_to=date_to,
+            ),
+            "recommendations": self._core_rows(
+                Recommendation,
+                date_column=Recommendation.created_at,
+                date_from=date_from,
+                date_to=date_to,
+            ),
         }
 
-    def export_to_csv(self, pillar: str, entity_type: str) -> str:
-        """Export specific entity type to CSV format"""
-
-        # Map pillar and entity_type to query
-        data = self._get_data_for_csv_export(pillar, entity_type)
-
-        if not data:
-            return ""
-
-        # Convert to CSV
-        output = io.StringIO()
-        if data:
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-
-        return output.getvalue()
-
-    def _get_data_for_csv_export(self, pillar: str, entity_type: str) -> List[Dict]:
-        """Get data for specific entity type"""
-
-        if pillar == "financial":
-            if entity_type == "transactions":
-                items = self.db.query(Transaction).filter(
-                    Transaction.user_id == self.user_id
-                ).all()
-            elif entity_type == "budgets":
-                items = self.db.query(Budget).filter(Budget.user_id == self.user_id).all()
-            else:
-                return []
-        elif pillar == "health":
-            if entity_type == "meals":
-                items = self.db.query(Meal).filter(Meal.user_id == self.user_id).all()
-            elif entity_type == "exercises":
-                items = self.db.query(Exercise).filter(Exercise.user_id == self.user_id).all()
-            else:
-                return []
-        elif pillar == "productivity":
-            if entity_type == "tasks":
-                items = self.db.query(Task).filter(Task.user_id == self.user_id).all()
-            else:
-                return []
+    def _core_rows(
+        self,
+        model_class,
+        owner=None,
+        date_column=None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the user's rows of a table as plain dicts with a Core select, skipping ORM
+        hydration. owner overrides the default user_id criterion for indirectly owned tables.
+        Values are left as-is (datetimes, enums) for orjson to encode.
+        """
+
+        # Lambda statements are built and cached once per call site and table;
+        # later calls only re-extract the bound values
+        table = model_class.__table__
+        user_id = self.user_id
+        query = lambda_stmt(lambda: select(table))
+        if owner is None:
+            query += lambda q: q.where(table.c.user_id == user_id)
         else:
-            return []
+            query += lambda q: q.where(owner)
+        if date_column is not None and date_from:
+            query += lambda q: q.where(date_column >= date_from)
+        if date_column is not None and date_to:
+            query += lambda q: q.where(date_column <= date_to)
+
+        return [dict(row) for row in self.db.execute(query).mappings()]
+
+    def iter_csv_rows(self, pillar: str, entity_type: str) -> Iterator[str]:
+        """
+        Export a specific entity type as CSV, one line at a time.
+        Yields nothing when there is no data, so callers can detect an empty export.
+        """
+
+        model_class = _CSV_EXPORT_MODELS.get((pillar, entity_type))
+        if model_class is None:
+            return
+
+        items = iter(
+            self.db.query(model_class)
+            .filter(model_class.user_id == self.user_id)
+            .execution_options(stream_results=True)
+            .yield_per(1000)
+        )
+        first = next(items, None)
+        if first is None:
+            return
 
-        return [self._model_to_dict(item) for item in items]
+        writer = csv.writer(_LineBuffer())
+        yield writer.writerow(_row_spec(model_class)[0])
+        for item in itertools.chain((first,), items):
+            yield writer.writerow(self._model_to_dict(item).values())
 
     # ==================== IMPORT METHODS ====================
 
@@ -242,20 +416,37 @@ class ExportImportService:
             "warnings": [],
         }
 
-        try:
-            reader = csv.DictReader(io.StringIO(csv_data))
-            rows = list(reader)
+        if (pillar, entity_type) not in _CSV_IMPORT_ADAPTERS:
+            result["success"] = False
+            result["errors"].append(f"Import failed: Unsupported entity type: {pillar}/{entity_type}")
+            return result
 
-            for row_num, row in enumerate(rows, start=1):
-                try:
-                    self._import_row(pillar, entity_type, row, overwrite)
-                    result["records_imported"] += 1
-                except Exception as e:
-                    result["records_failed"] += 1
-                    result["errors"].append(f"Row {row_num}: {str(e)}")
+        model_class, adapter = _CSV_IMPORT_ADAPTERS[(pillar, entity_type)]
 
+        try:
+            # Empty cells mean "not provided" so optional fields fall back to their defaults
+            rows = [
+                {key: value for key, value in row.items() if key and value != ""}
+                for row in csv.DictReader(io.StringIO(csv_data))
+            ]
+
+            records, failures = self._validate_rows(adapter, rows)
+
+            for row_index, error in sorted(failures.items()):
+                result["errors"].append(f"Row {row_index + 1}: {error}")
+            result["records_failed"] = len(failures)
+
+            columns = set(model_class.__table__.columns.keys())
+            values = [
+                {**record.model_dump(include=columns), "user_id": self.user_id}
+                for record in records
+            ]
+            if values:
+                self.db.execute(insert(model_class), values)
             self.db.commit()
 
+            result["records_imported"] = len(values)
+
         except Exception as e:
             result["success"] = False
             result["errors"].append(f"Import failed: {str(e)}")
@@ -263,56 +454,88 @@ class ExportImportService:
 
         return result
 
-    def _import_row(
+    def _validate_rows(
         self,
-        pillar: str,
-        entity_type: str,
-        row: Dict[str, Any],
-        overwrite: bool
-    ):
-        """Import a single row of data"""
-
-        # Remove id if present (will be auto-generated)
-        row.pop('id', None)
-        row['user_id'] = self.user_id
-
-        # Convert string dates to datetime objects
-        for key, value in row.items():
-            if 'date' in key.lower() or 'time' in key.lower() or 'at' in key.lower():
-                if value and isinstance(value, str):
-                    try:
-                        row[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except:
-                        pass
-
-        # Create appropriate model instance
-        if pillar == "financial" and entity_type == "transactions":
-            obj = Transaction(**row)
-        elif pillar == "health" and entity_type == "meals":
-            obj = Meal(**row)
-        elif pillar == "productivity" and entity_type == "tasks":
-            obj = Task(**row)
-        else:
-            raise ValueError(f"Unsupported entity type: {pillar}/{entity_type}")
+        adapter: TypeAdapter,
+        rows: List[Dict[str, Any]]
+    ) -> Tuple[List[Any], Dict[int, str]]:
+        """
+        Validate all rows in one call. On failure, collect the first error per
+        row and re-validate only the rows that passed.
+        """
 
-        self.db.add(obj)
+        try:
+            return adapter.validate_python(rows), {}
+        except ValidationError as e:
+            failures = {}
+            for error in e.errors():
+                row_index, *field_path = error["loc"]
+                field = ".".join(str(part) for part in field_path)
+                failures.setdefault(row_index, f"{field}: {error['msg']}" if field else error["msg"])
+
+        remaining = [row for index, row in enumerate(rows) if index not in failures]
+        return adapter.validate_python(remaining), failures
 
     # ==================== HELPER METHODS ====================
 
+    def _insert_boundary(self, record: Dict[str, Any], row: Dict[str, Any]):
+        """Insert one imported boundary, remembering its new id under the exported one"""
+
+        new_id = self.db.execute(insert(Boundary).returning(Boundary.id), row).scalar_one()
+        if record.get('id') is not None:
+            self._boundary_ids[record['id']] = new_id
+
     def _model_to_dict(self, model) -> Dict[str, Any]:
         """Convert SQLAlchemy model instance to dictionary"""
 
-        result = {}
-        for column in model.__table__.columns:
-            value = getattr(model, column.name)
+        names, datetime_columns, get_values = _row_spec(type(model))
 
-            # Convert datetime to ISO format string
-            if isinstance(value, datetime):
-                value = value.isoformat()
+        # Convert datetime to ISO format string
+        return {
+            name: value.isoformat() if name in datetime_columns and value is not None else value
+            for name, value in zip(names, get_values(model))
+        }
 
-            result[column.name] = value
+    def _record_transformer(self, model_class) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build the per-record cleanup for one entity type, with the column lookups
+        hoisted out of the record loop
+        """
 
-        return result
+        column_names = frozenset(model_class.__table__.columns.keys())
+        # id and database-computed columns are never imported
+        dropped = frozenset(['id']).union(
+            column.name for column in model_class.__table__.columns if column.computed is not None
+        )
+        datetime_columns = _datetime_columns(model_class)
+        # Tables owned through a parent (boundary violations) have no user_id
+        user_id = self.user_id if 'user_id' in column_names else None
+        boundary_ids = self._boundary_ids if 'boundary_id' in column_names else None
+
+        def transform(record: Dict[str, Any]) -> Dict[str, Any]:
+            row = {key: value for key, value in record.items() if key not in dropped}
+            if user_id is not None:
+                row['user_id'] = user_id
+
+            # Point at the boundary this import created, never at the source user's
+            if boundary_ids is not None:
+                new_id = boundary_ids.get(row.get('boundary_id'))
+                if new_id is None:
+                    raise ValueError(f"boundary {row.get('boundary_id')} is not in this backup")
+                row['boundary_id'] = new_id
+
+            unknown = row.keys() - column_names
+            if unknown:
+                raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+
+            # Convert ISO strings back to datetime
+            for key in datetime_columns & row.keys():
+                if isinstance(row[key], str):
+                    row[key] = parse_datetime(row[key])
+
+            return row
+
+        return transform
 
     def create_export_record(
         self,
@@ -340,10 +563,10 @@ class ExportImportService:
 
         templates = {
             "financial.transactions": [
-                "amount", "category", "description", "transaction_type", "date"
+                "amount", "category", "description", "transaction_type", "transaction_date", "merchant"
             ],
             "health.meals": [
-                "meal_type", "food_items", "calories", "protein", "carbs", "fats", "meal_time"
+                "meal_type", "name", "description", "calories", "meal_time"
             ],
             "productivity.tasks": [
                 "title", "description", "status", "priority", "project", "due_date"
@@ -382,9 +605,7 @@ class ExportImportService:
                 raise ValueError("Invalid backup file: missing export_metadata")
 
             # Import each pillar
-            pillars = ["financial", "health", "worklife", "productivity", "wellbeing", "intelligence"]
-
-            for pillar in pillars:
+            for pillar in _BACKUP_PILLARS:
                 if pillar not in json_data:
                     continue
 
@@ -404,6 +625,103 @@ class ExportImportService:
 
         return result
 
+    def import_from_json_stream(
+        self,
+        stream: BinaryIO,
+        overwrite: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Import a JSON backup file record by record with ijson, inserting in batches,
+        so memory is bounded by the batch size instead of the file size.
+        Malformed JSON raises ijson.JSONError after rolling back.
+        """
+
+        result = {
+            "success": True,
+            "records_imported": 0,
+            "records_failed": 0,
+            "errors": [],
+            "warnings": [],
+            "details": {}
+        }
+        has_metadata = False
+        transformers: Dict[type, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        batches: Dict[Tuple[type, FrozenSet[str]], List[Dict[str, Any]]] = {}
+
+        try:
+            for pillar, entity_type, record in _iter_backup_records(stream):
+                if entity_type is None:
+                    # Top-level key
+                    has_metadata = has_metadata or pillar == "export_metadata"
+                    if pillar in _BACKUP_PILLARS:
+                        pillar_result = result["details"][pillar] = {
+                            "imported": 0, "failed": 0, "errors": [], "warnings": []
+                        }
+                        if pillar not in _JSON_IMPORT_PILLARS:
+                            pillar_result["warnings"].append(f"Unknown pillar: {pillar}")
+                    continue
+
+                if pillar not in _JSON_IMPORT_PILLARS:
+                    continue
+
+                pillar_result = result["details"][pillar]
+                model_class = _JSON_IMPORT_MODELS.get((pillar, entity_type))
+                if model_class is None:
+                    if record is None:
+                        pillar_result["warnings"].append(f"Unknown entity type: {pillar}.{entity_type}")
+                    continue
+                if record is None:
+                    continue
+
+                try:
+                    transform = transformers.get(model_class)
+                    if transform is None:
+                        transform = transformers[model_class] = self._record_transformer(model_class)
+                    row = transform(record)
+                except Exception as e:
+                    pillar_result["failed"] += 1
+                    pillar_result["errors"].append(f"{pillar}.{entity_type}: {str(e)}")
+                    continue
+
+                if model_class is Boundary:
+                    # Inserted right away so the violations after it can be remapped
+                    self._insert_boundary(record, row)
+                    pillar_result["imported"] += 1
+                    continue
+
+                # Same key set per batch, as executemany requires
+                rows = batches.setdefault((model_class, frozenset(row)), [])
+                rows.append(row)
+                pillar_result["imported"] += 1
+                if len(rows) >= _IMPORT_BATCH_SIZE:
+                    self.db.execute(insert(model_class), rows)
+                    rows.clear()
+
+            for (model_class, _), rows in batches.items():
+                if rows:
+                    self.db.execute(insert(model_class), rows)
+
+            if not has_metadata:
+                raise ValueError("Invalid backup file: missing export_metadata")
+
+            for pillar_result in result["details"].values():
+                result["records_imported"] += pillar_result["imported"]
+                result["records_failed"] += pillar_result["failed"]
+                result["errors"].extend(pillar_result["errors"])
+                result["warnings"].extend(pillar_result["warnings"])
+
+            self.db.commit()
+
+        except ijson.JSONError:
+            self.db.rollback()
+            raise
+        except Exception as e:
+            result["success"] = False
+            result["errors"].append(f"Import failed: {str(e)}")
+            self.db.rollback()
+
+        return result
+
     def _import_pillar_data(
         self,
         pillar: str,
@@ -419,68 +737,48 @@ class ExportImportService:
             "warnings": []
         }
 
-        # Map pillar and entity types to models
-        model_map = {
-            "financial": {
-                "transactions": Transaction,
-                "budgets": Budget,
-                "goals": FinancialGoal
-            },
-            "health": {
-                "meals": Meal,
-                "biometrics": Biometric,
-                "exercises": Exercise
-            },
-            "worklife": {
-                "work_sessions": WorkSession,
-                "meetings": Meeting,
-                "boundary_violations": BoundaryViolation
-            },
-            "productivity": {
-                "tasks": Task,
-                "deep_work_sessions": DeepWorkSession,
-                "distractions": Distraction,
-                "goals": ProductivityGoal
-            },
-            "wellbeing": {
-                "mood_entries": MoodEntry,
-                "sleep_entries": SleepEntry
-            }
-        }
-
-        if pillar not in model_map:
+        if pillar not in _JSON_IMPORT_PILLARS:
             result["warnings"].append(f"Unknown pillar: {pillar}")
             return result
 
         # Import each entity type
         for entity_type, records in pillar_data.items():
-            if entity_type not in model_map[pillar]:
+            model_class = _JSON_IMPORT_MODELS.get((pillar, entity_type))
+            if model_class is None:
                 result["warnings"].append(f"Unknown entity type: {pillar}.{entity_type}")
                 continue
 
-            model_class = model_map[pillar][entity_type]
+            transform = self._record_transformer(model_class)
+            # Rows are inserted together per distinct key set, since executemany
+            # needs every parameter set to name the same columns
+            batches: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
 
             for record in records:
                 try:
-                    # Remove id and set user_id
-                    record.pop('id', None)
-                    record['user_id'] = self.user_id
-
-                    # Convert ISO strings back to datetime
-                    for key, value in record.items():
-                        if isinstance(value, str) and ('date' in key.lower() or 'time' in key.lower() or 'at' in key.lower()):
-                            try:
-                                record[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                            except:
-                                pass
-
-                    # Create model instance
-                    obj = model_class(**record)
-                    self.db.add(obj)
+                    row = transform(record)
+                    if model_class is Boundary:
+                        # Inserted right away so the violations after it can be remapped
+                        self._insert_boundary(record, row)
+                    else:
+                        batches.setdefault(frozenset(row), []).append(row)
                     result["imported"] += 1
 
                 except Exception as e:
                     result["failed"] += 1
                     result["errors"].append(f"{pillar}.{entity_type}: {str(e)}")
 
+            for rows in batches.values():
+                self.db.execute(insert(model_class), rows)
+
         return result
+
+
+# Pillar key -> export method, run concurrently by export_all_data_json
+_PILLAR_EXPORTS = {
+    "financial": ExportImportService._export_financial_data,
+    "health": ExportImportService._export_health_data,
+    "worklife": ExportImportService._export_worklife_data,
+    "productivity": ExportImportService._export_productivity_data,
+    "wellbeing": ExportImportService._export_wellbeing_data,
+    "intelligence": ExportImportService._export_intelligence_data,
+}
@@ -2,8 +2,135 @@
 Health calculation utilities for BMI, TDEE, macro targets, and health scores.
 """
 
-from typing import Dict, Optional, Tuple
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+# BMI category i covers [_BMI_CUTS[i-1], _BMI_CUTS[i])
+_BMI_CUTS = (18.5, 25, 30)
+_BMI_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+
+# Grade i covers percentages in [_GRADE_CUTS[i-1], _GRADE_CUTS[i])
+_GRADE_CUTS = (50, 60, 70, 80, 90)
+_GRADES = ("F", "D", "C", "B", "A", "A+")
+_GRADES_ARRAY = np.array(_GRADES)
+
+# Grams per target calorie for the 30/40/30 protein/carb/fat split (4, 4 and 9 cal per gram)
+_PROTEIN_G_PER_CAL = 0.30 / 4
+_CARBS_G_PER_CAL = 0.40 / 4
+_FAT_G_PER_CAL = 0.30 / 9
+
+# Smallest per-thread chunk worth a thread hand-off in the batch scorer
+_PARALLEL_MIN_ROWS = 100_000
+
+# Keyed by the canonical lowercase names; lookups try the key as sent before lowercasing
+_ACTIVITY_MULTIPLIERS = {
+    'sedentary': 1.2,
+    'lightly_active': 1.375,
+    'moderately_active': 1.55,
+    'very_active': 1.725,
+    'extra_active': 1.9
+}
+
+# MET (Metabolic Equivalent of Task) values
+_MET_VALUES = {
+    'walking': 3.5,
+    'running': 8.0,
+    'cycling': 6.0,
+    'swimming': 7.0,
+    'yoga': 3.0,
+    'strength': 5.0,
+    'cardio': 7.0,
+    'sports': 6.5,
+    'flexibility': 2.5,
+    'other': 5.0,
+}
+
+
+_BP_LABELS = (
+    "Normal",
+    "Elevated",
+    "High Blood Pressure (Stage 1)",
+    "High Blood Pressure (Stage 2)",
+    "Hypertensive Crisis",
+)
+_BP_LABELS_ARRAY = np.array(_BP_LABELS)
+
+
+def _bp_category_codes(systolic, diastolic):
+    """Index into _BP_LABELS for scalar or array readings"""
+    return np.select(
+        [
+            (systolic < 120) & (diastolic < 80),
+            (systolic < 130) & (diastolic < 80),
+            (systolic < 140) | (diastolic < 90),
+            (systolic < 180) | (diastolic < 120),
+        ],
+        [0, 1, 2, 3],
+        default=4,
+    ).astype(np.uint8)
+
+
+# Category codes for every integer reading below 256, indexed [systolic, diastolic]
+_BP_CODES = _bp_category_codes(*np.mgrid[0:256, 0:256])
+
+
+class Gender(IntEnum):
+    """Preferred gender argument for the BMR formulas; also the int8 codes of batch inputs"""
+    MALE = 0
+    FEMALE = 1
+
+
+class MacroTargets(NamedTuple):
+    """Daily calorie and macro nutrient targets"""
+    calories: float
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+
+
+class HealthScoreResult(NamedTuple):
+    """Overall health score with its per-component points"""
+    bmi: float
+    sleep: float
+    exercise: float
+    nutrition: float
+    vitals: float
+    overall_score: float
+    percentage: float
+    grade: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON shape served by the health summary endpoint"""
+        return {
+            'overall_score': self.overall_score,
+            'max_score': 100,
+            'percentage': self.percentage,
+            'grade': self.grade,
+            'breakdown': {
+                'bmi': {'score': self.bmi, 'max': 20},
+                'sleep': {'score': self.sleep, 'max': 20},
+                'exercise': {'score': self.exercise, 'max': 25},
+                'nutrition': {'score': self.nutrition, 'max': 20},
+                'vitals': {'score': self.vitals, 'max': 15},
+            },
+        }
+
+
+def _as_float_array(values, dtype=np.float64) -> np.ndarray:
+    """Coerce a batch input to a float array; None entries become NaN (missing)"""
+    return np.asarray(values, dtype=dtype)
+
+
+def _select(conditions, choices, default, dtype) -> np.ndarray:
+    """np.select that keeps the batch dtype instead of promoting to float64"""
+    scalar = np.dtype(dtype).type
+    return np.select(conditions, [scalar(choice) for choice in choices], default=scalar(default))
 
 
 class HealthCalculator:
@@ -22,27 +149,20 @@ class HealthCalculator:
             BMI value
         """
         height_m = height_cm / 100
-        bmi = weight_kg / (height_m ** 2)
+        bmi = weight_kg / (height_m * height_m)
         return round(bmi, 2)
 
     @staticmethod
     def get_bmi_category(bmi: float) -> str:
         """Get BMI category classification"""
-        if bmi < 18.5:
-            return "Underweight"
-        elif 18.5 <= bmi < 25:
-            return "Normal weight"
-        elif 25 <= bmi < 30:
-            return "Overweight"
-        else:
-            return "Obese"
+        return _BMI_LABELS[bisect_right(_BMI_CUTS, bmi)]
 
     @staticmethod
     def calculate_bmr(
         weight_kg: float,
         height_cm: float,
         age: int,
-        gender: str
+        gender: Union[Gender, str]
     ) -> float:
         """
         Calculate Basal Metabolic Rate (BMR) using Mifflin-St Jeor Equation.
@@ -51,7 +171,7 @@ class HealthCalculator:
             weight_kg: Weight in kilograms
             height_cm: Height in centimeters
             age: Age in years
-            gender: 'male' or 'female'
+            gender: Gender, or 'male' / 'female'
 
         Returns:
             BMR in calories per day
@@ -59,7 +179,12 @@ class HealthCalculator:
         # Mifflin-St Jeor Equation
         bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age)
 
-        if gender.lower() == 'male':
+        if isinstance(gender, Gender):
+            is_male = gender is Gender.MALE
+        else:
+            is_male = gender == 'male' or gender.lower() == 'male'
+
+        if is_male:
             bmr += 5
         else:  # female
             bmr -= 161
@@ -86,24 +211,19 @@ class HealthCalculator:
         Returns:
             TDEE in calories per day
         """
-        activity_multipliers = {
-            'sedentary': 1.2,
-            'lightly_active': 1.375,
-            'moderately_active': 1.55,
-            'very_active': 1.725,
-            'extra_active': 1.9
-        }
-
-        multiplier = activity_multipliers.get(activity_level.lower(), 1.2)
+        multiplier = _ACTIVITY_MULTIPLIERS.get(activity_level)
+        if multiplier is None:
+            multiplier = _ACTIVITY_MULTIPLIERS.get(activity_level.lower(), 1.2)
         tdee = bmr * multiplier
         return round(tdee, 2)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def calculate_macro_targets(
         tdee: float,
         goal: str = 'maintain',
         protein_per_kg: float = 2.0
-    ) -> Dict[str, float]:
+    ) -> MacroTargets:
         """
         Calculate macro nutrient targets.
 
@@ -113,7 +233,7 @@ class HealthCalculator:
             protein_per_kg: Protein intake per kg of body weight
 
         Returns:
-            Dictionary with calorie and macro targets
+            MacroTargets (cached and shared between callers)
         """
         # Adjust calories based on goal
         if goal == 'lose':
@@ -125,16 +245,12 @@ class HealthCalculator:
 
         # Standard macro split (can be customized)
         # Protein: 30%, Carbs: 40%, Fat: 30%
-        protein_calories = target_calories * 0.30
-        carb_calories = target_calories * 0.40
-        fat_calories = target_calories * 0.30
-
-        return {
-            'calories': round(target_calories, 0),
-            'protein_g': round(protein_calories / 4, 0),  # 4 cal per gram
-            'carbs_g': round(carb_calories / 4, 0),  # 4 cal per gram
-            'fat_g': round(fat_calories / 9, 0),  # 9 cal per gram
-        }
+        return MacroTargets(
+            round(target_calories, 0),
+            round(target_calories * _PROTEIN_G_PER_CAL, 0),
+            round(target_calories * _CARBS_G_PER_CAL, 0),
+            round(target_calories * _FAT_G_PER_CAL, 0),
+        )
 
     @staticmethod
     def calculate_ideal_weight_range(height_cm: float, gender: str) -> Tuple[float, float]:
@@ -150,11 +266,28 @@ class HealthCalculator:
         """
         # Based on BMI range 18.5-24.9
         height_m = height_cm / 100
-        min_weight = 18.5 * (height_m ** 2)
-        max_weight = 24.9 * (height_m ** 2)
+        height_sq = height_m * height_m
+        min_weight = 18.5 * height_sq
+        max_weight = 24.9 * height_sq
 
         return (round(min_weight, 1), round(max_weight, 1))
 
+    @staticmethod
+    def calculate_ideal_weight_range_batch(height_cm, dtype=np.float64) -> np.ndarray:
+        """
+        Ideal weight ranges for many heights at once.
+
+        Returns:
+            2xN array: row 0 holds min_weight_kg, row 1 max_weight_kg
+        """
+        height_m = _as_float_array(height_cm, dtype) / 100
+        height_sq = height_m * height_m
+
+        weights = np.empty((2,) + height_sq.shape, dtype=dtype)
+        np.multiply(height_sq, 18.5, out=weights[0])
+        np.multiply(height_sq, 24.9, out=weights[1])
+        return np.round(weights, 1, out=weights)
+
     @staticmethod
     def estimate_calories_burned(
         exercise_type: str,
@@ -174,21 +307,9 @@ class HealthCalculator:
         Returns:
             Estimated calories burned
         """
-        # MET (Metabolic Equivalent of Task) values
-        met_values = {
-            'walking': 3.5,
-            'running': 8.0,
-            'cycling': 6.0,
-            'swimming': 7.0,
-            'yoga': 3.0,
-            'strength': 5.0,
-            'cardio': 7.0,
-            'sports': 6.5,
-            'flexibility': 2.5,
-            'other': 5.0,
-        }
-
-        base_met = met_values.get(exercise_type.lower(), 5.0)
+        base_met = _MET_VALUES.get(exercise_type)
+        if base_met is None:
+            base_met = _MET_VALUES.get(exercise_type.lower(), 5.0)
 
         # Adjust MET based on intensity (1-10 scale)
         intensity_multiplier = 0.7 + (intensity * 0.06)  # Range: 0.76 to 1.3
@@ -235,7 +356,7 @@ class HealthCalculator:
         nutrition_score: Optional[float] = None,
         blood_pressure_systolic: Optional[int] = None,
         heart_rate: Optional[int] = None,
-    ) -> Dict[str, any]:
+    ) -> HealthScoreResult:
         """
         Calculate overall health score (0-100).
 
@@ -247,10 +368,8 @@ class HealthCalculator:
         - Vitals Score (15 points)
 
         Returns:
-            Dictionary with overall score and breakdown
+            HealthScoreResult; use as_dict() for the overall score and breakdown
         """
-        scores = {}
-
         # 1. BMI Score (20 points)
         if bmi:
             if 18.5 <= bmi < 25:
@@ -263,7 +382,6 @@ class HealthCalculator:
                 bmi_score = 5
         else:
             bmi_score = 0
-        scores['bmi'] = {'score': bmi_score, 'max': 20}
 
         # 2. Sleep Score (20 points)
         if sleep_avg:
@@ -277,7 +395,6 @@ class HealthCalculator:
                 sleep_score = 5
         else:
             sleep_score = 0
-        scores['sleep'] = {'score': sleep_score, 'max': 20}
 
         # 3. Exercise Score (25 points)
         if exercise_days is not None:
@@ -291,7 +408,6 @@ class HealthCalculator:
                 exercise_score = 5
         else:
             exercise_score = 0
-        scores['exercise'] = {'score': exercise_score, 'max': 25}
 
         # 4. Nutrition Score (20 points)
         if nutrition_score is not None:
@@ -299,7 +415,7 @@ class HealthCalculator:
             nutrition_points = (nutrition_score / 100) * 20
         else:
             nutrition_points = 0
-        scores['nutrition'] = {'score': round(nutrition_points, 2), 'max': 20}
+        nutrition_points = round(nutrition_points, 2)
 
         # 5. Vitals Score (15 points)
         vitals_score = 0
@@ -323,36 +439,27 @@ class HealthCalculator:
             else:
                 vitals_score += 2.5
 
-        scores['vitals'] = {'score': round(vitals_score, 2), 'max': 15}
+        vitals_score = round(vitals_score, 2)
 
         # Calculate total
-        total_score = sum(s['score'] for s in scores.values())
-        max_score = sum(s['max'] for s in scores.values())
+        total_score = bmi_score + sleep_score + exercise_score + nutrition_points + vitals_score
+        max_score = 100  # 20 + 20 + 25 + 20 + 15
 
         # Calculate percentage
-        percentage = (total_score / max_score * 100) if max_score > 0 else 0
-
-        # Determine grade
-        if percentage >= 90:
-            grade = "A+"
-        elif percentage >= 80:
-            grade = "A"
-        elif percentage >= 70:
-            grade = "B"
-        elif percentage >= 60:
-            grade = "C"
-        elif percentage >= 50:
-            grade = "D"
-        else:
-            grade = "F"
+        percentage = total_score / max_score * 100
 
-        return {
-            'overall_score': round(total_score, 2),
-            'max_score': max_score,
-            'percentage': round(percentage, 2),
-            'grade': grade,
-            'breakdown': scores
-        }
+        grade = _GRADES[bisect_right(_GRADE_CUTS, percentage)]
+
+        return HealthScoreResult(
+            bmi_score,
+            sleep_score,
+            exercise_score,
+            nutrition_points,
+            vitals_score,
+            round(total_score, 2),
+            round(percentage, 2),
+            grade,
+        )
 
     @staticmethod
     def calculate_nutrition_score(
@@ -376,53 +483,240 @@ class HealthCalculator:
         Returns:
             Nutrition score (0-100)
         """
-        scores = []
+        # Running total of component scores; fiber only counts toward the
+        # average when it earns a bonus
+        components = 4
 
         # Calorie score (within 10% of target)
         cal_diff = abs(calories - target_calories) / target_calories
         if cal_diff <= 0.1:
-            scores.append(100)
+            total = 100
         elif cal_diff <= 0.2:
-            scores.append(80)
+            total = 80
         elif cal_diff <= 0.3:
-            scores.append(60)
+            total = 60
         else:
-            scores.append(40)
+            total = 40
 
         # Protein score
         protein_diff = abs(protein - target_protein) / target_protein
         if protein_diff <= 0.15:
-            scores.append(100)
+            total += 100
         elif protein_diff <= 0.3:
-            scores.append(75)
+            total += 75
         else:
-            scores.append(50)
+            total += 50
 
         # Carbs score
         carbs_diff = abs(carbs - target_carbs) / target_carbs
         if carbs_diff <= 0.2:
-            scores.append(100)
+            total += 100
         elif carbs_diff <= 0.4:
-            scores.append(75)
+            total += 75
         else:
-            scores.append(50)
+            total += 50
 
         # Fat score
         fat_diff = abs(fat - target_fat) / target_fat
         if fat_diff <= 0.2:
-            scores.append(100)
+            total += 100
         elif fat_diff <= 0.4:
-            scores.append(75)
+            total += 75
         else:
-            scores.append(50)
+            total += 50
 
         # Fiber bonus (if provided)
         if fiber and fiber >= 25:
-            scores.append(100)
+            total += 100
+            components = 5
         elif fiber and fiber >= 20:
-            scores.append(80)
+            total += 80
+            components = 5
 
-        return round(sum(scores) / len(scores), 2)
+        return round(total / components, 2)
+
+    # ==================== BATCH (NumPy) ====================
+    # Population-wide versions of the scorers above. Inputs are equal-length
+    # array-likes; NaN (or None) marks a missing value, as None does for the scalars.
+    # dtype=np.float32 halves the working set for large cohorts; results then match
+    # the scalar methods only to float32 precision.
+
+    @staticmethod
+    def calculate_bmi_batch(weight_kg, height_cm, dtype=np.float64) -> np.ndarray:
+        """BMI for many weight/height pairs at once (e.g. bulk measurement imports)"""
+        height_m = _as_float_array(height_cm, dtype) / 100
+        bmi = _as_float_array(weight_kg, dtype) / (height_m * height_m)
+        return np.round(bmi, 2, out=bmi)
+
+    @staticmethod
+    def calculate_bmr_batch(weight_kg, height_cm, age, gender_code, dtype=np.float64) -> np.ndarray:
+        """BMR for many people at once; gender_code holds Gender values (e.g. an int8 array)"""
+        bmr = (
+            10 * _as_float_array(weight_kg, dtype)
+            + 6.25 * _as_float_array(height_cm, dtype)
+            - 5 * _as_float_array(age, dtype)
+        )
+        bmr += np.where(np.asarray(gender_code) == Gender.MALE, 5, -161)
+        return np.round(bmr, 2, out=bmr)
+
+    @staticmethod
+    def calculate_health_score_batch(
+        bmi,
+        sleep_avg,
+        exercise_days,
+        nutrition_score,
+        blood_pressure_systolic,
+        heart_rate,
+        dtype=np.float64,
+        workers: int = 1,
+    ) -> np.recarray:
+        """
+        Score many users at once with the same bands as calculate_health_score.
+
+        With workers > 1, large cohorts are split into contiguous row chunks scored on
+        a thread pool; NumPy releases the GIL inside its array kernels.
+
+        Returns:
+            Record array with one row per user and HealthScoreResult's fields as columns
+        """
+        bmi = _as_float_array(bmi, dtype)
+        sleep_avg = _as_float_array(sleep_avg, dtype)
+        exercise_days = _as_float_array(exercise_days, dtype)
+        nutrition_score = _as_float_array(nutrition_score, dtype)
+        systolic = _as_float_array(blood_pressure_systolic, dtype)
+        heart_rate = _as_float_array(heart_rate, dtype)
+
+        rows = bmi.shape[0]
+        if workers > 1 and rows >= workers * _PARALLEL_MIN_ROWS:
+            columns = (bmi, sleep_avg, exercise_days, nutrition_score, systolic, heart_rate)
+            bounds = np.linspace(0, rows, workers + 1, dtype=np.intp)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunks = pool.map(
+                    lambda start, stop: HealthCalculator.calculate_health_score_batch(
+                        *(column[start:stop] for column in columns), dtype=dtype
+                    ),
+                    bounds[:-1],
+                    bounds[1:],
+                )
+                return np.concatenate(list(chunks)).view(np.recarray)
+
+        # Missing (NaN) and zero readings score nothing, like the scalar truthiness checks;
+        # NaN fails every comparison, so those rows fall through to the default
+        bmi_score = _select(
+            [
+                (bmi >= 18.5) & (bmi < 25),
+                ((bmi >= 17) & (bmi < 18.5)) | ((bmi >= 25) & (bmi < 27)),
+                ((bmi >= 16) & (bmi < 17)) | ((bmi >= 27) & (bmi < 30)),
+                bmi != 0,
+            ],
+            [20.0, 15.0, 10.0, 5.0],
+            0.0,
+            dtype,
+        )
+        bmi_score[np.isnan(bmi)] = 0.0
+
+        sleep_score = _select(
+            [
+                (sleep_avg >= 7) & (sleep_avg <= 9),
+                ((sleep_avg >= 6) & (sleep_avg < 7)) | ((sleep_avg > 9) & (sleep_avg <= 10)),
+                ((sleep_avg >= 5) & (sleep_avg < 6)) | ((sleep_avg > 10) & (sleep_avg <= 11)),
+                sleep_avg != 0,
+            ],
+            [20.0, 15.0, 10.0, 5.0],
+            0.0,
+            dtype,
+        )
+        sleep_score[np.isnan(sleep_avg)] = 0.0
+
+        # Zero exercise days still earns the floor score; only missing earns nothing
+        exercise_score = _select(
+            [exercise_days >= 5, exercise_days >= 3, exercise_days >= 1, ~np.isnan(exercise_days)],
+            [25.0, 20.0, 15.0, 5.0],
+            0.0,
+            dtype,
+        )
+
+        nutrition_points = np.nan_to_num(nutrition_score) / 100 * 20
+        np.round(nutrition_points, 2, out=nutrition_points)
+
+        systolic_score = _select(
+            [(systolic >= 90) & (systolic <= 120), (systolic >= 121) & (systolic <= 129), systolic != 0],
+            [7.5, 5.0, 2.5],
+            0.0,
+            dtype,
+        )
+        systolic_score[np.isnan(systolic)] = 0.0
+        heart_rate_score = _select(
+            [
+                (heart_rate >= 60) & (heart_rate <= 80),
+                ((heart_rate >= 50) & (heart_rate < 60)) | ((heart_rate > 80) & (heart_rate <= 100)),
+                heart_rate != 0,
+            ],
+            [7.5, 5.0, 2.5],
+            0.0,
+            dtype,
+        )
+        heart_rate_score[np.isnan(heart_rate)] = 0.0
+        vitals_score = systolic_score + heart_rate_score
+
+        total_score = bmi_score + sleep_score + exercise_score + nutrition_points + vitals_score
+        # Component maxima always sum to 100, so the score is its own percentage;
+        # grade on the unrounded value, then round once for both columns
+        grade = _GRADES_ARRAY[np.searchsorted(_GRADE_CUTS, total_score, side='right')]
+        np.round(total_score, 2, out=total_score)
+
+        return np.rec.fromarrays(
+            [
+                bmi_score,
+                sleep_score,
+                exercise_score,
+                nutrition_points,
+                vitals_score,
+                total_score,
+                total_score,
+                grade,
+            ],
+            names=HealthScoreResult._fields,
+        )
+
+    @staticmethod
+    def calculate_nutrition_score_batch(
+        calories,
+        protein,
+        carbs,
+        fat,
+        fiber=None,
+        target_calories=2000,
+        target_protein=150,
+        target_carbs=200,
+        target_fat=65,
+        dtype=np.float64,
+    ) -> np.ndarray:
+        """
+        Nutrition scores (0-100) for many intakes at once, with the same bands as
+        calculate_nutrition_score. Targets may be scalars or per-row arrays.
+        """
+        calories = _as_float_array(calories, dtype)
+        rows = calories.shape[0]
+
+        # One row per component; fiber only counts when it earns a bonus
+        scores = np.empty((5, rows), dtype=dtype)
+        cal_diff = np.abs(calories - target_calories) / target_calories
+        scores[0] = np.select([cal_diff <= 0.1, cal_diff <= 0.2, cal_diff <= 0.3], [100, 80, 60], default=40)
+        protein_diff = np.abs(_as_float_array(protein, dtype) - target_protein) / target_protein
+        scores[1] = np.select([protein_diff <= 0.15, protein_diff <= 0.3], [100, 75], default=50)
+        carbs_diff = np.abs(_as_float_array(carbs, dtype) - target_carbs) / target_carbs
+        scores[2] = np.select([carbs_diff <= 0.2, carbs_diff <= 0.4], [100, 75], default=50)
+        fat_diff = np.abs(_as_float_array(fat, dtype) - target_fat) / target_fat
+        scores[3] = np.select([fat_diff <= 0.2, fat_diff <= 0.4], [100, 75], default=50)
+
+        fiber = np.full(rows, np.nan, dtype=dtype) if fiber is None else _as_float_array(fiber, dtype)
+        scores[4] = np.select([fiber >= 25, fiber >= 20], [100, 80], default=0)
+        counts = (scores[4] > 0).astype(dtype)
+        counts += 4
+
+        nutrition_scores = scores.sum(axis=0) / counts
+        return np.round(nutrition_scores, 2, out=nutrition_scores)
 
     @staticmethod
     def get_blood_pressure_category(systolic: int, diastolic: int) -> str:
@@ -438,6 +732,25 @@ class HealthCalculator:
         else:
             return "Hypertensive Crisis"
 
+    @staticmethod
+    def get_blood_pressure_category_batch(systolic, diastolic) -> np.ndarray:
+        """
+        Blood pressure categories for many readings at once. Integer readings in
+        range are a single gather from the precomputed table.
+        """
+        systolic = np.asarray(systolic)
+        diastolic = np.asarray(diastolic)
+        if (
+            systolic.dtype.kind in 'iu' and diastolic.dtype.kind in 'iu'
+            and systolic.size and diastolic.size
+            and 0 <= systolic.min() and systolic.max() < 256
+            and 0 <= diastolic.min() and diastolic.max() < 256
+        ):
+            codes = _BP_CODES[systolic, diastolic]
+        else:
+            codes = _bp_category_codes(systolic, diastolic)
+        return _BP_LABELS_ARRAY[codes]
+
     @staticmethod
     def get_heart_rate_category(heart_rate: int, age: int) -> str:
         """Get heart rate category for adults"""
@@ -453,13 +766,10 @@ class HealthCalculator:
             return "High (Tachycardia)"
 
 
-# Singleton instance
-_calculator = None
+# Singleton instance; the calculator is stateless, so build it at import
+_calculator = HealthCalculator()
 
 
 def get_health_calculator() -> HealthCalculator:
-    """Get or create the singleton calculator instance"""
-    global _calculator
-    if _calculator is None:
-        _calculator = HealthCalculator()
+    """Get the singleton calculator instance"""
     return _calculator
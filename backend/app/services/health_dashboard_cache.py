@@ -0,0 +1,38 @@
+"""
+Health Dashboard Cache
+Per-process TTL cache of each user's health dashboard for the current day
+"""
+
+import threading
+from datetime import date
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+
+# Dashboards are rebuilt on the user's own health writes; the TTL bounds staleness
+# across worker processes and for data written elsewhere (e.g. backup imports)
+_DASHBOARD_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_lock = threading.Lock()
+
+
+def get_cached_dashboard(user_id: int) -> Optional[Dict[str, Any]]:
+    """Get today's cached dashboard for a user, or None on a miss"""
+    with _lock:
+        cached = _DASHBOARD_CACHE.get(user_id)
+    if cached is None or cached[0] != date.today():
+        return None
+    return cached[1]
+
+
+def cache_dashboard(user_id: int, dashboard: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a freshly built dashboard and return it"""
+    with _lock:
+        _DASHBOARD_CACHE[user_id] = (date.today(), dashboard)
+    return dashboard
+
+
+def invalidate_dashboard(user_id: int):
+    """Drop a user's cached dashboard after their health data changes"""
+    with _lock:
+        _DASHBOARD_CACHE.pop(user_id, None)
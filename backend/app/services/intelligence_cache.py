@@ -0,0 +1,54 @@
+"""
+Intelligence Result Cache
+Per-process cache of each user's cross-pillar analyses for the current UTC day
+"""
+
+import functools
+import threading
+from datetime import datetime
+from typing import Dict
+
+from cachetools import TTLCache
+
+
+# Analyses read weeks of rows that change a few times a day; the TTL bounds staleness
+# across worker processes and for writes that do not invalidate
+_RESULT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_lock = threading.Lock()
+
+# Bumped on invalidation so a user's older entries stop matching and age out
+_generations: Dict[int, int] = {}
+
+_MISSING = object()
+
+
+def cached_daily(method):
+    """
+    Memoize an IntelligenceEngine method per (user, method, arguments, UTC day).
+    Results are shared between callers and must be treated as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _lock:
+            key = (
+                self.user_id,
+                _generations.get(self.user_id, 0),
+                method.__name__,
+                args,
+                frozenset(kwargs.items()),
+                datetime.utcnow().date(),
+            )
+            result = _RESULT_CACHE.get(key, _MISSING)
+        if result is _MISSING:
+            result = method(self, *args, **kwargs)
+            with _lock:
+                _RESULT_CACHE[key] = result
+        return result
+
+    return wrapper
+
+
+def invalidate_intelligence(user_id: int):
+    """Drop a user's cached analyses after data they depend on changes"""
+    with _lock:
+        _generations[user_id] = _generations.get(user_id, 0) + 1
@@ -3,19 +3,121 @@ AI-Powered Intelligence Engine for Wellbeing Analysis
 Provides correlation analysis, insights, recommendations, and predictions
 """
 
+import heapq
 import numpy as np
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from scipy import stats
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Any, Optional
+from datetime import date, datetime, time, timedelta
+from typing import Callable, List, Dict, Tuple, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import Date, Float, cast, func, and_, literal, select, union_all
+from sqlalchemy.sql import Select
 
-from app.models.financial import Transaction, Budget, FinancialGoal
+from app.core.database import SessionLocal
+from app.models.financial import Transaction, TransactionType, Budget, FinancialGoal
 from app.models.health import Meal, Biometric, Exercise as HealthExercise
-from app.models.work_life import WorkSession, Meeting, BoundaryViolation
+from app.models.work_life import WorkSession, Meeting, Boundary, BoundaryViolation
 from app.models.productivity import Task, DeepWorkSession, Distraction, TaskStatus
 from app.models.wellbeing import MoodEntry, SleepEntry
-from app.models.intelligence import Correlation, Insight, Recommendation, Prediction
+from app.services.intelligence_cache import cached_daily
+
+
+# Cross-pillar metric pairs reported by analyze_correlations: (pillar, metric, pillar, metric)
+_CORRELATION_PAIRS = (
+    ("financial", "daily_spending", "wellbeing", "stress_levels"),
+    ("worklife", "daily_work_hours", "health", "sleep_hours"),
+    ("worklife", "daily_work_hours", "health", "sleep_quality"),
+    ("worklife", "daily_work_hours", "health", "exercise_minutes"),
+    ("health", "sleep_hours", "productivity", "focus_scores"),
+    ("health", "sleep_quality", "productivity", "focus_scores"),
+    ("health", "exercise_minutes", "wellbeing", "mood_scores"),
+    ("worklife", "daily_meeting_hours", "productivity", "focus_scores"),
+)
+
+# Rows of the metric x day matrix, one per metric appearing in a pair
+_CORRELATION_METRICS = tuple(dict.fromkeys(
+    metric for _, metric_1, _, metric_2 in _CORRELATION_PAIRS for metric in (metric_1, metric_2)
+))
+
+# Upper bound on threads per generate_insights / generate_recommendations call
+_MAX_ANALYZER_WORKERS = 8
+
+# Numeric weight of a recommendation's expected_impact when ranking
+_IMPACT_SCORES = {"low": 1, "medium": 2, "high": 3}
+
+# Fewest overlapping days for which a correlation is reported
+_MIN_CORRELATION_SAMPLES = 10
+
+# Standard deviations above the mean at which a day's spending is flagged
+_SPENDING_ANOMALY_Z = 2.0
+
+DailySeries = Dict[date, float]
+
+
+def _pairwise_pearson(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pearson r, two-sided p-value and sample size for every pair of rows of X
+    (metrics x days). NaN marks a missing day; each pair uses the days both rows
+    have, so all pairs come out of a few matrix products instead of one
+    pearsonr call per pair. A stack of matrices (users x metrics x days) is
+    handled in the same products, giving one metrics x metrics result per user.
+    """
+    present = ~np.isnan(X)
+    weights = present.astype(np.float64)
+    values = np.where(present, X, 0.0)
+    weights_T = weights.swapaxes(-1, -2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Centering first keeps the sum-of-squares formulas well conditioned
+        means = values.sum(axis=-1, keepdims=True) / weights.sum(axis=-1, keepdims=True)
+        centered = np.where(present, values - means, 0.0)
+
+        n = weights @ weights_T
+        sums = centered @ weights_T  # sums[i, j]: row i summed over days row j also has
+        squares = (centered * centered) @ weights_T
+        products = centered @ centered.swapaxes(-1, -2)
+
+        covariance = products - sums * sums.swapaxes(-1, -2) / n
+        variance = squares - sums * sums / n
+        # A constant overlap leaves only rounding noise; report no correlation, like pearsonr
+        variance[variance <= 1e-12 * ((values * values) @ weights_T)] = 0.0
+        r = np.clip(covariance / np.sqrt(variance * variance.swapaxes(-1, -2)), -1.0, 1.0)
+
+        dof = n - 2
+        t = r * np.sqrt(dof / (1 - r * r))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+
+    return r, p, n
+
+
+def _zscore_anomalies(values: np.ndarray, threshold: float) -> Tuple[np.ndarray, float, float]:
+    """
+    Find values more than threshold population standard deviations above the mean.
+    Returns their indices along with the mean and standard deviation.
+    """
+    mean = values.mean()
+    # Centre once and reuse the deviations for both the spread and the test
+    deviations = values - mean
+    std = np.sqrt(np.dot(deviations, deviations) / values.size)
+    return np.flatnonzero(deviations > threshold * std), float(mean), float(std)
+
+
+def _recommendation_rank(recommendation: Dict[str, Any]) -> Tuple[int, int]:
+    """Sort key putting higher priority, then higher expected impact, first"""
+    return -recommendation["priority"], -_IMPACT_SCORES.get(recommendation["expected_impact"], 0)
+
+
+def burnout_risk_score(avg_daily_hours, violations, avg_sleep_quality) -> np.ndarray:
+    """
+    Burnout risk from daily work hours, boundary violations and sleep quality (1-10).
+    Takes scalars or equal-length arrays (one entry per user) and returns matching scores.
+    """
+    hours_term = np.clip((np.asarray(avg_daily_hours, dtype=np.float64) - 8) * 5, 0, 40)
+    violations_term = np.clip(np.asarray(violations, dtype=np.float64) * 2.5, 0, 30)
+    sleep_term = np.clip((7 - np.asarray(avg_sleep_quality, dtype=np.float64)) * 4, 0, None)
+    return hours_term + violations_term + sleep_term
 
 
 class IntelligenceEngine:
@@ -24,44 +126,208 @@ class IntelligenceEngine:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
+        # Results are cached per UTC day, so every window is anchored to that day's start
+        self._today = datetime.utcnow().date()
+
+    def _cutoff(self, days: int) -> datetime:
+        """Start of the UTC day `days` days before today"""
+        return datetime.combine(self._today - timedelta(days=days), time.min)
 
     # ==================== CORRELATION ANALYSIS ====================
 
+    @cached_daily
     def analyze_correlations(self, days: int = 90) -> List[Dict[str, Any]]:
         """Analyze correlations between metrics across all pillars"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        metric_index, r, p, n = self._get_correlation_matrix(days)
+
         correlations = []
+        for pillar_1, metric_1, pillar_2, metric_2 in _CORRELATION_PAIRS:
+            i, j = metric_index[metric_1], metric_index[metric_2]
+            if n[i, j] < _MIN_CORRELATION_SAMPLES or np.isnan(r[i, j]):
+                continue
+            correlations.append(self._calculate_correlation(
+                r[i, j], p[i, j], int(n[i, j]), pillar_1, metric_1, pillar_2, metric_2
+            ))
+
+        return correlations
 
-        # Get time series data for various metrics
-        financial_data = self._get_financial_timeseries(cutoff_date)
-        health_data = self._get_health_timeseries(cutoff_date)
-        worklife_data = self._get_worklife_timeseries(cutoff_date)
-        productivity_data = self._get_productivity_timeseries(cutoff_date)
-        wellbeing_data = self._get_wellbeing_timeseries(cutoff_date)
+    def partial_correlation(
+        self,
+        metric_1: str,
+        metric_2: str,
+        controls: Tuple[str, ...],
+        days: int = 90
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Correlate two metrics while controlling for others (e.g. spending vs stress given sleep),
+        from the cached correlation matrix rather than the raw series
+        """
+        metric_index, r, _, n = self._get_correlation_matrix(days)
+        if any(metric not in metric_index for metric in (metric_1, metric_2, *controls)):
+            return None
 
-        # Analyze cross-pillar correlations
-        correlations.extend(self._correlate_spending_vs_stress(financial_data, wellbeing_data))
-        correlations.extend(self._correlate_work_hours_vs_health(worklife_data, health_data))
-        correlations.extend(self._correlate_sleep_vs_productivity(health_data, productivity_data))
-        correlations.extend(self._correlate_exercise_vs_mood(health_data, wellbeing_data))
-        correlations.extend(self._correlate_meetings_vs_focus(worklife_data, productivity_data))
+        pair = [metric_index[metric_1], metric_index[metric_2]]
+        given = [metric_index[metric] for metric in controls]
+        block = pair + given
+        sample_size = int(n[np.ix_(block, block)].min())
+        dof = sample_size - 2 - len(given)
+        R = r[np.ix_(block, block)].astype(np.float64)
+        if dof < 1 or np.isnan(R).any():
+            return None
 
-        return correlations
+        # Conditional correlation is the Schur complement of the controls' block
+        H0 = R[:2, :2]
+        H1 = R[:2, 2:]
+        H2 = R[2:, 2:]
+        try:
+            S = H0 - H1 @ np.linalg.solve(H2, H1.T) if given else H0
+        except np.linalg.LinAlgError:
+            return None
+
+        denominator = np.sqrt(S[0, 0] * S[1, 1])
+        if not denominator > 0:
+            return None
+        partial_r = float(np.clip(S[0, 1] / denominator, -1.0, 1.0))
+
+        with np.errstate(divide='ignore'):
+            t = partial_r * np.sqrt(dof / (1 - partial_r * partial_r))
+        p_value = float(2 * stats.t.sf(abs(t), dof))
+
+        return {
+            "metric_1": metric_1,
+            "metric_2": metric_2,
+            "controlling_for": list(controls),
+            "partial_correlation": round(partial_r, 3),
+            "p_value": round(p_value, 4),
+            "sample_size": sample_size,
+            "is_significant": p_value < 0.05,
+        }
+
+    def lagged_correlation(
+        self,
+        metric_1: str,
+        metric_2: str,
+        lag_days: int,
+        days: int = 90
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Correlate metric_1 on each day with metric_2 lag_days later
+        (e.g. whether a day's spending is followed by higher stress)
+        """
+        metric_index, X = self._get_metric_matrix(days)
+        if metric_1 not in metric_index or metric_2 not in metric_index or not 0 <= lag_days < X.shape[1]:
+            return None
+
+        # Shift one row against the other along the calendar axis and correlate the overlap
+        leading = X[metric_index[metric_1], :X.shape[1] - lag_days]
+        trailing = X[metric_index[metric_2], lag_days:]
+        r, p, n = _pairwise_pearson(np.vstack((leading, trailing)))
+        if n[0, 1] < _MIN_CORRELATION_SAMPLES or np.isnan(r[0, 1]):
+            return None
+
+        return {
+            "metric_1": metric_1,
+            "metric_2": metric_2,
+            "lag_days": lag_days,
+            "correlation_coefficient": round(float(r[0, 1]), 3),
+            "p_value": round(float(p[0, 1]), 4),
+            "sample_size": int(n[0, 1]),
+            "is_significant": bool(p[0, 1] < 0.05),
+        }
+
+    @cached_daily
+    def _get_metric_matrix(self, days: int) -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Every daily metric aligned on one calendar-day axis, built once per user and day.
+        Returns the metric -> row index map and a metrics x days matrix, NaN where a day has no data.
+        """
+        cutoff_date = self._cutoff(days)
+
+        # Get daily time series for every metric, keyed by metric name
+        series = self._get_daily_metrics(cutoff_date)
+
+        metric_index = {metric: i for i, metric in enumerate(dict.fromkeys((*_CORRELATION_METRICS, *series)))}
+        observed_days = set().union(*series.values())
+        if not observed_days:
+            return metric_index, np.full((len(metric_index), 0), np.nan)
+
+        # Consecutive columns are consecutive calendar days, so shifting by k columns lags by k days
+        first_day = min(observed_days)
+        X = np.full((len(metric_index), (max(observed_days) - first_day).days + 1), np.nan)
+        for metric, i in metric_index.items():
+            row = X[i]
+            for day, value in series.get(metric, {}).items():
+                row[(day - first_day).days] = value
+
+        return metric_index, X
+
+    @cached_daily
+    def _get_correlation_matrix(
+        self,
+        days: int
+    ) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pairwise correlations between every daily metric, built once per user and day.
+        Returns the metric -> row index map with the r, p-value and overlap count matrices.
+        """
+        metric_index, X = self._get_metric_matrix(days)
+        r, p, n = _pairwise_pearson(X)
+
+        # The matrices stay cached all day; reported values are rounded to 3-4 decimals,
+        # so single precision and 16-bit day counts lose nothing callers can see
+        return metric_index, r.astype(np.float32), p.astype(np.float32), n.astype(np.uint16)
+
+    @staticmethod
+    def analyze_correlations_batch(
+        db: Session,
+        user_ids: List[int],
+        days: int = 90
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Analyze correlations for many users at once (e.g. a nightly rebuild). Each user's
+        metric matrix is padded to a common width and all of them share one stacked
+        _pairwise_pearson pass instead of one per user.
+        """
+        engines = [IntelligenceEngine(db, user_id) for user_id in user_ids]
+        if not engines:
+            return {}
+
+        # Correlation pairs live within a user, so each matrix only needs padding, not alignment
+        matrices = [engine._get_metric_matrix(days) for engine in engines]
+        metric_index = {metric: i for i, metric in enumerate(_CORRELATION_METRICS)}
+        width = max(X.shape[1] for _, X in matrices)
+        stack = np.full((len(engines), len(metric_index), width), np.nan)
+        for k, (user_metrics, X) in enumerate(matrices):
+            for metric, i in metric_index.items():
+                stack[k, i, :X.shape[1]] = X[user_metrics[metric]]
+
+        r, p, n = _pairwise_pearson(stack)
+
+        results = {}
+        for k, engine in enumerate(engines):
+            correlations = []
+            for pillar_1, metric_1, pillar_2, metric_2 in _CORRELATION_PAIRS:
+                i, j = metric_index[metric_1], metric_index[metric_2]
+                if n[k, i, j] < _MIN_CORRELATION_SAMPLES or np.isnan(r[k, i, j]):
+                    continue
+                correlations.append(engine._calculate_correlation(
+                    r[k, i, j], p[k, i, j], int(n[k, i, j]), pillar_1, metric_1, pillar_2, metric_2
+                ))
+            results[engine.user_id] = correlations
+
+        return results
 
     def _calculate_correlation(
         self,
-        data1: List[float],
-        data2: List[float],
+        corr_coef: float,
+        p_value: float,
+        sample_size: int,
         pillar_1: str,
         metric_1: str,
         pillar_2: str,
         metric_2: str
-    ) -> Optional[Dict[str, Any]]:
-        """Calculate Pearson correlation between two metrics"""
-        if len(data1) < 10 or len(data2) < 10 or len(data1) != len(data2):
-            return None
-
-        corr_coef, p_value = stats.pearsonr(data1, data2)
+    ) -> Dict[str, Any]:
+        """Describe a Pearson correlation between two metrics"""
 
         # Determine strength and significance
         abs_corr = abs(corr_coef)
@@ -80,20 +346,19 @@ class IntelligenceEngine:
             "metric_1": metric_1,
             "pillar_2": pillar_2,
             "metric_2": metric_2,
-            "correlation_coefficient": round(corr_coef, 3),
-            "p_value": round(p_value, 4),
-            "sample_size": len(data1),
+            "correlation_coefficient": round(float(corr_coef), 3),
+            "p_value": round(float(p_value), 4),
+            "sample_size": sample_size,
             "strength": strength,
             "direction": direction,
-            "is_significant": is_significant,
+            "is_significant": bool(is_significant),
         }
 
     # ==================== INSIGHT GENERATION ====================
 
+    @cached_daily
     def generate_insights(self, time_period: str = "daily") -> List[Dict[str, Any]]:
         """Generate insights across all pillars"""
-        insights = []
-
         if time_period == "daily":
             days = 1
         elif time_period == "weekly":
@@ -101,97 +366,50 @@ class IntelligenceEngine:
         else:  # monthly
             days = 30
 
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = self._cutoff(days)
 
-        # Financial insights
-        insights.extend(self._analyze_spending_patterns(cutoff_date))
-        insights.extend(self._analyze_savings_rate(cutoff_date))
-
-        # Health insights
-        insights.extend(self._analyze_nutrition_trends(cutoff_date))
-        insights.extend(self._analyze_exercise_consistency(cutoff_date))
-        insights.extend(self._analyze_sleep_quality(cutoff_date))
-
-        # Work-life insights
-        insights.extend(self._analyze_work_hours(cutoff_date))
-        insights.extend(self._analyze_boundary_violations(cutoff_date))
-
-        # Productivity insights
-        insights.extend(self._analyze_task_completion(cutoff_date))
-        insights.extend(self._analyze_focus_patterns(cutoff_date))
-        insights.extend(self._analyze_distractions(cutoff_date))
-
-        # Cross-pillar insights
-        insights.extend(self._analyze_overall_wellbeing(cutoff_date))
-
-        return insights
+        return list(chain.from_iterable(self._run_concurrently(_INSIGHT_ANALYZERS, cutoff_date)))
 
     def _analyze_spending_patterns(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Analyze spending patterns and anomalies"""
         insights = []
 
-        transactions = self.db.query(Transaction).filter(
-            Transaction.user_id == self.user_id,
-            Transaction.date >= cutoff_date,
-            Transaction.transaction_type == 'expense'
-        ).all()
+        # Daily totals come back already summed by the database
+        (daily_spending,) = self._get_financial_timeseries(cutoff_date)
+        rows = self.db.execute(daily_spending).all()
 
-        if not transactions:
+        if not rows:
             return insights
 
-        daily_spending = {}
-        for t in transactions:
-            date = t.date.date()
-            daily_spending[date] = daily_spending.get(date, 0) + t.amount
-
-        if daily_spending:
-            amounts = list(daily_spending.values())
-            avg_spending = np.mean(amounts)
-            std_spending = np.std(amounts)
-
-            # Detect anomalies (> 2 std deviations)
-            for date, amount in daily_spending.items():
-                if amount > avg_spending + 2 * std_spending:
-                    insights.append({
-                        "type": "anomaly",
-                        "pillar": "financial",
-                        "title": "Unusual Spending Detected",
-                        "description": f"Your spending on {date} was ${amount:.2f}, significantly higher than your average of ${avg_spending:.2f}",
-                        "severity": "medium",
-                        "data": {"date": str(date), "amount": amount, "average": avg_spending}
-                    })
+        days = [row.day for row in rows]
+        amounts = np.fromiter((row.value for row in rows), dtype=np.float64, count=len(rows))
+        anomalies, avg_spending, _ = _zscore_anomalies(amounts, _SPENDING_ANOMALY_Z)
+
+        for i in anomalies:
+            day, amount = days[i], float(amounts[i])
+            insights.append({
+                "type": "anomaly",
+                "pillar": "financial",
+                "title": "Unusual Spending Detected",
+                "description": f"Your spending on {day} was ${amount:.2f}, significantly higher than your average of ${avg_spending:.2f}",
+                "severity": "medium",
+                "data": {"date": str(day), "amount": amount, "average": avg_spending}
+            })
 
         return insights
 
     # ==================== RECOMMENDATION ENGINE ====================
 
+    @cached_daily
     def generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generate actionable recommendations across all pillars"""
-        recommendations = []
-
         # Get recent data
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-
-        # Financial recommendations
-        recommendations.extend(self._recommend_financial_actions(cutoff_date))
-
-        # Health recommendations
-        recommendations.extend(self._recommend_health_actions(cutoff_date))
-
-        # Work-life recommendations
-        recommendations.extend(self._recommend_worklife_actions(cutoff_date))
-
-        # Productivity recommendations
-        recommendations.extend(self._recommend_productivity_actions(cutoff_date))
+        cutoff_date = self._cutoff(30)
 
-        # Priority ranking
-        recommendations.sort(key=lambda x: (-x["priority"], -self._impact_score(x["expected_impact"])))
+        recommendations = chain.from_iterable(self._run_concurrently(_RECOMMENDERS, cutoff_date))
 
-        return recommendations[:10]  # Top 10 recommendations
-
-    def _impact_score(self, impact: str) -> int:
-        """Convert impact to numeric score"""
-        return {"low": 1, "medium": 2, "high": 3}.get(impact, 0)
+        # Priority ranking; a stable partial sort, same as sorting and taking the top 10
+        return heapq.nsmallest(10, recommendations, key=_recommendation_rank)
 
     # ==================== PREDICTIVE ANALYTICS ====================
 
@@ -212,38 +430,34 @@ class IntelligenceEngine:
 
         return predictions
 
+    @cached_daily
     def predict_burnout_risk(self) -> Dict[str, Any]:
         """Predict burnout risk based on work-life balance metrics"""
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-
-        # Get work hours
-        work_sessions = self.db.query(WorkSession).filter(
-            WorkSession.user_id == self.user_id,
-            WorkSession.start_time >= cutoff_date
-        ).all()
-
-        total_work_minutes = sum(s.duration_minutes or 0 for s in work_sessions)
-        avg_daily_hours = (total_work_minutes / 60) / 30
-
-        # Get boundary violations
-        violations = self.db.query(BoundaryViolation).filter(
-            BoundaryViolation.user_id == self.user_id,
-            BoundaryViolation.occurred_at >= cutoff_date
-        ).count()
-
-        # Get sleep quality
-        sleep_entries = self.db.query(SleepEntry).filter(
-            SleepEntry.user_id == self.user_id,
-            SleepEntry.created_at >= cutoff_date
-        ).all()
-
-        avg_sleep_quality = np.mean([s.sleep_quality for s in sleep_entries]) if sleep_entries else 5
+        cutoff_date = self._cutoff(30)
+
+        # Sum work hours, count boundary violations (owned through their boundary) and
+        # average sleep quality in the database, in a single round trip
+        total_work_hours, violations, avg_sleep_quality = self.db.execute(select(
+            select(func.coalesce(func.sum(WorkSession.duration_hours), 0.0)).where(
+                WorkSession.user_id == self.user_id,
+                WorkSession.start_time >= cutoff_date
+            ).scalar_subquery(),
+            select(func.count(BoundaryViolation.id))
+            .join(Boundary, BoundaryViolation.boundary_id == Boundary.id)
+            .where(
+                Boundary.user_id == self.user_id,
+                BoundaryViolation.violation_date >= cutoff_date
+            ).scalar_subquery(),
+            select(func.coalesce(cast(func.avg(SleepEntry.sleep_quality), Float), 5.0)).where(
+                SleepEntry.user_id == self.user_id,
+                SleepEntry.created_at >= cutoff_date
+            ).scalar_subquery()
+        )).one()
+
+        avg_daily_hours = total_work_hours / 30
 
         # Calculate burnout risk score
-        risk_score = 0
-        risk_score += min(40, (avg_daily_hours - 8) * 5) if avg_daily_hours > 8 else 0
-        risk_score += min(30, violations * 2.5)
-        risk_score += max(0, (7 - avg_sleep_quality) * 4)
+        risk_score = float(burnout_risk_score(avg_daily_hours, violations, avg_sleep_quality))
 
         risk_level = "low" if risk_score < 30 else "medium" if risk_score < 60 else "high"
         likelihood = "very_low" if risk_score < 20 else "low" if risk_score < 40 else "medium" if risk_score < 60 else "high" if risk_score < 80 else "very_high"
@@ -282,104 +496,132 @@ class IntelligenceEngine:
 
         return recs
 
-    # ==================== DATA RETRIEVAL HELPERS ====================
+    # ==================== CONCURRENCY ====================
 
-    def _get_financial_timeseries(self, cutoff_date: datetime) -> Dict[str, List[float]]:
-        """Get financial metrics over time"""
-        transactions = self.db.query(Transaction).filter(
-            Transaction.user_id == self.user_id,
-            Transaction.date >= cutoff_date
-        ).order_by(Transaction.date).all()
+    def _run_concurrently(
+        self,
+        analyzers: Tuple[Callable[..., List[Dict[str, Any]]], ...],
+        cutoff_date: datetime
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run independent analyzers on separate sessions to overlap their queries.
+        Results come back in the order the analyzers are listed.
+        """
+        with ThreadPoolExecutor(max_workers=min(len(analyzers), _MAX_ANALYZER_WORKERS)) as executor:
+            futures = [
+                executor.submit(self._run_in_own_session, analyzer, cutoff_date)
+                for analyzer in analyzers
+            ]
+            return [future.result() for future in futures]
+
+    def _run_in_own_session(
+        self,
+        analyzer: Callable[..., List[Dict[str, Any]]],
+        cutoff_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """Run one analyzer on a fresh session; sessions are not thread-safe"""
 
-        daily_spending = {}
-        for t in transactions:
-            if t.transaction_type == 'expense':
-                date = t.date.date()
-                daily_spending[date] = daily_spending.get(date, 0) + t.amount
+        with SessionLocal() as db:
+            return analyzer(IntelligenceEngine(db, self.user_id), cutoff_date)
 
-        return {"daily_spending": list(daily_spending.values())}
+    # ==================== DATA RETRIEVAL HELPERS ====================
 
-    def _get_health_timeseries(self, cutoff_date: datetime) -> Dict[str, List[float]]:
+    def _get_daily_metrics(self, cutoff_date: datetime) -> Dict[str, DailySeries]:
+        """
+        Get every pillar's daily metrics since cutoff_date in one round trip: the
+        per-metric GROUP BY queries are combined with UNION ALL into a single
+        long-format (metric, day, value) result.
+        """
+        selects = [
+            *self._get_financial_timeseries(cutoff_date),
+            *self._get_health_timeseries(cutoff_date),
+            *self._get_worklife_timeseries(cutoff_date),
+            *self._get_productivity_timeseries(cutoff_date),
+            *self._get_wellbeing_timeseries(cutoff_date),
+        ]
+        series: Dict[str, DailySeries] = defaultdict(dict)
+        for metric, day, value in self.db.execute(union_all(*selects)):
+            if value is not None:
+                series[metric][day] = value
+
+        return series
+
+    def _daily_select(self, metric: str, aggregate, value, timestamp, *criteria) -> Select:
+        """Query aggregating value per calendar day of timestamp, labelled with the metric name"""
+        day = func.date(timestamp, type_=Date)
+        return (
+            select(
+                literal(metric).label("metric"),
+                day.label("day"),
+                cast(aggregate(value), Float).label("value"),
+            )
+            .where(*criteria)
+            .group_by(day)
+        )
+
+    def _get_financial_timeseries(self, cutoff_date: datetime) -> List[Select]:
+        """Get financial metrics over time"""
+        return [
+            self._daily_select(
+                "daily_spending", func.sum, Transaction.amount, Transaction.transaction_date,
+                Transaction.user_id == self.user_id,
+                Transaction.transaction_date >= cutoff_date,
+                Transaction.transaction_type == TransactionType.EXPENSE
+            )
+        ]
+
+    def _get_health_timeseries(self, cutoff_date: datetime) -> List[Select]:
         """Get health metrics over time"""
-        sleep_data = self.db.query(SleepEntry).filter(
-            SleepEntry.user_id == self.user_id,
-            SleepEntry.created_at >= cutoff_date
-        ).order_by(SleepEntry.created_at).all()
-
-        exercise_data = self.db.query(HealthExercise).filter(
-            HealthExercise.user_id == self.user_id,
-            HealthExercise.performed_at >= cutoff_date
-        ).order_by(HealthExercise.performed_at).all()
-
-        return {
-            "sleep_hours": [s.sleep_hours for s in sleep_data],
-            "sleep_quality": [s.sleep_quality for s in sleep_data],
-            "exercise_minutes": [e.duration_minutes for e in exercise_data]
-        }
-
-    def _get_worklife_timeseries(self, cutoff_date: datetime) -> Dict[str, List[float]]:
+        sleep_criteria = (SleepEntry.user_id == self.user_id, SleepEntry.created_at >= cutoff_date)
+
+        return [
+            self._daily_select("sleep_hours", func.avg, SleepEntry.sleep_hours, SleepEntry.created_at, *sleep_criteria),
+            self._daily_select("sleep_quality", func.avg, SleepEntry.sleep_quality, SleepEntry.created_at, *sleep_criteria),
+            self._daily_select(
+                "exercise_minutes", func.sum, HealthExercise.duration_minutes, HealthExercise.exercise_date,
+                HealthExercise.user_id == self.user_id,
+                HealthExercise.exercise_date >= cutoff_date
+            )
+        ]
+
+    def _get_worklife_timeseries(self, cutoff_date: datetime) -> List[Select]:
         """Get work-life metrics over time"""
-        work_sessions = self.db.query(WorkSession).filter(
-            WorkSession.user_id == self.user_id,
-            WorkSession.start_time >= cutoff_date
-        ).order_by(WorkSession.start_time).all()
-
-        daily_work_hours = {}
-        for s in work_sessions:
-            date = s.start_time.date()
-            daily_work_hours[date] = daily_work_hours.get(date, 0) + (s.duration_minutes or 0) / 60
-
-        return {"daily_work_hours": list(daily_work_hours.values())}
-
-    def _get_productivity_timeseries(self, cutoff_date: datetime) -> Dict[str, List[float]]:
+        return [
+            self._daily_select(
+                "daily_work_hours", func.sum, WorkSession.duration_hours, WorkSession.start_time,
+                WorkSession.user_id == self.user_id,
+                WorkSession.start_time >= cutoff_date
+            ),
+            self._daily_select(
+                "daily_meeting_hours", func.sum, Meeting.duration_minutes / 60.0, Meeting.start_time,
+                Meeting.user_id == self.user_id,
+                Meeting.start_time >= cutoff_date
+            )
+        ]
+
+    def _get_productivity_timeseries(self, cutoff_date: datetime) -> List[Select]:
         """Get productivity metrics over time"""
-        deep_work = self.db.query(DeepWorkSession).filter(
-            DeepWorkSession.user_id == self.user_id,
-            DeepWorkSession.start_time >= cutoff_date
-        ).order_by(DeepWorkSession.start_time).all()
-
-        return {
-            "focus_scores": [dw.focus_score for dw in deep_work],
-            "deep_work_minutes": [dw.duration_minutes for dw in deep_work]
-        }
-
-    def _get_wellbeing_timeseries(self, cutoff_date: datetime) -> Dict[str, List[float]]:
+        deep_work_criteria = (DeepWorkSession.user_id == self.user_id, DeepWorkSession.start_time >= cutoff_date)
+
+        return [
+            self._daily_select(
+                "focus_scores", func.avg, DeepWorkSession.focus_score, DeepWorkSession.start_time, *deep_work_criteria
+            ),
+            self._daily_select(
+                "deep_work_minutes", func.sum, DeepWorkSession.duration_minutes, DeepWorkSession.start_time,
+                *deep_work_criteria
+            )
+        ]
+
+    def _get_wellbeing_timeseries(self, cutoff_date: datetime) -> List[Select]:
         """Get wellbeing metrics over time"""
-        mood_data = self.db.query(MoodEntry).filter(
-            MoodEntry.user_id == self.user_id,
-            MoodEntry.created_at >= cutoff_date
-        ).order_by(MoodEntry.created_at).all()
-
-        return {
-            "mood_scores": [m.mood_score for m in mood_data],
-            "stress_levels": [m.stress_level for m in mood_data],
-            "energy_levels": [m.energy_level for m in mood_data]
-        }
+        mood_criteria = (MoodEntry.user_id == self.user_id, MoodEntry.created_at >= cutoff_date)
 
-    def _correlate_spending_vs_stress(self, financial_data, wellbeing_data) -> List[Dict]:
-        """Correlate spending with stress levels"""
-        # Implementation placeholder
-        return []
-
-    def _correlate_work_hours_vs_health(self, worklife_data, health_data) -> List[Dict]:
-        """Correlate work hours with health metrics"""
-        # Implementation placeholder
-        return []
-
-    def _correlate_sleep_vs_productivity(self, health_data, productivity_data) -> List[Dict]:
-        """Correlate sleep with productivity"""
-        # Implementation placeholder
-        return []
-
-    def _correlate_exercise_vs_mood(self, health_data, wellbeing_data) -> List[Dict]:
-        """Correlate exercise with mood"""
-        # Implementation placeholder
-        return []
-
-    def _correlate_meetings_vs_focus(self, worklife_data, productivity_data) -> List[Dict]:
-        """Correlate meeting load with focus"""
-        # Implementation placeholder
-        return []
+        return [
+            self._daily_select("mood_scores", func.avg, MoodEntry.mood_score, MoodEntry.created_at, *mood_criteria),
+            self._daily_select("stress_levels", func.avg, MoodEntry.stress_level, MoodEntry.created_at, *mood_criteria),
+            self._daily_select("energy_levels", func.avg, MoodEntry.energy_level, MoodEntry.created_at, *mood_criteria)
+        ]
 
     def _analyze_savings_rate(self, cutoff_date) -> List[Dict]:
         return []
@@ -428,3 +670,32 @@ class IntelligenceEngine:
 
     def _predict_outcome(self, goal, progress_rate) -> Dict:
         return {}
+
+
+# Insight analyzers run concurrently by generate_insights, in reporting order
+_INSIGHT_ANALYZERS = (
+    # Financial
+    IntelligenceEngine._analyze_spending_patterns,
+    IntelligenceEngine._analyze_savings_rate,
+    # Health
+    IntelligenceEngine._analyze_nutrition_trends,
+    IntelligenceEngine._analyze_exercise_consistency,
+    IntelligenceEngine._analyze_sleep_quality,
+    # Work-life
+    IntelligenceEngine._analyze_work_hours,
+    IntelligenceEngine._analyze_boundary_violations,
+    # Productivity
+    IntelligenceEngine._analyze_task_completion,
+    IntelligenceEngine._analyze_focus_patterns,
+    IntelligenceEngine._analyze_distractions,
+    # Cross-pillar
+    IntelligenceEngine._analyze_overall_wellbeing,
+)
+
+# Per-pillar recommenders run concurrently by generate_recommendations
+_RECOMMENDERS = (
+    IntelligenceEngine._recommend_financial_actions,
+    IntelligenceEngine._recommend_health_actions,
+    IntelligenceEngine._recommend_worklife_actions,
+    IntelligenceEngine._recommend_productivity_actions,
+)
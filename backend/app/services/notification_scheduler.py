@@ -0,0 +1,163 @@
+"""
+Notification Scheduler
+Sends daily briefings and alert checks from scheduled sweeps, using APScheduler when installed.
+The same scheduler keeps monthly table partitions created ahead of time.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import or_, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.partitioning import PARTITIONED, ensure_monthly_partitions
+from app.models.user import User
+from app.models.preferences import UserPreferences
+from app.services.notification_service import NotificationService
+
+try:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+except ImportError:  # apscheduler is only needed to send notifications on a schedule
+    AsyncIOScheduler = None
+
+logger = logging.getLogger(__name__)
+
+# Alert checks run in their own sessions; stay well inside the connection pool
+_MAX_CONCURRENT_ALERT_CHECKS = 10
+_ALERT_SWEEP_MINUTES = 15
+
+_scheduler = None
+
+
+async def send_scheduled_briefings(now: Optional[datetime] = None) -> int:
+    """
+    Send the daily briefing to every active, opted-in user whose briefing time
+    (HH:MM, UTC) falls in the current hour. Returns the number of users swept.
+    """
+    now = now or datetime.utcnow()
+
+    async with AsyncSessionLocal() as db:
+        user_ids = (await db.scalars(
+            select(User.id)
+            .join(UserPreferences, UserPreferences.user_id == User.id)
+            .where(
+                User.is_active == True,
+                UserPreferences.daily_briefing_enabled == True,
+                UserPreferences.daily_briefing_time.startswith(f"{now:%H}:")
+            )
+        )).all()
+
+        service = NotificationService(db)
+        try:
+            await service.send_daily_briefings(user_ids)
+        finally:
+            await service.aclose()
+
+    logger.info(f"Sent daily briefings for {len(user_ids)} users")
+    return len(user_ids)
+
+
+async def _check_alerts_in_own_session(user_id: int):
+    """Run one user's alert check on a session of its own, so checks can overlap"""
+    async with AsyncSessionLocal() as db:
+        service = NotificationService(db)
+        try:
+            await service.check_and_send_alerts(user_id)
+        finally:
+            await service.aclose()
+
+
+async def check_all_alerts() -> int:
+    """
+    Check alerts for every active user who receives them, a bounded number at a time.
+    Returns the number of users swept.
+    """
+    async with AsyncSessionLocal() as db:
+        user_ids = (await db.scalars(
+            select(User.id)
+            .join(UserPreferences, UserPreferences.user_id == User.id)
+            .where(
+                User.is_active == True,
+                UserPreferences.enable_email_notifications == True,
+                or_(
+                    UserPreferences.alert_critical_enabled == True,
+                    UserPreferences.alert_high_enabled == True
+                )
+            )
+        )).all()
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ALERT_CHECKS)
+
+    async def check(user_id: int):
+        async with semaphore:
+            await _check_alerts_in_own_session(user_id)
+
+    results = await asyncio.gather(*(check(user_id) for user_id in user_ids), return_exceptions=True)
+    for user_id, result in zip(user_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Alert check for user {user_id} failed: {result}")
+
+    logger.info(f"Checked alerts for {len(user_ids)} users")
+    return len(user_ids)
+
+
+def start_notification_scheduler():
+    """Start the briefing, alert and partition jobs on the running event loop, if enabled and available"""
+    global _scheduler
+
+    if _scheduler is not None or not settings.NOTIFICATION_SCHEDULER_ENABLED:
+        return
+    if AsyncIOScheduler is None:
+        logger.info("apscheduler is not installed; notifications are only sent on request")
+        if PARTITIONED:
+            logger.warning(
+                "apscheduler is not installed; run ensure_monthly_partitions from a monthly cron "
+                "so new months don't land in the DEFAULT partitions"
+            )
+        return
+
+    # A sweep that overruns its slot is never run twice at once, and missed slots collapse into one run
+    _scheduler = AsyncIOScheduler(timezone="UTC")
+    _scheduler.add_job(
+        send_scheduled_briefings,
+        CronTrigger(minute=0, timezone="UTC"),
+        id="daily_briefings",
+        coalesce=True,
+        max_instances=1,
+        # A late run still selects by the current hour, so the grace must stay under an hour
+        misfire_grace_time=900,
+    )
+    _scheduler.add_job(
+        check_all_alerts,
+        IntervalTrigger(minutes=_ALERT_SWEEP_MINUTES),
+        id="alert_checks",
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=300,
+    )
+    if PARTITIONED:
+        # Startup covers three months ahead; topping up each month keeps long-running processes ahead
+        _scheduler.add_job(
+            asyncio.to_thread,
+            CronTrigger(day=1, hour=0, minute=5, timezone="UTC"),
+            args=[ensure_monthly_partitions],
+            id="monthly_partitions",
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=86400,
+        )
+    _scheduler.start()
+
+
+def stop_notification_scheduler():
+    """Stop the scheduled jobs, letting any in progress finish"""
+    global _scheduler
+
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
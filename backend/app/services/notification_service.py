@@ -4,24 +4,154 @@ Handles email notifications, push notifications, and scheduled briefings
 """
 
 import asyncio
-from datetime import datetime, time as dt_time
-from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-
+import logging
+import time
+from datetime import datetime, time as dt_time, timedelta
+from email.message import EmailMessage
+from typing import Awaitable, Dict, Any, List, Optional, Set, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, case, func, insert, lambda_stmt, select, update
+
+from app.core.config import settings
 from app.models.user import User
 from app.models.preferences import UserPreferences, NotificationLog
+from app.schemas.preferences import UserPreferencesResponse
 from app.models.financial import Transaction, Budget
 from app.models.health import Biometric, Exercise
 from app.models.wellbeing import MoodEntry, SleepEntry
 from app.models.productivity import Task
+from app.services.alert_cache import ALERT_REPEAT_HOURS, alert_fingerprint, remember_alert, was_alert_sent
+from app.services.preferences_cache import cache_preferences, get_cached_preferences
+
+try:
+    import aiosmtplib
+except ImportError:  # aiosmtplib is only needed to deliver email
+    aiosmtplib = None
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed to deliver push notifications
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+FCM_SEND_URL = "https://fcm.googleapis.com/fcm/send"
+
+# Deliveries in flight at once during a briefing fan-out
+_MAX_CONCURRENT_SENDS = 50
+
+# Buffered log rows are written once this many are pending or the oldest is this old
+_LOG_BATCH_SIZE = 500
+_LOG_FLUSH_SECONDS = 0.2
+
+# (title, message, extra_data) of the single alert a check sends per run
+_AlertDigest = Tuple[str, str, Dict[str, Any]]
+
+# Briefing summary lines, in the order they appear; sections missing from a briefing are left out
+_SECTION_FMT = {
+    "financial": "  Financial: {transactions} transactions, ${spent:.2f} spent",
+    "health": "  Health: {exercises} exercises, {total_minutes} minutes",
+    "sleep": "  Sleep: {hours} hours, quality {quality}/10",
+    "productivity": "  Productivity: {tasks_completed} tasks completed",
+}
 
 
 class NotificationService:
     """Service for handling notifications"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        # An AsyncSession runs one operation at a time; queries from concurrent sends take this lock
+        self._db_lock = asyncio.Lock()
+        # Log rows from deferred sends, written together by flush_notification_logs
+        self._pending_logs: List[Dict[str, Any]] = []
+        self._pending_since = 0.0
+        # Rows looked up while this service instance (one request or sweep) is alive
+        self._preferences: Dict[int, Optional[UserPreferencesResponse]] = {}
+        self._users: Dict[int, Optional[User]] = {}
+        # Delivery connections, opened on first use and shared by concurrent sends until aclose()
+        self._smtp = None
+        self._http = None
+        self._transport_lock = asyncio.Lock()
+        # Sends started by fire_notification, drained by aclose()
+        self._background_sends: Set[asyncio.Task] = set()
+
+    async def aclose(self):
+        """Finish fired notifications, write their logs, and close any delivery connections"""
+
+        # Failures are logged by _background_send_done as each fired send finishes
+        if self._background_sends:
+            await asyncio.gather(*self._background_sends, return_exceptions=True)
+        await self.flush_notification_logs()
+
+        if self._smtp is not None:
+            smtp, self._smtp = self._smtp, None
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException as e:
+                logger.warning(f"SMTP quit failed: {e}")
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.close()
+
+    # ==================== LOOKUPS ====================
+
+    async def _get_preferences(self, user_id: int) -> Optional[UserPreferencesResponse]:
+        """
+        Get a user's preferences from the shared preferences cache, querying on a miss.
+        Users without preferences are remembered for this service instance only.
+        """
+
+        if user_id not in self._preferences:
+            preferences = get_cached_preferences(user_id)
+            if preferences is None:
+                async with self._db_lock:
+                    row = (await self.db.scalars(lambda_stmt(
+                        lambda: select(UserPreferences).where(UserPreferences.user_id == user_id)
+                    ))).first()
+                preferences = cache_preferences(row) if row is not None else None
+            self._preferences[user_id] = preferences
+        return self._preferences[user_id]
+
+    async def _get_user(self, user_id: int) -> Optional[User]:
+        """Get a user, querying at most once per service instance"""
+
+        if user_id not in self._users:
+            async with self._db_lock:
+                if user_id not in self._users:
+                    self._users[user_id] = (await self.db.scalars(lambda_stmt(
+                        lambda: select(User).where(User.id == user_id)
+                    ))).first()
+        return self._users[user_id]
+
+    async def _prefetch_users(self, user_ids: List[int]):
+        """Load users and their preferences for a fan-out in one query"""
+
+        missing = {user_id for user_id in user_ids if user_id not in self._users}
+        if not missing:
+            return
+
+        async with self._db_lock:
+            rows = (await self.db.execute(
+                select(User, UserPreferences)
+                .outerjoin(UserPreferences, UserPreferences.user_id == User.id)
+                .where(User.id.in_(missing))
+            )).tuples().all()
+
+        for user, preferences in rows:
+            self._users[user.id] = user
+            self._preferences[user.id] = cache_preferences(preferences) if preferences is not None else None
+            missing.discard(user.id)
+
+        for user_id in missing:
+            self._users[user_id] = None
+            self._preferences[user_id] = None
+
+    def invalidate_user(self, user_id: int):
+        """Forget a user's memoized rows after they change mid-request"""
+
+        self._preferences.pop(user_id, None)
+        self._users.pop(user_id, None)
 
     # ==================== NOTIFICATION CREATION ====================
 
@@ -33,19 +163,26 @@ class NotificationService:
         title: str,
         message: str,
         delivery_method: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None
-    ) -> NotificationLog:
-        """Send a notification to a user"""
+        extra_data: Optional[Dict[str, Any]] = None,
+        defer: bool = False
+    ) -> Optional[NotificationLog]:
+        """
+        Send a notification to a user.
+        With defer=True the log row is buffered for flush_notification_logs and None is returned.
+        Notifications the user has turned off return None without a log row unless
+        LOG_SKIPPED_NOTIFICATIONS is set.
+        """
 
         # Get user preferences
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == user_id
-        ).first()
+        preferences = await self._get_preferences(user_id)
 
         # Check if notification type is enabled
         if not self._is_notification_enabled(preferences, notification_type, category):
+            if not settings.LOG_SKIPPED_NOTIFICATIONS:
+                return None
+
             # Log but don't send
-            return self._create_notification_log(
+            return await self._create_notification_log(
                 user_id=user_id,
                 notification_type=notification_type,
                 category=category,
@@ -53,7 +190,8 @@ class NotificationService:
                 message=message,
                 status="skipped",
                 delivery_method=delivery_method,
-                extra_data=extra_data
+                extra_data=extra_data,
+                defer=defer
             )
 
         # Send notification based on type
@@ -66,7 +204,7 @@ class NotificationService:
             pass
 
         # Log notification
-        return self._create_notification_log(
+        return await self._create_notification_log(
             user_id=user_id,
             notification_type=notification_type,
             category=category,
@@ -74,12 +212,31 @@ class NotificationService:
             message=message,
             status="sent",
             delivery_method=delivery_method,
-            extra_data=extra_data
+            extra_data=extra_data,
+            defer=defer
         )
 
+    def fire_notification(self, **kwargs) -> asyncio.Task:
+        """
+        Start a send_notification in the background for callers that don't need the result.
+        Its log row is buffered; aclose() waits for the send and writes the log.
+        """
+
+        task = asyncio.create_task(self.send_notification(**kwargs, defer=True))
+        self._background_sends.add(task)
+        task.add_done_callback(self._background_send_done)
+        return task
+
+    def _background_send_done(self, task: asyncio.Task):
+        """Forget a finished fired send, logging its failure"""
+
+        self._background_sends.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Notification send failed: {task.exception()}")
+
     def _is_notification_enabled(
         self,
-        preferences: Optional[UserPreferences],
+        preferences: Optional[UserPreferencesResponse],
         notification_type: str,
         category: str
     ) -> bool:
@@ -114,16 +271,25 @@ class NotificationService:
 
         # Get user email if not provided
         if not email_address:
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = await self._get_user(user_id)
             email_address = user.email if user else None
 
         if not email_address:
             return
 
-        # TODO: Implement actual email sending using SMTP
-        # For now, this is a placeholder
-        # In production, use aiosmtplib or a service like SendGrid, AWS SES
-        print(f"[EMAIL] To: {email_address}, Subject: {title}, Body: {message}")
+        if aiosmtplib is None or not settings.SMTP_HOST:
+            # Delivery is not configured; the notification is still logged
+            logger.debug(f"Email delivery not configured; not sent to {email_address}: {title}")
+            return
+
+        email = EmailMessage()
+        email["From"] = settings.SMTP_FROM
+        email["To"] = email_address
+        email["Subject"] = title
+        email.set_content(message)
+
+        smtp = await self._get_smtp()
+        await smtp.send_message(email)
 
     async def _send_push_notification(
         self,
@@ -134,11 +300,41 @@ class NotificationService:
     ):
         """Send push notification"""
 
-        # TODO: Implement actual push notification using FCM, APNs, or OneSignal
-        # For now, this is a placeholder
-        print(f"[PUSH] To User {user_id}, Title: {title}, Message: {message}")
+        if aiohttp is None or not settings.FCM_SERVER_KEY or not device_token:
+            # Delivery is not configured; the notification is still logged
+            logger.debug(f"Push delivery not configured; not sent to user {user_id}: {title}")
+            return
 
-    def _create_notification_log(
+        http = await self._get_http()
+        async with http.post(
+            FCM_SEND_URL,
+            json={"to": device_token, "notification": {"title": title, "body": message}},
+        ) as response:
+            response.raise_for_status()
+
+    async def _get_smtp(self):
+        """Get the shared SMTP connection, connecting and logging in on first use"""
+
+        async with self._transport_lock:
+            if self._smtp is None:
+                smtp = aiosmtplib.SMTP(hostname=settings.SMTP_HOST, port=settings.SMTP_PORT, start_tls=True)
+                await smtp.connect()
+                if settings.SMTP_USERNAME:
+                    await smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD or "")
+                self._smtp = smtp
+            return self._smtp
+
+    async def _get_http(self):
+        """Get the shared HTTP session for push delivery"""
+
+        async with self._transport_lock:
+            if self._http is None:
+                self._http = aiohttp.ClientSession(
+                    headers={"Authorization": f"key={settings.FCM_SERVER_KEY}"}
+                )
+            return self._http
+
+    async def _create_notification_log(
         self,
         user_id: int,
         notification_type: str,
@@ -147,34 +343,62 @@ class NotificationService:
         message: str,
         status: str,
         delivery_method: Optional[str] = None,
-        extra_data: Optional[Dict[str, Any]] = None
-    ) -> NotificationLog:
-        """Create a notification log entry"""
+        extra_data: Optional[Dict[str, Any]] = None,
+        defer: bool = False
+    ) -> Optional[NotificationLog]:
+        """Create a notification log entry, or buffer it when defer is set"""
 
-        log = NotificationLog(
-            user_id=user_id,
-            notification_type=notification_type,
-            category=category,
-            title=title,
-            message=message,
-            status=status,
-            delivery_method=delivery_method,
-            extra_data=extra_data
-        )
+        row = {
+            "user_id": user_id,
+            "notification_type": notification_type,
+            "category": category,
+            "title": title,
+            "message": message,
+            "status": status,
+            "delivery_method": delivery_method,
+            "extra_data": extra_data,
+        }
 
-        self.db.add(log)
-        self.db.commit()
-        self.db.refresh(log)
+        if defer:
+            if not self._pending_logs:
+                self._pending_since = time.monotonic()
+            self._pending_logs.append(row)
+
+            # Long fan-outs write their logs in batches rather than all at the end
+            if (
+                len(self._pending_logs) >= _LOG_BATCH_SIZE
+                or time.monotonic() - self._pending_since >= _LOG_FLUSH_SECONDS
+            ):
+                await self.flush_notification_logs()
+            return None
+
+        log = NotificationLog(**row)
+
+        async with self._db_lock:
+            self.db.add(log)
+            await self.db.commit()
+            await self.db.refresh(log)
 
         return log
 
+    async def flush_notification_logs(self) -> int:
+        """Write all buffered log rows in one executemany INSERT and commit; returns the row count"""
+
+        if not self._pending_logs:
+            return 0
+
+        rows, self._pending_logs = self._pending_logs, []
+        async with self._db_lock:
+            await self.db.execute(insert(NotificationLog), rows)
+            await self.db.commit()
+
+        return len(rows)
+
     # ==================== DAILY BRIEFING ====================
 
     async def generate_daily_briefing(self, user_id: int) -> Dict[str, Any]:
         """Generate daily briefing for user"""
 
-        from datetime import timedelta
-
         today = datetime.utcnow().date()
         yesterday = today - timedelta(days=1)
 
@@ -186,82 +410,118 @@ class NotificationService:
             "recommendations": []
         }
 
-        # Financial summary
-        transactions = self.db.query(Transaction).filter(
-            and_(
-                Transaction.user_id == user_id,
-                Transaction.date >= yesterday,
-                Transaction.date < today
-            )
-        ).all()
+        # Financial summary: count and total per transaction type, summed by the database
+        totals_by_type = (await self.db.execute(
+            select(
+                Transaction.transaction_type,
+                func.count(Transaction.id),
+                func.sum(Transaction.amount)
+            ).where(
+                and_(
+                    Transaction.user_id == user_id,
+                    Transaction.transaction_date >= yesterday,
+                    Transaction.transaction_date < today
+                )
+            ).group_by(Transaction.transaction_type)
+        )).all()
 
-        total_spent = sum(t.amount for t in transactions if t.transaction_type == "expense")
-        total_earned = sum(t.amount for t in transactions if t.transaction_type == "income")
+        transaction_count = sum(count for _, count, _ in totals_by_type)
+        total_spent = sum(total for kind, _, total in totals_by_type if kind == "expense")
+        total_earned = sum(total for kind, _, total in totals_by_type if kind == "income")
 
         briefing["summary"]["financial"] = {
-            "transactions": len(transactions),
+            "transactions": transaction_count,
             "spent": total_spent,
             "earned": total_earned
         }
 
-        # Health summary
-        exercises = self.db.query(Exercise).filter(
+        # Exercise, task and sleep figures as scalar subqueries of one SELECT
+        exercise_filter = and_(Exercise.user_id == user_id, Exercise.exercise_date >= yesterday)
+        last_sleep = select(SleepEntry.sleep_hours, SleepEntry.sleep_quality).where(
             and_(
-                Exercise.user_id == user_id,
-                Exercise.exercise_date >= yesterday
+                SleepEntry.user_id == user_id,
+                SleepEntry.created_at >= yesterday,
+                SleepEntry.created_at < today
             )
-        ).all()
+        ).order_by(SleepEntry.created_at.desc()).limit(1).subquery()
 
-        total_exercise = sum(e.duration_minutes for e in exercises)
+        exercise_count, total_exercise, tasks_completed, sleep_hours, sleep_quality = (await self.db.execute(select(
+            select(func.count(Exercise.id)).where(exercise_filter).scalar_subquery(),
+            select(func.coalesce(func.sum(Exercise.duration_minutes), 0)).where(exercise_filter).scalar_subquery(),
+            select(func.count(Task.id)).where(
+                and_(
+                    Task.user_id == user_id,
+                    Task.completed_at >= yesterday,
+                    Task.completed_at < today
+                )
+            ).scalar_subquery(),
+            select(last_sleep.c.sleep_hours).scalar_subquery(),
+            select(last_sleep.c.sleep_quality).scalar_subquery(),
+        ))).one()
 
+        # Health summary
         briefing["summary"]["health"] = {
-            "exercises": len(exercises),
+            "exercises": exercise_count,
             "total_minutes": total_exercise
         }
 
         # Sleep summary
-        sleep = self.db.query(SleepEntry).filter(
-            and_(
-                SleepEntry.user_id == user_id,
-                SleepEntry.date == yesterday
-            )
-        ).first()
-
-        if sleep:
+        if sleep_hours is not None:
             briefing["summary"]["sleep"] = {
-                "hours": sleep.hours_slept,
-                "quality": sleep.quality_rating
+                "hours": sleep_hours,
+                "quality": sleep_quality
             }
 
         # Productivity summary
-        tasks = self.db.query(Task).filter(
-            and_(
-                Task.user_id == user_id,
-                Task.completed_at >= yesterday,
-                Task.completed_at < today
-            )
-        ).all()
-
         briefing["summary"]["productivity"] = {
-            "tasks_completed": len(tasks)
+            "tasks_completed": tasks_completed
         }
 
         # Generate highlights
         if total_exercise > 60:
             briefing["highlights"].append("Great job! You exercised for over 60 minutes yesterday.")
 
-        if len(tasks) >= 5:
-            briefing["highlights"].append(f"Productive day! You completed {len(tasks)} tasks.")
+        if tasks_completed >= 5:
+            briefing["highlights"].append(f"Productive day! You completed {tasks_completed} tasks.")
 
-        if sleep and sleep.hours_slept >= 7:
+        if sleep_hours is not None and sleep_hours >= 7:
             briefing["highlights"].append("You got a good night's sleep!")
 
         return briefing
 
-    async def send_daily_briefing(self, user_id: int):
+    async def send_daily_briefing(self, user_id: int, defer: bool = False):
         """Generate and send daily briefing"""
 
-        briefing = await self.generate_daily_briefing(user_id)
+        await self._send_briefing(await self.generate_daily_briefing(user_id), defer)
+
+    async def send_daily_briefings(self, user_ids: List[int]):
+        """Send many users' daily briefings with their deliveries in flight together"""
+
+        await self._prefetch_users(user_ids)
+
+        # Briefings are built one after another on the shared session; only delivery overlaps
+        briefings = []
+        for user_id in user_ids:
+            try:
+                briefings.append(await self.generate_daily_briefing(user_id))
+            except Exception as e:
+                logger.warning(f"Daily briefing for user {user_id} failed: {e}")
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SENDS)
+
+        async def send(briefing: Dict[str, Any]):
+            async with semaphore:
+                await self._send_briefing(briefing, defer=True)
+
+        try:
+            await self._gather_sends([send(briefing) for briefing in briefings])
+        finally:
+            await self.flush_notification_logs()
+
+    async def _send_briefing(self, briefing: Dict[str, Any], defer: bool):
+        """Format and send a generated briefing"""
+
+        user_id = briefing["user_id"]
 
         # Format briefing message
         title = f"Daily Briefing - {briefing['date']}"
@@ -274,44 +534,24 @@ class NotificationService:
             category="briefing",
             title=title,
             message=message,
-            extra_data=briefing
+            extra_data=briefing,
+            defer=defer
         )
 
     def _format_briefing_message(self, briefing: Dict[str, Any]) -> str:
         """Format briefing data into readable message"""
 
+        summary = briefing["summary"]
         lines = [
             f"Daily Briefing for {briefing['date']}",
             "",
             "SUMMARY:",
+            *(fmt.format_map(summary[section]) for section, fmt in _SECTION_FMT.items() if section in summary),
         ]
 
-        # Financial
-        if "financial" in briefing["summary"]:
-            fin = briefing["summary"]["financial"]
-            lines.append(f"  Financial: {fin['transactions']} transactions, ${fin['spent']:.2f} spent")
-
-        # Health
-        if "health" in briefing["summary"]:
-            health = briefing["summary"]["health"]
-            lines.append(f"  Health: {health['exercises']} exercises, {health['total_minutes']} minutes")
-
-        # Sleep
-        if "sleep" in briefing["summary"]:
-            sleep = briefing["summary"]["sleep"]
-            lines.append(f"  Sleep: {sleep['hours']} hours, quality {sleep['quality']}/10")
-
-        # Productivity
-        if "productivity" in briefing["summary"]:
-            prod = briefing["summary"]["productivity"]
-            lines.append(f"  Productivity: {prod['tasks_completed']} tasks completed")
-
         # Highlights
         if briefing["highlights"]:
-            lines.append("")
-            lines.append("HIGHLIGHTS:")
-            for highlight in briefing["highlights"]:
-                lines.append(f"  ⭐ {highlight}")
+            lines += ["", "HIGHLIGHTS:", *(f"  ⭐ {highlight}" for highlight in briefing["highlights"])]
 
         return "\n".join(lines)
 
@@ -320,100 +560,172 @@ class NotificationService:
     async def check_and_send_alerts(self, user_id: int):
         """Check conditions and send alerts if needed"""
 
-        preferences = self.db.query(UserPreferences).filter(
-            UserPreferences.user_id == user_id
-        ).first()
+        preferences = await self._get_preferences(user_id)
 
         if not preferences:
             return
 
-        # Check budget alerts
-        await self._check_budget_alerts(user_id, preferences)
+        # One timestamp for the whole run, so every window ends at the same instant
+        now = datetime.utcnow()
+
+        # Each check yields at most one digest per run; skip those this process sent recently
+        digests = {
+            alert_fingerprint(title, message): (title, message, extra_data)
+            for title, message, extra_data in filter(None, (
+                # Check budget alerts
+                await self._check_budget_alerts(user_id, preferences, now),
+                # Check health alerts
+                await self._check_health_alerts(user_id, preferences, now),
+            ))
+        }
+        digests = {fp: digest for fp, digest in digests.items() if not was_alert_sent(user_id, fp)}
+        if not digests:
+            return
 
-        # Check health alerts
-        await self._check_health_alerts(user_id, preferences)
+        # Then skip those any process logged within the repeat window
+        for title, message in (await self.db.execute(
+            select(NotificationLog.title, NotificationLog.message).where(
+                NotificationLog.user_id == user_id,
+                NotificationLog.category == "alert",
+                NotificationLog.sent_at >= now - timedelta(hours=ALERT_REPEAT_HOURS)
+            )
+        )).tuples():
+            fingerprint = alert_fingerprint(title, message)
+            remember_alert(user_id, fingerprint)
+            digests.pop(fingerprint, None)
+
+        async def send(fingerprint: str, title: str, message: str, extra_data: Dict[str, Any]):
+            await self.send_notification(
+                user_id=user_id,
+                notification_type="email",
+                category="alert",
+                title=title,
+                message=message,
+                extra_data=extra_data,
+                defer=True
+            )
+            remember_alert(user_id, fingerprint)
 
-    async def _check_budget_alerts(self, user_id: int, preferences: UserPreferences):
-        """Check for budget overspending alerts"""
+        # Alert logs are buffered and written in one batch, including those sent before a failure
+        try:
+            await self._gather_sends([send(fp, *digest) for fp, digest in digests.items()])
+        finally:
+            await self.flush_notification_logs()
 
-        from datetime import timedelta
+    async def _gather_sends(self, sends: List[Awaitable[Any]]):
+        """Await sends concurrently; one failed delivery is logged without cancelling the rest"""
 
-        budgets = self.db.query(Budget).filter(
-            and_(
-                Budget.user_id == user_id,
-                Budget.is_active == True
-            )
-        ).all()
+        for result in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Notification send failed: {result}")
 
-        for budget in budgets:
-            # Calculate spending for budget period
-            if budget.period == "monthly":
-                period_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0)
-            else:
-                period_start = datetime.utcnow() - timedelta(days=7)
+    async def _check_budget_alerts(
+        self,
+        user_id: int,
+        preferences: UserPreferencesResponse,
+        now: datetime
+    ) -> Optional[_AlertDigest]:
+        """Check for budget overspending; returns one digest covering every budget over threshold"""
 
-            transactions = self.db.query(Transaction).filter(
+        budgets = (await self.db.scalars(
+            select(Budget).where(
                 and_(
-                    Transaction.user_id == user_id,
-                    Transaction.category == budget.category,
-                    Transaction.transaction_type == "expense",
-                    Transaction.date >= period_start
+                    Budget.user_id == user_id,
+                    Budget.is_active == True
                 )
-            ).all()
+            )
+        )).all()
+
+        if not budgets:
+            return None
+
+        # Spending periods: monthly budgets count from the 1st, all others over the last 7 days
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        week_start = now - timedelta(days=7)
+
+        # One pass over the user's expenses, summed per category for both periods
+        spent = {
+            category: (monthly, weekly)
+            for category, monthly, weekly in (await self.db.execute(
+                select(
+                    Transaction.category,
+                    func.sum(case((Transaction.transaction_date >= month_start, Transaction.amount), else_=0.0)),
+                    func.sum(case((Transaction.transaction_date >= week_start, Transaction.amount), else_=0.0)),
+                ).where(
+                    and_(
+                        Transaction.user_id == user_id,
+                        Transaction.category.in_({budget.category for budget in budgets}),
+                        Transaction.transaction_type == "expense",
+                        Transaction.transaction_date >= min(month_start, week_start)
+                    )
+                ).group_by(Transaction.category)
+            )).tuples()
+        }
 
-            total_spent = sum(t.amount for t in transactions)
+        lines = []
+        triggered = []
+        for budget in budgets:
+            monthly, weekly = spent.get(budget.category, (0.0, 0.0))
+            total_spent = monthly if budget.period == "monthly" else weekly
             percentage = (total_spent / budget.amount_limit) * 100 if budget.amount_limit > 0 else 0
 
             # Check if over threshold
             if percentage >= preferences.spending_alert_threshold:
-                await self.send_notification(
-                    user_id=user_id,
-                    notification_type="email",
-                    category="alert",
-                    title=f"Budget Alert: {budget.category}",
-                    message=f"You've spent {percentage:.1f}% of your {budget.category} budget (${total_spent:.2f} / ${budget.amount_limit:.2f})",
-                    extra_data={"budget_id": budget.id, "percentage": percentage}
-                )
+                lines.append(f"You've spent {percentage:.1f}% of your {budget.category} budget (${total_spent:.2f} / ${budget.amount_limit:.2f})")
+                triggered.append({"budget_id": budget.id, "percentage": percentage})
 
-    async def _check_health_alerts(self, user_id: int, preferences: UserPreferences):
-        """Check for health-related alerts"""
+        if not triggered:
+            return None
 
-        # Check recent biometrics for concerning values
-        from datetime import timedelta
+        return "Budget Alert", "\n".join(lines), {"budgets": triggered}
 
-        week_ago = datetime.utcnow() - timedelta(days=7)
+    async def _check_health_alerts(
+        self,
+        user_id: int,
+        preferences: UserPreferencesResponse,
+        now: datetime
+    ) -> Optional[_AlertDigest]:
+        """Check for health-related alerts; returns one digest of the distinct findings this week"""
 
-        biometrics = self.db.query(Biometric).filter(
-            and_(
-                Biometric.user_id == user_id,
-                Biometric.measurement_date >= week_ago
+        # Check recent biometrics for concerning values
+        week_ago = now - timedelta(days=7)
+
+        biometrics = (await self.db.scalars(
+            select(Biometric).where(
+                and_(
+                    Biometric.user_id == user_id,
+                    Biometric.measurement_date >= week_ago
+                )
             )
-        ).all()
+        )).all()
 
+        alerts = set()
+        sources = []
         for bio in biometrics:
-            alerts = []
+            flagged = False
 
             # Check blood pressure
             if bio.blood_pressure_systolic and bio.blood_pressure_systolic > 140:
-                alerts.append("High systolic blood pressure detected")
+                alerts.add("High systolic blood pressure detected")
+                flagged = True
 
             # Check heart rate
             if bio.heart_rate and (bio.heart_rate > 100 or bio.heart_rate < 60):
-                alerts.append("Unusual heart rate detected")
-
-            if alerts:
-                await self.send_notification(
-                    user_id=user_id,
-                    notification_type="email",
-                    category="alert",
-                    title="Health Alert",
-                    message="\n".join(alerts) + "\n\nConsider consulting with a healthcare professional.",
-                    extra_data={"biometric_id": bio.id}
-                )
+                alerts.add("Unusual heart rate detected")
+                flagged = True
+
+            if flagged:
+                sources.append(bio.id)
+
+        if not alerts:
+            return None
+
+        message = "\n".join(sorted(alerts)) + "\n\nConsider consulting with a healthcare professional."
+        return "Health Alert", message, {"biometric_ids": sources}
 
     # ==================== NOTIFICATION RETRIEVAL ====================
 
-    def get_notifications(
+    async def get_notifications(
         self,
         user_id: int,
         notification_type: Optional[str] = None,
@@ -422,29 +734,48 @@ class NotificationService:
     ) -> List[NotificationLog]:
         """Get user notifications"""
 
-        query = self.db.query(NotificationLog).filter(NotificationLog.user_id == user_id)
+        # Lambda statements are built and cached once per filter combination;
+        # later calls only re-extract the bound values
+        query = lambda_stmt(lambda: select(NotificationLog).where(NotificationLog.user_id == user_id))
 
         if notification_type:
-            query = query.filter(NotificationLog.notification_type == notification_type)
+            query += lambda q: q.where(NotificationLog.notification_type == notification_type)
 
         if category:
-            query = query.filter(NotificationLog.category == category)
+            query += lambda q: q.where(NotificationLog.category == category)
+
+        query += lambda q: q.order_by(NotificationLog.sent_at.desc()).limit(limit)
+
+        return (await self.db.scalars(query)).all()
+
+    async def mark_notifications_read(self, notification_ids: List[int], user_id: int) -> int:
+        """
+        Mark notifications as read in one UPDATE; returns how many changed.
+        Already-read notifications keep their read_at, so retries are harmless.
+        """
 
-        return query.order_by(NotificationLog.sent_at.desc()).limit(limit).all()
+        async with self._db_lock:
+            result = await self.db.execute(
+                update(NotificationLog)
+                .where(
+                    NotificationLog.user_id == user_id,
+                    NotificationLog.id.in_(notification_ids),
+                    NotificationLog.read_at.is_(None)
+                )
+                .values(read_at=datetime.utcnow(), status="read")
+            )
+            await self.db.commit()
 
-    def mark_notification_read(self, notification_id: int, user_id: int):
+        return result.rowcount
+
+    async def mark_notification_read(self, notification_id: int, user_id: int):
         """Mark notification as read"""
 
-        notification = self.db.query(NotificationLog).filter(
-            and_(
+        await self.mark_notifications_read([notification_id], user_id)
+
+        return (await self.db.scalars(lambda_stmt(
+            lambda: select(NotificationLog).where(
                 NotificationLog.id == notification_id,
                 NotificationLog.user_id == user_id
             )
-        ).first()
-
-        if notification:
-            notification.read_at = datetime.utcnow()
-            notification.status = "read"
-            self.db.commit()
-
-        return notification
+        ))).first()
@@ -0,0 +1,37 @@
+"""
+User Preferences Cache
+Per-process TTL cache of user preferences responses, keyed by user id
+"""
+
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.models.preferences import UserPreferences
+from app.schemas.preferences import UserPreferencesResponse
+
+
+# Preferences change rarely; a short TTL bounds staleness across worker processes
+_PREF_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_lock = threading.Lock()
+
+
+def get_cached_preferences(user_id: int) -> Optional[UserPreferencesResponse]:
+    """Get a user's cached preferences, or None on a miss"""
+    with _lock:
+        return _PREF_CACHE.get(user_id)
+
+
+def cache_preferences(preferences: UserPreferences) -> UserPreferencesResponse:
+    """Wrap a preferences row in the immutable response and cache it"""
+    response = UserPreferencesResponse.from_orm_trusted(preferences)
+    with _lock:
+        _PREF_CACHE[preferences.user_id] = response
+    return response
+
+
+def invalidate_preferences(user_id: int):
+    """Drop a user's cached preferences after they change"""
+    with _lock:
+        _PREF_CACHE.pop(user_id, None)